@@ -0,0 +1,116 @@
+from django.conf import settings
+from django.db import connection, transaction
+from django.utils import timezone
+
+from archives.models import ArchivedEvent, ArchivedPayment, ArchivedRegistration, ArchivedTicket
+from core.bulk import delete_queryset
+from events.models import Event
+from events.stats import forget_event_stats
+from payments.models import Payment, PaymentCallback
+from registrations.models import CheckIn, Registration, WaitlistEntry, WaitlistQueue
+from tickets.models import Ticket
+from tickets.sales import forget_sales_window
+
+ARCHIVED_MODELS = {
+    Event: ArchivedEvent,
+    Ticket: ArchivedTicket,
+    Registration: ArchivedRegistration,
+    Payment: ArchivedPayment,
+}
+
+
+def get_archived(model, pk):
+    """
+    Returns the archived copy of a `model` row, or None.
+    """
+    return ARCHIVED_MODELS[model].objects.filter(pk=pk).first()
+
+
+def filter_archived(model, pks):
+    """
+    Queryset of the archived copies of the `model` rows with these primary keys.
+    """
+    return ARCHIVED_MODELS[model].objects.filter(pk__in=pks)
+
+
+def _rows_of_events(event_ids, event_starts):
+    # Urutan: induk dulu. event_start diambil dari baris event yang dikunci, jadi Postgres
+    # hanya membaca partisi bulan event-event ini
+    return {
+        Event: Event.objects.filter(pk__in=event_ids),
+        Ticket: Ticket.objects.filter(event_id__in=event_ids),
+        Registration: Registration.objects.filter(event_start__in=event_starts, ticket_id__event_id__in=event_ids),
+        Payment: Payment.objects.filter(event_start__in=event_starts, registration_id__ticket_id__event_id__in=event_ids),
+    }
+
+
+def _discarded_with(model, pks):
+    # Baris yang tidak diarsipkan, cukup dibuang bersama induknya: callback gateway dan
+    # check-in hanya berguna selama event berjalan, antrian waitlist event selesai tidak dipakai lagi
+    if model is Payment:
+        return [PaymentCallback.objects.filter(payment_id__in=pks)]
+    if model is Registration:
+        return [CheckIn.objects.filter(registration_id__in=pks)]
+    if model is Ticket:
+        return [WaitlistEntry.objects.filter(ticket_id__in=pks), WaitlistQueue.objects.filter(ticket_id__in=pks)]
+    return [CheckIn.objects.filter(event_id__in=pks)]
+
+
+def _copy(cursor, model, queryset, archived_at):
+    qn = connection.ops.quote_name
+    # Hanya kolom yang ada di tabel arsip; penanda kerja seperti Event.deleted_at tidak ikut disalin
+    archived_fields = {field.attname for field in ARCHIVED_MODELS[model]._meta.concrete_fields}
+    fields = [field for field in model._meta.concrete_fields if field.attname in archived_fields]
+    columns = [field.column for field in fields]
+    select, params = queryset.values_list(*[field.attname for field in fields]).query.sql_with_params()
+    cursor.execute(
+        f'INSERT INTO {qn(ARCHIVED_MODELS[model]._meta.db_table)} ({", ".join(qn(column) for column in columns)}, '
+        f'{qn("archived_at")}) SELECT rows.*, %s FROM ({select}) AS rows',
+        [archived_at, *params],
+    )
+    return cursor.rowcount
+
+
+def _move_chunk(cursor, model, event_ids, chunk_size, archived_at):
+    with transaction.atomic():
+        # Kunci baris event agar tidak dijadwal ulang atau diubah selama chunk ini dipindahkan
+        event_starts = list(Event.objects.select_for_update().filter(pk__in=event_ids).values_list('start_time', flat=True))
+        pks = list(_rows_of_events(event_ids, event_starts)[model].order_by().values_list('pk', flat=True)[:chunk_size])
+        if not pks:
+            return 0
+        rows = model.objects.filter(pk__in=pks)
+        moved = _copy(cursor, model, rows, archived_at)
+        for queryset in _discarded_with(model, pks):
+            delete_queryset(queryset)
+        delete_queryset(rows)
+    return moved
+
+
+def archive_events(event_ids, chunk_size=None):
+    """
+    Moves the given events with their tickets, registrations and payments into the
+    archive tables, set-based (INSERT ... SELECT, then DELETE). Rows move children
+    first in chunks of at most `chunk_size` (ARCHIVE_CHUNK_SIZE), each copied and
+    deleted in its own transaction, so locks are held for one chunk whatever the
+    size of the events. An interrupted run leaves the remaining rows live; calling
+    this again carries on with them.
+
+    Returns the number of rows moved per model name.
+    """
+    chunk_size = chunk_size or settings.ARCHIVE_CHUNK_SIZE
+    archived_at = timezone.now()
+    ticket_ids = list(Ticket.objects.filter(event_id__in=event_ids).values_list('pk', flat=True))
+    moved = {}
+    with connection.cursor() as cursor:
+        for model in reversed(ARCHIVED_MODELS):
+            moved[model.__name__] = 0
+            while True:
+                count = _move_chunk(cursor, model, event_ids, chunk_size, archived_at)
+                moved[model.__name__] += count
+                if count < chunk_size:
+                    break
+
+    forget_event_stats(event_ids)
+    for ticket_id in ticket_ids:
+        forget_sales_window(ticket_id)
+    return moved
@@ -0,0 +1,52 @@
+import time
+from collections import Counter
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.utils import timezone
+
+from archives.archiver import archive_events
+from events.models import Event
+
+
+class Command(BaseCommand):
+    help = (
+        'Moves ended events with their tickets, registrations and payments into the archive tables, '
+        'a few events at a time and at most ARCHIVE_CHUNK_SIZE rows per transaction so locks stay short. '
+        'An interrupted run is picked up by the next one.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--older-than', type=int, default=30, help='Days since the event ended.')
+        parser.add_argument('--batch-size', type=int, default=20, help='Events moved together.')
+        parser.add_argument('--chunk-size', type=int, default=None, help='Rows per transaction (default ARCHIVE_CHUNK_SIZE).')
+        parser.add_argument('--sleep', type=float, default=0, help='Seconds to pause between batches.')
+        parser.add_argument('--limit', type=int, default=None, help='Stop after this many events.')
+
+    def handle(self, *args, **options):
+        cutoff = timezone.now() - timedelta(days=options['older_than'])
+        totals = Counter()
+        while options['limit'] is None or totals['Event'] < options['limit']:
+            batch_size = options['batch_size']
+            if options['limit'] is not None:
+                batch_size = min(batch_size, options['limit'] - totals['Event'])
+            with transaction.atomic():
+                # skip_locked: event yang sedang diubah dilewati dan diambil pada jalan berikutnya
+                event_ids = list(
+                    Event.objects.select_for_update(skip_locked=True)
+                    .filter(end_time__lt=cutoff, deleted_at__isnull=True)
+                    .order_by('end_time')
+                    .values_list('pk', flat=True)[:batch_size]
+                )
+            if not event_ids:
+                break
+            moved = archive_events(event_ids, options['chunk_size'])
+            totals.update(moved)
+            self.stdout.write(', '.join(f'{count} {name}' for name, count in moved.items()))
+            if options['sleep']:
+                time.sleep(options['sleep'])
+        self.stdout.write(self.style.SUCCESS(
+            f'Archived {totals["Event"]} events, {totals["Ticket"]} tickets, '
+            f'{totals["Registration"]} registrations and {totals["Payment"]} payments.'
+        ))
@@ -0,0 +1,68 @@
+# Generated by Django 4.2 on 2026-10-19 14:32
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ArchivedEvent',
+            fields=[
+                ('id', models.UUIDField(editable=False, primary_key=True, serialize=False)),
+                ('name', models.CharField(max_length=100)),
+                ('description', models.TextField(blank=True)),
+                ('location', models.CharField(max_length=100)),
+                ('start_time', models.DateTimeField(blank=True)),
+                ('end_time', models.DateTimeField(blank=True)),
+                ('status', models.CharField(max_length=25)),
+                ('quota', models.PositiveIntegerField(default=0)),
+                ('category', models.CharField(max_length=100)),
+                ('archived_at', models.DateTimeField()),
+                ('organizer_id', models.ForeignKey(db_constraint=False, on_delete=django.db.models.deletion.DO_NOTHING, related_name='+', to=settings.AUTH_USER_MODEL)),
+            ],
+        ),
+        migrations.CreateModel(
+            name='ArchivedTicket',
+            fields=[
+                ('id', models.UUIDField(editable=False, primary_key=True, serialize=False)),
+                ('name', models.CharField(max_length=100)),
+                ('price', models.PositiveIntegerField(default=0)),
+                ('sales_start', models.DateTimeField(blank=True)),
+                ('sales_end', models.DateTimeField(blank=True)),
+                ('quota', models.PositiveIntegerField(default=0)),
+                ('archived_at', models.DateTimeField()),
+                ('event_id', models.ForeignKey(db_constraint=False, on_delete=django.db.models.deletion.DO_NOTHING, to='archives.archivedevent')),
+            ],
+        ),
+        migrations.CreateModel(
+            name='ArchivedRegistration',
+            fields=[
+                ('id', models.UUIDField(editable=False, primary_key=True, serialize=False)),
+                ('event_start', models.DateTimeField(editable=False)),
+                ('archived_at', models.DateTimeField()),
+                ('ticket_id', models.ForeignKey(db_constraint=False, on_delete=django.db.models.deletion.DO_NOTHING, to='archives.archivedticket')),
+                ('user_id', models.ForeignKey(db_constraint=False, on_delete=django.db.models.deletion.DO_NOTHING, related_name='+', to=settings.AUTH_USER_MODEL)),
+            ],
+        ),
+        migrations.CreateModel(
+            name='ArchivedPayment',
+            fields=[
+                ('id', models.UUIDField(editable=False, primary_key=True, serialize=False)),
+                ('payment_method', models.CharField(max_length=50)),
+                ('payment_status', models.CharField(max_length=50)),
+                ('amount_paid', models.PositiveIntegerField(default=0)),
+                ('event_start', models.DateTimeField(editable=False)),
+                ('archived_at', models.DateTimeField()),
+                ('registration_id', models.ForeignKey(db_constraint=False, on_delete=django.db.models.deletion.DO_NOTHING, to='archives.archivedregistration')),
+            ],
+        ),
+    ]
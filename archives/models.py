@@ -0,0 +1,47 @@
+from django.db import models
+
+from core.models import User
+
+# Salinan dingin dari tabel event, tiket, registrasi dan pembayaran. Nama field sama dengan
+# model aslinya supaya serializer yang sama bisa dipakai untuk membacanya. Relasi tidak
+# memakai constraint di database: baris dipindah per batch dan user boleh dihapus kemudian.
+class ArchivedEvent(models.Model):
+    id = models.UUIDField(primary_key=True, editable=False)
+    name = models.CharField(max_length=100)
+    description = models.TextField(blank=True)
+    location = models.CharField(max_length=100)
+    start_time = models.DateTimeField(blank=True)
+    end_time = models.DateTimeField(blank=True)
+    status = models.CharField(max_length=25)
+    quota = models.PositiveIntegerField(default=0)
+    category = models.CharField(max_length=100)
+    organizer_id = models.ForeignKey(
+        User, on_delete=models.DO_NOTHING, db_constraint=False, related_name='+'
+    )
+    archived_at = models.DateTimeField()
+
+class ArchivedTicket(models.Model):
+    id = models.UUIDField(primary_key=True, editable=False)
+    name = models.CharField(max_length=100)
+    price = models.PositiveIntegerField(default=0)
+    sales_start = models.DateTimeField(blank=True)
+    sales_end = models.DateTimeField(blank=True)
+    quota = models.PositiveIntegerField(default=0)
+    event_id = models.ForeignKey(ArchivedEvent, on_delete=models.DO_NOTHING, db_constraint=False)
+    archived_at = models.DateTimeField()
+
+class ArchivedRegistration(models.Model):
+    id = models.UUIDField(primary_key=True, editable=False)
+    ticket_id = models.ForeignKey(ArchivedTicket, on_delete=models.DO_NOTHING, db_constraint=False)
+    user_id = models.ForeignKey(User, on_delete=models.DO_NOTHING, db_constraint=False, related_name='+')
+    event_start = models.DateTimeField(editable=False)
+    archived_at = models.DateTimeField()
+
+class ArchivedPayment(models.Model):
+    id = models.UUIDField(primary_key=True, editable=False)
+    payment_method = models.CharField(max_length=50)
+    payment_status = models.CharField(max_length=50)
+    amount_paid = models.PositiveIntegerField(default=0)
+    registration_id = models.ForeignKey(ArchivedRegistration, on_delete=models.DO_NOTHING, db_constraint=False)
+    event_start = models.DateTimeField(editable=False)
+    archived_at = models.DateTimeField()
@@ -0,0 +1,79 @@
+from datetime import timedelta
+
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from archives.archiver import archive_events
+from archives.models import ArchivedEvent, ArchivedPayment, ArchivedRegistration, ArchivedTicket
+from core.models import User
+from events.models import Event
+from payments.models import Payment
+from registrations.models import CheckIn, Registration, WaitlistEntry
+from registrations.waitlist import enqueue
+from tickets.models import Ticket
+
+
+@override_settings(ALLOWED_HOSTS=['*'])
+class ArchiveEventsTest(TestCase):
+    def setUp(self):
+        ended = timezone.now() - timedelta(days=30)
+        self.organizer = User.objects.create(username='organizer')
+        self.event, self.other = (
+            Event.objects.create(
+                name=name, location='Jakarta', start_time=ended, end_time=ended + timedelta(hours=2),
+                status=Event.STATUS_FINISHED, category='music', organizer_id=self.organizer,
+            )
+            for name in ('Event', 'Other')
+        )
+        for event in (self.event, self.other):
+            ticket = Ticket.objects.create(name='Ticket', price=50000, sales_start=ended, sales_end=ended, quota=1, event_id=event)
+            registration = Registration.objects.create(ticket_id=ticket, user_id=self.organizer)
+            Payment.objects.create(
+                registration_id=registration, payment_method='QRIS', payment_status='Completed', amount_paid=50000,
+            )
+            CheckIn.objects.create(registration_id=registration, event_id=event, scanned_at=ended)
+            enqueue(ticket, User.objects.create(username=f'waiting {event.name}'))
+
+    def test_copies_rows_then_deletes_them(self):
+        payment = Payment.objects.get(registration_id__ticket_id__event_id=self.event)
+        moved = archive_events([self.event.pk])
+
+        self.assertEqual(moved, {'Event': 1, 'Ticket': 1, 'Registration': 1, 'Payment': 1})
+        self.assertFalse(Event.objects.filter(pk=self.event.pk).exists())
+        for model in (Ticket, Registration, Payment, CheckIn, WaitlistEntry):
+            self.assertEqual(model.objects.count(), 1, model.__name__)
+
+        archived = ArchivedPayment.objects.get(pk=payment.pk)
+        self.assertEqual(
+            (archived.payment_status, archived.amount_paid, archived.registration_id_id, archived.event_start),
+            (payment.payment_status, payment.amount_paid, payment.registration_id_id, payment.event_start),
+        )
+        self.assertEqual(ArchivedRegistration.objects.get().ticket_id.event_id.pk, self.event.pk)
+        self.assertEqual(ArchivedTicket.objects.count(), 1)
+        self.assertEqual(ArchivedEvent.objects.get().name, 'Event')
+
+        # Event yang diarsipkan masih bisa dibaca, tapi tidak bisa diubah
+        client = APIClient()
+        client.force_authenticate(User.objects.create(username='admin', is_superuser=True))
+        self.assertEqual(client.get(f'/api/events/{self.event.pk}/').data['name'], 'Event')
+        self.assertEqual(client.delete(f'/api/events/{self.event.pk}/').status_code, 404)
+
+    def test_moves_rows_in_chunks_of_their_own_transaction(self):
+        ticket = Ticket.objects.get(event_id=self.event)
+        for i in range(2):
+            registration = Registration.objects.create(ticket_id=ticket, user_id=User.objects.create(username=f'buyer {i}'))
+            Payment.objects.create(
+                registration_id=registration, payment_method='QRIS', payment_status='Completed', amount_paid=50000,
+            )
+        with CaptureQueriesContext(connection) as queries:
+            moved = archive_events([self.event.pk], chunk_size=2)
+
+        self.assertEqual(moved, {'Payment': 3, 'Registration': 3, 'Ticket': 1, 'Event': 1})
+        # Pembayaran 2 + 1, registrasi 2 + 1, tiket 1, event 1: satu transaksi per chunk
+        transactions = [query['sql'] for query in queries.captured_queries if query['sql'].startswith('SAVEPOINT')]
+        self.assertEqual(len(transactions), 6)
+        self.assertFalse(Registration.objects.filter(ticket_id=ticket).exists())
+        self.assertEqual(ArchivedRegistration.objects.count(), 3)
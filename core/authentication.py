@@ -0,0 +1,76 @@
+from django.conf import settings
+from django.core.cache import cache
+from django.utils.translation import gettext_lazy as _
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.utils import get_md5_hash_password
+
+from core.models import User
+
+
+# Kolom user yang disimpan di cache; kolom lain (termasuk hash password) dimuat bila diakses
+CACHED_FIELDS = ('id', 'username', 'is_active', 'is_staff', 'is_superuser')
+
+
+def _user_cache_key(user_id):
+    return f'auth-user:{user_id}'
+
+
+def get_cached_user(user_id):
+    """
+    Returns the user with the given id, or None. Only what authentication needs is
+    cached: CACHED_FIELDS, the names of its groups (`role_names`) and the digest of
+    its password hash that revokes tokens (`password_digest`), never the hash
+    itself. Authenticating a request and checking its role permissions usually
+    costs no query at all; other fields load on first access.
+
+    The cache is cleared by signals (core.signals) and by User.objects.update();
+    raw SQL changes to users stay visible for up to AUTH_USER_CACHE_TTL seconds.
+    """
+    key = _user_cache_key(user_id)
+    cached = cache.get(key)
+    if cached is None:
+        row = User.objects.filter(pk=user_id).values(*CACHED_FIELDS, 'password').first()
+        if row is None:
+            return None
+        cached = {
+            **{name: row[name] for name in CACHED_FIELDS},
+            'role_names': frozenset(User.groups.through.objects.filter(user_id=user_id).values_list('group__name', flat=True)),
+            'password_digest': get_md5_hash_password(row['password']),
+        }
+        cache.set(key, cached, settings.AUTH_USER_CACHE_TTL)
+    # from_db() mengharapkan nilai dalam urutan kolom model
+    names = [field.attname for field in User._meta.concrete_fields if field.attname in CACHED_FIELDS]
+    user = User.from_db(None, names, [cached[name] for name in names])
+    user.role_names = cached['role_names']
+    user.password_digest = cached['password_digest']
+    return user
+
+
+def forget_cached_users(user_ids):
+    cache.delete_many([_user_cache_key(user_id) for user_id in user_ids])
+
+
+class CachedJWTAuthentication(JWTAuthentication):
+    """
+    JWTAuthentication that resolves the token's user through `get_cached_user`.
+    """
+    def get_user(self, validated_token):
+        try:
+            user_id = validated_token[api_settings.USER_ID_CLAIM]
+        except KeyError:
+            raise InvalidToken(_('Token contained no recognizable user identification'))
+
+        user = get_cached_user(user_id)
+        if user is None:
+            raise AuthenticationFailed(_('User not found'), code='user_not_found')
+
+        if api_settings.CHECK_USER_IS_ACTIVE and not user.is_active:
+            raise AuthenticationFailed(_('User is inactive'), code='user_inactive')
+
+        if api_settings.CHECK_REVOKE_TOKEN:
+            if validated_token.get(api_settings.REVOKE_TOKEN_CLAIM) != user.password_digest:
+                raise AuthenticationFailed(_("The user's password has been changed."), code='password_changed')
+
+        return user
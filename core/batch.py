@@ -0,0 +1,45 @@
+from rest_framework import status
+from rest_framework.response import Response
+
+from archives.archiver import filter_archived
+from core.fieldsets import get_fieldset, narrow_queryset
+from core.serializers import BatchIdsSerializer
+
+
+def batch_response(view, request, queryset, serializer_class, key):
+    """
+    Multi-get behind the `batch/` endpoints: the ids come from `?ids=a,b,c` (GET)
+    or `{"ids": [...]}` (POST). The rows of `queryset` are loaded with one `IN`
+    query, narrowed to the serializer's fields and joined with select_related(); archived rows
+    fill in the remaining ids with one more query. Results keep the order of the
+    request (repeated ids are returned once), unknown ids are listed under
+    `missing`. The view's permissions are built once and checked for every row.
+    """
+    if request.method == 'GET':
+        data = {'ids': [pk for pk in request.query_params.get('ids', '').split(',') if pk]}
+    else:
+        data = request.data
+    ids = BatchIdsSerializer(data=data)
+    if not ids.is_valid():
+        return Response(ids.errors, status=status.HTTP_400_BAD_REQUEST)
+    pks = list(dict.fromkeys(ids.validated_data['ids']))
+
+    fieldset = get_fieldset(request)
+    child = serializer_class(**fieldset)
+    model = queryset.model
+    found = {obj.pk: obj for obj in narrow_queryset(queryset.filter(pk__in=pks), child)}
+    if len(found) < len(pks):
+        # Data yang sudah diarsipkan tetap bisa dibaca (read-only), seperti di endpoint detail
+        archived = filter_archived(model, [pk for pk in pks if pk not in found])
+        found.update((obj.pk, obj) for obj in narrow_queryset(archived, child))
+
+    permissions = view.get_permissions()
+    for obj in found.values():
+        for permission in permissions:
+            if not permission.has_object_permission(request, view, obj):
+                view.permission_denied(
+                    request, message=getattr(permission, 'message', None), code=getattr(permission, 'code', None)
+                )
+
+    serializer = serializer_class([found[pk] for pk in pks if pk in found], many=True, **fieldset)
+    return Response({key: serializer.data, 'missing': [pk for pk in pks if pk not in found]})
@@ -0,0 +1,69 @@
+from django.db import connection, models, transaction
+
+
+def delete_queryset(queryset):
+    """
+    Deletes the rows of `queryset` with a single `DELETE ... WHERE pk IN (SELECT ...)`.
+    No rows are loaded into Python, no signals are sent and on_delete is not applied.
+    Returns the number of rows deleted.
+    """
+    qn = connection.ops.quote_name
+    model = queryset.model
+    select, params = queryset.values('pk').query.sql_with_params()
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f'DELETE FROM {qn(model._meta.db_table)} WHERE {qn(model._meta.pk.column)} IN ({select})',
+            params,
+        )
+        return cursor.rowcount
+
+
+def delete_in_chunks(queryset, chunk_size, on_chunk=None):
+    """
+    Repeats `delete_queryset` on at most `chunk_size` rows per transaction until
+    nothing matches, so locks are held briefly whatever the size of `queryset`.
+    """
+    total = 0
+    while True:
+        with transaction.atomic():
+            deleted = delete_queryset(queryset.order_by()[:chunk_size])
+        if not deleted:
+            return total
+        total += deleted
+        if on_chunk:
+            on_chunk(queryset.model, deleted)
+
+
+def cascade_delete(queryset, chunk_size, on_chunk=None, _path=()):
+    """
+    Deletes `queryset` and everything that references it, honouring on_delete like
+    Model.delete() does (CASCADE, SET_NULL, DO_NOTHING, PROTECT), but with chunked
+    set-based statements instead of collecting every dependent row in memory.
+    Signals are not sent; callers must clear whatever caches depend on them.
+    """
+    model = queryset.model
+    if model in _path:
+        raise ValueError(f'Cannot cascade through the cycle {" -> ".join(m.__name__ for m in (*_path, model))}.')
+    for relation in model._meta.related_objects:
+        if not (relation.one_to_many or relation.one_to_one):
+            continue
+        related = relation.related_model._base_manager.filter(**{f'{relation.field.name}__in': queryset})
+        if relation.on_delete is models.CASCADE:
+            cascade_delete(related, chunk_size, on_chunk, (*_path, model))
+        elif relation.on_delete is models.SET_NULL:
+            while True:
+                with transaction.atomic():
+                    chunk = related.order_by().values('pk')[:chunk_size]
+                    updated = relation.related_model._base_manager.filter(pk__in=chunk).update(
+                        **{relation.field.name: None}
+                    )
+                if not updated:
+                    break
+        elif relation.on_delete in (models.PROTECT, models.RESTRICT):
+            if related.exists():
+                raise models.ProtectedError(
+                    f'Cannot delete {model.__name__} rows referenced through {relation.field}.', related
+                )
+        elif relation.on_delete is not models.DO_NOTHING:
+            raise ValueError(f'on_delete of {relation.field} is not supported by cascade_delete.')
+    return delete_in_chunks(queryset, chunk_size, on_chunk)
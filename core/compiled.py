@@ -0,0 +1,137 @@
+from django.core.exceptions import FieldDoesNotExist
+from rest_framework import fields, relations, serializers
+
+# Fields whose get_attribute() is a plain attribute lookup, so the value can be read
+# straight from a `.values_list()` row and passed to to_representation() unchanged.
+VALUE_FIELDS = (
+    fields.BooleanField, fields.CharField, fields.ChoiceField, fields.DateField, fields.DateTimeField,
+    fields.DecimalField, fields.EmailField, fields.FloatField, fields.IntegerField, fields.ReadOnlyField,
+    fields.SlugField, fields.URLField, fields.UUIDField,
+)
+
+
+class NotCompilable(Exception):
+    pass
+
+
+class CompiledSerializer:
+    """
+    Read-only fast path for a ModelSerializer: the rows come from a single
+    `.values_list()` query and a generated function turns each tuple into the dict
+    `serializer.to_representation()` would have produced for the model instance.
+    """
+    def __init__(self, lookups, value_fields, method_fields, row_attrs, convert):
+        self.lookups = lookups
+        self.value_fields = value_fields
+        self.method_fields = method_fields
+        self.row_attrs = row_attrs
+        self.convert = convert
+        self.row_class = type('Row', (), {'__slots__': ('pk',) + tuple(name for name, _ in row_attrs)})
+
+    def __call__(self, queryset, serializer):
+        rows = queryset.values_list(*self.lookups)
+        value_reprs = [serializer.fields[name].to_representation for name in self.value_fields]
+        methods = [getattr(serializer, serializer.fields[name].method_name) for name in self.method_fields]
+        return self.convert(rows, value_reprs, methods, self._make_row)
+
+    def _make_row(self, values):
+        row = self.row_class()
+        row.pk = values[0]
+        for name, index in self.row_attrs:
+            setattr(row, name, values[index])
+        return row
+
+
+_compiled = {}
+
+
+def _resolve(model, source_attrs, pk_only):
+    """
+    Maps a dotted field source to an ORM lookup, or raises NotCompilable when DRF
+    would behave differently on an instance (nullable hops, reverse relations...).
+    """
+    current = model
+    for position, attr in enumerate(source_attrs):
+        try:
+            model_field = current._meta.get_field(attr)
+        except FieldDoesNotExist:
+            raise NotCompilable(attr)
+        last = position == len(source_attrs) - 1
+        if not model_field.concrete:
+            raise NotCompilable(attr)
+        if last:
+            if pk_only != bool(model_field.many_to_one or model_field.one_to_one):
+                raise NotCompilable(attr)
+            return '__'.join(source_attrs), model_field
+        if not model_field.is_relation or model_field.null:
+            raise NotCompilable(attr)
+        current = model_field.related_model
+
+
+def compile_serializer(serializer):
+    """
+    Returns the CompiledSerializer for `serializer`'s current (possibly sparse) fields,
+    building it once per serializer class and field set.
+    """
+    key = (type(serializer), tuple(serializer.fields))
+    if key not in _compiled:
+        try:
+            _compiled[key] = _build(serializer)
+        except NotCompilable:
+            _compiled[key] = None
+    if _compiled[key] is None:
+        raise NotCompilable(type(serializer).__name__)
+    return _compiled[key]
+
+
+def _build(serializer):
+    if type(serializer).to_representation is not serializers.Serializer.to_representation:
+        raise NotCompilable('to_representation')
+    model = serializer.Meta.model
+    lookups = ['pk']
+    row_attrs = [(model._meta.pk.attname, 0)]
+    value_fields = []
+    method_fields = []
+    entries = []
+
+    def lookup_index(lookup):
+        if lookup == model._meta.pk.name:
+            lookup = 'pk'
+        if lookup not in lookups:
+            lookups.append(lookup)
+        return lookups.index(lookup)
+
+    for field in serializer._readable_fields:
+        if type(field) is serializers.SerializerMethodField:
+            entries.append(f'{field.field_name!r}: m[{len(method_fields)}](obj)')
+            method_fields.append(field.field_name)
+            continue
+        if type(field) is relations.PrimaryKeyRelatedField and field.pk_field is None:
+            lookup, _ = _resolve(model, field.source_attrs, pk_only=True)
+            index = lookup_index(lookup)
+            entries.append(f'{field.field_name!r}: row[{index}]')
+            continue
+        if type(field) not in VALUE_FIELDS or field.source == '*':
+            raise NotCompilable(field.field_name)
+        lookup, model_field = _resolve(model, field.source_attrs, pk_only=False)
+        index = lookup_index(lookup)
+        if len(field.source_attrs) == 1 and (model_field.attname, index) not in row_attrs:
+            row_attrs.append((model_field.attname, index))
+        entries.append(
+            f'{field.field_name!r}: None if row[{index}] is None else f[{len(value_fields)}](row[{index}])'
+        )
+        value_fields.append(field.field_name)
+
+    make_obj = '        obj = make_row(row)\n' if method_fields else ''
+    source = (
+        'def convert(rows, f, m, make_row):\n'
+        '    out = []\n'
+        '    append = out.append\n'
+        '    for row in rows:\n'
+        f'{make_obj}'
+        f'        append({{{", ".join(entries)}}})\n'
+        '    return out\n'
+    )
+    namespace = {}
+    exec(compile(source, f'<compiled {type(serializer).__name__}>', 'exec'), namespace)
+    return CompiledSerializer(lookups, value_fields, method_fields, row_attrs, namespace['convert'])
@@ -0,0 +1,120 @@
+import zlib
+
+from django.conf import settings
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+# Level untuk respons dinamis: rasio mendekati level maksimum dengan biaya CPU jauh lebih kecil
+GZIP_LEVEL = 6
+BROTLI_QUALITY = 5
+ZSTD_LEVEL = 3
+
+
+class GzipCodec:
+    name = 'gzip'
+
+    def compress(self, data):
+        compressor = zlib.compressobj(GZIP_LEVEL, zlib.DEFLATED, 31)
+        return compressor.compress(data) + compressor.flush()
+
+    def stream(self, chunks):
+        compressor = zlib.compressobj(GZIP_LEVEL, zlib.DEFLATED, 31)
+        for chunk in chunks:
+            # Z_SYNC_FLUSH: klien sudah bisa mendekode setiap potongan yang dikirim
+            data = compressor.compress(chunk) + compressor.flush(zlib.Z_SYNC_FLUSH)
+            if data:
+                yield data
+        yield compressor.flush()
+
+    def decompress(self, data):
+        return zlib.decompress(data, 47)
+
+
+class BrotliCodec:
+    name = 'br'
+
+    def compress(self, data):
+        return brotli.compress(data, quality=BROTLI_QUALITY)
+
+    def stream(self, chunks):
+        compressor = brotli.Compressor(quality=BROTLI_QUALITY)
+        for chunk in chunks:
+            data = compressor.process(chunk) + compressor.flush()
+            if data:
+                yield data
+        yield compressor.finish()
+
+    def decompress(self, data):
+        return brotli.decompress(data)
+
+
+class ZstdCodec:
+    name = 'zstd'
+
+    def compress(self, data):
+        return zstandard.ZstdCompressor(level=ZSTD_LEVEL).compress(data)
+
+    def stream(self, chunks):
+        compressor = zstandard.ZstdCompressor(level=ZSTD_LEVEL).compressobj()
+        for chunk in chunks:
+            data = compressor.compress(chunk) + compressor.flush(zstandard.COMPRESSOBJ_FLUSH_BLOCK)
+            if data:
+                yield data
+        yield compressor.flush()
+
+    def decompress(self, data):
+        # Frame dari stream() tidak mencantumkan ukuran isi, jadi pakai decompressobj
+        return zstandard.ZstdDecompressor().decompressobj().decompress(data)
+
+
+def available_codecs():
+    """
+    Installed codecs in the server's order of preference (RESPONSE_COMPRESSION_ENCODINGS).
+    gzip is always available; 'br' needs brotli and 'zstd' needs zstandard installed.
+    """
+    installed = {'gzip': GzipCodec()}
+    if brotli is not None:
+        installed['br'] = BrotliCodec()
+    if zstandard is not None:
+        installed['zstd'] = ZstdCodec()
+    return [installed[name] for name in settings.RESPONSE_COMPRESSION_ENCODINGS if name in installed]
+
+
+def parse_accept_encoding(header):
+    """
+    `gzip, br;q=0.8, *;q=0` -> {'gzip': 1.0, 'br': 0.8, '*': 0.0}.
+    """
+    accepted = {}
+    for part in header.split(','):
+        name, *params = [piece.strip() for piece in part.split(';')]
+        if not name:
+            continue
+        quality = 1.0
+        for param in params:
+            key, _, value = param.partition('=')
+            if key.strip() == 'q':
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        accepted[name.lower()] = quality
+    return accepted
+
+
+def negotiate(header, codecs):
+    """
+    The first of `codecs` the Accept-Encoding header allows, or None for identity.
+    """
+    accepted = parse_accept_encoding(header or '')
+    for codec in codecs:
+        if accepted.get(codec.name, accepted.get('*', 0.0)) > 0:
+            return codec
+    return None
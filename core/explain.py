@@ -0,0 +1,100 @@
+import hashlib
+import json
+import re
+
+from django.db import connection
+
+_STRING = re.compile(r"'(?:[^']|'')*'")
+_NUMBER = re.compile(r'\b\d+(?:\.\d+)?\b')
+_IN_LIST = re.compile(r'IN \(\?(?:, \?)*\)')
+_SEQ_SCAN = re.compile(r'Seq Scan on (\S+)')
+
+
+def normalize_sql(sql):
+    """
+    Replaces literals with `?` and collapses IN lists, so the same ORM query with
+    other ids or another page size gives the same text.
+    """
+    sql = _STRING.sub('?', sql)
+    sql = _NUMBER.sub('?', sql)
+    return _IN_LIST.sub('IN (...)', sql)
+
+
+def fingerprint(sql):
+    return hashlib.sha1(normalize_sql(sql).encode()).hexdigest()[:12]
+
+
+def plan_shape(node, depth=0):
+    """
+    Flattens an EXPLAIN (FORMAT JSON) plan into one indented line per node, keeping
+    only what identifies the access path: node type, join type, index and relation.
+    Costs, row counts and timings are left out, they change with every run.
+    """
+    line = node['Node Type']
+    if node.get('Join Type') and node['Join Type'] != 'Inner':
+        line = f'{node["Join Type"]} {line}'
+    if node.get('Index Name'):
+        line += f' using {node["Index Name"]}'
+    if node.get('Relation Name'):
+        line += f' on {node["Relation Name"]}'
+    lines = ['  ' * depth + line]
+    for child in node.get('Plans', []):
+        lines.extend(plan_shape(child, depth + 1))
+    return lines
+
+
+def seq_scans(shape):
+    return {match[1] for line in shape for match in [_SEQ_SCAN.search(line)] if match}
+
+
+def explain(sql):
+    """
+    Runs `EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON)` on a SELECT and returns its plan
+    shape, estimated total cost, execution time in ms and shared buffers touched.
+    """
+    with connection.cursor() as cursor:
+        cursor.execute(f'EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) {sql}')
+        result = cursor.fetchone()[0]
+    # psycopg mengembalikan json sebagai list, driver lain sebagai teks
+    if isinstance(result, str):
+        result = json.loads(result)
+    root = result[0]
+    plan = root['Plan']
+    return {
+        'sql': normalize_sql(sql),
+        'plan': plan_shape(plan),
+        'cost': plan['Total Cost'],
+        'time': root.get('Execution Time'),
+        'buffers': plan.get('Shared Hit Blocks', 0) + plan.get('Shared Read Blocks', 0),
+    }
+
+
+def compare(snapshot, current, cost_threshold):
+    """
+    Compares captured plans ({endpoint: {fingerprint: explain()}}) with a snapshot.
+    Returns (regressions, notes): a statement that now scans a table sequentially
+    or whose estimated cost grew by more than `cost_threshold` (0.5 = +50%) is a
+    regression; new statements are notes unless they scan sequentially.
+    """
+    regressions, notes = [], []
+    for endpoint, statements in current.items():
+        known = snapshot.get(endpoint, {})
+        for key, captured in statements.items():
+            previous = known.get(key)
+            scans = seq_scans(captured['plan'])
+            if previous is None:
+                if scans:
+                    regressions.append(f'{endpoint} [{key}]: new statement scans {", ".join(sorted(scans))} sequentially')
+                else:
+                    notes.append(f'{endpoint} [{key}]: new statement')
+                continue
+            new_scans = scans - seq_scans(previous['plan'])
+            if new_scans:
+                regressions.append(f'{endpoint} [{key}]: turned into a sequential scan on {", ".join(sorted(new_scans))}')
+            if captured['cost'] > previous['cost'] * (1 + cost_threshold):
+                regressions.append(
+                    f'{endpoint} [{key}]: estimated cost grew from {previous["cost"]:.1f} to {captured["cost"]:.1f}'
+                )
+        for key in known.keys() - statements.keys():
+            notes.append(f'{endpoint} [{key}]: statement no longer issued')
+    return regressions, notes
@@ -0,0 +1,99 @@
+from django.core.exceptions import FieldDoesNotExist
+from django.db.models import QuerySet
+from django.db.models.manager import BaseManager
+from rest_framework import serializers
+
+from core.compiled import NotCompilable, compile_serializer
+
+TRUE_VALUES = ('1', 'true', 'yes')
+
+
+def get_fieldset(request):
+    """
+    Reads `?fields=id,name`, `?exclude=description` and `?compact=1` into keyword
+    arguments for a serializer using SparseFieldsetMixin.
+    """
+    params = request.query_params
+    fieldset = {}
+    if params.get('fields'):
+        fieldset['fields'] = [name for name in params['fields'].split(',') if name]
+    if params.get('exclude'):
+        fieldset['exclude'] = [name for name in params['exclude'].split(',') if name]
+    if params.get('compact', '').lower() in TRUE_VALUES:
+        fieldset['compact'] = True
+    return fieldset
+
+
+def narrow_queryset(queryset, serializer):
+    """
+    Loads only the columns `serializer` will output, joining the models it reads
+    through foreign keys (e.g. `source='event_id.name'`) with select_related().
+    Sources that are not model fields leave the queryset untouched.
+    """
+    model = queryset.model
+    columns = {model._meta.pk.name}
+    related = set()
+    for field in serializer._readable_fields:
+        if field.source == '*':
+            continue
+        path = []
+        current = model
+        for attr in field.source_attrs:
+            try:
+                model_field = current._meta.get_field(attr)
+            except FieldDoesNotExist:
+                return queryset
+            path.append(attr)
+            columns.add('__'.join(path))
+            if not model_field.is_relation or len(path) == len(field.source_attrs):
+                break
+            related.add('__'.join(path))
+            current = model_field.related_model
+    if related:
+        queryset = queryset.select_related(*related)
+    return queryset.only(*columns)
+
+
+class SparseListSerializer(serializers.ListSerializer):
+    """
+    List serializer that narrows the SQL of the queryset it serializes to the child's
+    fields. When the child can be compiled (see core.compiled) the rows skip model
+    instances entirely and are built from `.values_list()` tuples.
+    """
+    def to_representation(self, data):
+        if isinstance(data, BaseManager):
+            data = data.all()
+        if isinstance(data, QuerySet):
+            try:
+                return compile_serializer(self.child)(data, self.child)
+            except (NotCompilable, AttributeError):
+                # AttributeError: a method field needed more than the loaded columns
+                pass
+            data = narrow_queryset(data, self.child)
+        return super().to_representation(data)
+
+
+class SparseFieldsetMixin:
+    """
+    Lets a serializer be narrowed with `fields=[...]` / `exclude=[...]`, and
+    `compact=True` drops the `_links` array. Unknown field names raise a
+    ValidationError (400) keyed by the query parameter. Pair it with
+    `Meta.list_serializer_class = SparseListSerializer` so list querysets are narrowed too.
+    """
+    def __init__(self, *args, fields=None, exclude=None, compact=False, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Salah ketik nama field tidak boleh diam-diam menghasilkan objek yang terpotong
+        errors = {}
+        for param, names in (('fields', fields), ('exclude', exclude)):
+            unknown = sorted(set(names or ()) - set(self.fields))
+            if unknown:
+                errors[param] = [f'Unknown field: {name}.' for name in unknown]
+        if errors:
+            raise serializers.ValidationError(errors)
+        if fields is not None:
+            for name in set(self.fields) - set(fields):
+                self.fields.pop(name)
+        for name in exclude or ():
+            self.fields.pop(name, None)
+        if compact:
+            self.fields.pop('_links', None)
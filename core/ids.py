@@ -0,0 +1,42 @@
+import os
+import threading
+import time
+import uuid
+
+from django.conf import settings
+
+_lock = threading.Lock()
+_last_ms = 0
+_counter = 0
+
+
+def uuid7():
+    """
+    Time-ordered UUID (RFC 9562 version 7): a 48-bit Unix millisecond timestamp, a
+    12-bit counter that keeps ids from the same millisecond increasing within the
+    process, and 62 random bits. New rows land at the right edge of the primary key
+    index instead of on a random page.
+    """
+    global _last_ms, _counter
+    with _lock:
+        ms = time.time_ns() // 1_000_000
+        if ms > _last_ms:
+            _last_ms, _counter = ms, 0
+        else:
+            # Jam mundur atau milidetik yang sama: lanjutkan counter, pinjam milidetik berikutnya bila habis
+            _counter += 1
+            if _counter > 0xFFF:
+                _last_ms, _counter = _last_ms + 1, 0
+        ms, counter = _last_ms, _counter
+    rand = int.from_bytes(os.urandom(8), 'big') & ((1 << 62) - 1)
+    return uuid.UUID(int=(ms << 80) | (0x7 << 76) | (counter << 64) | (0b10 << 62) | rand)
+
+
+def new_id():
+    """
+    Default of the UUID primary keys. PRIMARY_KEY_UUID_VERSION picks uuid7 (default)
+    or the previous random uuid4.
+    """
+    if settings.PRIMARY_KEY_UUID_VERSION == 7:
+        return uuid7()
+    return uuid.uuid4()
@@ -0,0 +1,57 @@
+import logging
+from datetime import timedelta
+
+from django.utils import timezone
+
+from core.models import Job
+from core.tasks import run_in_background
+
+logger = logging.getLogger(__name__)
+
+
+def start_job(kind, func, *args, user=None):
+    """
+    Records a Job and runs `func(job_id, *args)` on the background pool once the
+    current transaction commits. Whatever `func` returns becomes the job's progress.
+    """
+    job = Job.objects.create(kind=kind, user_id=user)
+    run_in_background(_run_job, job.pk, func, args)
+    return job
+
+
+def update_job_progress(job_id, progress):
+    # update() tidak mengisi auto_now, jadi detaknya ditulis sendiri
+    Job.objects.filter(pk=job_id).update(progress=progress, updated_at=timezone.now())
+
+
+def fail_stale_jobs(stale_after):
+    """
+    Marks pending/running jobs without a heartbeat for `stale_after` seconds as
+    failed: their worker died (restart, crash) and will never finish them.
+    Returns the ids of the failed jobs.
+    """
+    now = timezone.now()
+    stale = Job.objects.filter(
+        status__in=[Job.STATUS_PENDING, Job.STATUS_RUNNING], updated_at__lt=now - timedelta(seconds=stale_after)
+    )
+    job_ids = list(stale.values_list('pk', flat=True))
+    Job.objects.filter(pk__in=job_ids).update(
+        status=Job.STATUS_FAILED, error='Worker stopped without finishing the job.', finished_at=now, updated_at=now,
+    )
+    return job_ids
+
+
+def _run_job(job_id, func, args):
+    Job.objects.filter(pk=job_id).update(status=Job.STATUS_RUNNING, updated_at=timezone.now())
+    try:
+        result = func(job_id, *args)
+    except Exception as exc:
+        logger.exception('Job %s failed', job_id)
+        Job.objects.filter(pk=job_id).update(
+            status=Job.STATUS_FAILED, error=str(exc), finished_at=timezone.now(), updated_at=timezone.now(),
+        )
+        return
+    finished = {'status': Job.STATUS_DONE, 'finished_at': timezone.now(), 'updated_at': timezone.now()}
+    if result is not None:
+        finished['progress'] = result
+    Job.objects.filter(pk=job_id).update(**finished)
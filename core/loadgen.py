@@ -0,0 +1,309 @@
+import asyncio
+import itertools
+import json
+import math
+import random
+import re
+import time
+import uuid
+from urllib.parse import urlencode, urljoin, urlsplit
+
+_VARIABLE = re.compile(r'\{\{([^}]+)\}\}')
+# pm.environment.set('eventId', responseJson.id) dan sejenisnya di script test
+_CAPTURE = re.compile(
+    r"pm\.(?:environment|collectionVariables|globals|variables)\.set\(\s*['\"]([^'\"]+)['\"]\s*,"
+    r"\s*responseJson((?:\.\w+|\[\d+\])*)\s*\)"
+)
+_PATH_PART = re.compile(r'\.(\w+)|\[(\d+)\]')
+_EXPECTED_STATUS = re.compile(r'to\.have\.status\((\d+)\)')
+
+_unique = itertools.count()
+
+MAX_REDIRECTS = 5
+
+
+class Step:
+    """
+    One request of a collection, with what its test script captures and expects.
+    """
+    def __init__(self, name, method, url, body, content_type, token, captures, expected_status):
+        self.name = name
+        self.method = method
+        self.url = url
+        self.body = body
+        self.content_type = content_type
+        self.token = token
+        self.captures = captures
+        self.expected_status = expected_status
+
+
+def _auth_token(auth, inherited):
+    if auth is None:
+        return inherited
+    if auth.get('type') == 'bearer':
+        return next((entry['value'] for entry in auth.get('bearer', []) if entry['key'] == 'token'), None)
+    return None
+
+
+def _script(item):
+    return '\n'.join(
+        line for event in item.get('event', []) if event.get('listen') == 'test'
+        for line in event['script'].get('exec', [])
+    )
+
+
+def load_steps(collection, folders=None):
+    """
+    Flattens a Postman collection (v2.1) into Steps in run order. `folders` keeps only
+    top-level folders whose name contains one of the given strings. Scripts are not
+    executed: only `pm.*.set(name, responseJson.path)` captures and the expected
+    status of `to.have.status(...)` are read from them.
+    """
+    steps = []
+
+    def walk(items, prefix, token):
+        for item in items:
+            if 'item' in item:
+                walk(item['item'], f'{prefix}{item["name"]} / ', _auth_token(item.get('auth'), token))
+                continue
+            request = item['request']
+            script = _script(item)
+            body = request.get('body') or {}
+            content_type = None
+            if body.get('mode') == 'raw':
+                payload = body.get('raw', '')
+                if body.get('options', {}).get('raw', {}).get('language', 'json') == 'json':
+                    content_type = 'application/json'
+            elif body.get('mode') == 'urlencoded':
+                payload = [(entry['key'], entry.get('value', '')) for entry in body['urlencoded'] if not entry.get('disabled')]
+                content_type = 'application/x-www-form-urlencoded'
+            else:
+                payload = None
+            expected = _EXPECTED_STATUS.search(script)
+            steps.append(Step(
+                name=f'{prefix}{item["name"]}',
+                method=request['method'],
+                url=request['url']['raw'] if isinstance(request['url'], dict) else request['url'],
+                body=payload,
+                content_type=content_type,
+                token=_auth_token(request.get('auth'), token),
+                captures=[
+                    (name, [key or int(index) for key, index in _PATH_PART.findall(path)])
+                    for name, path in _CAPTURE.findall(script)
+                ],
+                expected_status=int(expected[1]) if expected else None,
+            ))
+
+    items = collection['item']
+    if folders:
+        items = [item for item in items if any(folder in item['name'] for folder in folders)]
+    walk(items, '', _auth_token(collection.get('auth'), None))
+    return steps
+
+
+def load_environment(environment):
+    return {entry['key']: entry['value'] for entry in environment.get('values', []) if entry.get('enabled', True)}
+
+
+def resolve(text, variables):
+    """
+    Replaces {{name}} with the variable's value. {{$timestamp}} is unique per use
+    (not the bare unix time), so concurrent users never create the same username.
+    """
+    def replace(match):
+        name = match[1].strip()
+        if name == '$timestamp':
+            return f'{int(time.time())}{next(_unique)}'
+        if name == '$guid':
+            return str(uuid.uuid4())
+        if name == '$randomInt':
+            return str(random.randint(0, 1000))
+        return str(variables[name]) if name in variables else match[0]
+    return _VARIABLE.sub(replace, text)
+
+
+def _extract(data, path):
+    for part in path:
+        data = data[part]
+    return data
+
+
+def percentile(values, fraction):
+    """
+    Nearest-rank percentile of an already sorted list.
+    """
+    if not values:
+        return 0.0
+    return values[max(0, math.ceil(fraction * len(values)) - 1)]
+
+
+class HTTPConnection:
+    """
+    A minimal keep-alive HTTP/1.1 client on asyncio streams, enough for JSON APIs
+    (Content-Length, chunked or close-delimited responses).
+    """
+    def __init__(self, host, port, timeout):
+        self.host, self.port, self.timeout = host, port, timeout
+        self.reader = self.writer = None
+
+    async def close(self):
+        if self.writer is not None:
+            self.writer.close()
+            try:
+                await self.writer.wait_closed()
+            except OSError:
+                pass
+        self.reader = self.writer = None
+
+    async def request(self, method, target, headers, body):
+        reused = self.writer is not None
+        try:
+            return await asyncio.wait_for(self._request(method, target, headers, body), self.timeout)
+        except (ConnectionError, asyncio.IncompleteReadError):
+            await self.close()
+            if not reused:
+                raise
+            # Server menutup koneksi keep-alive yang menganggur: coba sekali lagi di koneksi baru
+            return await asyncio.wait_for(self._request(method, target, headers, body), self.timeout)
+
+    async def _request(self, method, target, headers, body):
+        if self.writer is None:
+            self.reader, self.writer = await asyncio.open_connection(self.host, self.port)
+        lines = [f'{method} {target} HTTP/1.1', f'Host: {self.host}:{self.port}', f'Content-Length: {len(body)}']
+        lines.extend(f'{name}: {value}' for name, value in headers.items())
+        self.writer.write(('\r\n'.join(lines) + '\r\n\r\n').encode('latin-1') + body)
+        await self.writer.drain()
+
+        status_line = await self.reader.readuntil(b'\r\n')
+        status = int(status_line.split()[1])
+        response_headers = {}
+        while True:
+            line = await self.reader.readuntil(b'\r\n')
+            if line == b'\r\n':
+                break
+            name, _, value = line.decode('latin-1').partition(':')
+            response_headers[name.strip().lower()] = value.strip()
+
+        if response_headers.get('transfer-encoding', '').lower() == 'chunked':
+            chunks = []
+            while True:
+                size = int((await self.reader.readuntil(b'\r\n')).split(b';')[0], 16)
+                chunk = await self.reader.readexactly(size + 2)
+                if not size:
+                    break
+                chunks.append(chunk[:-2])
+            content = b''.join(chunks)
+        elif 'content-length' in response_headers:
+            content = await self.reader.readexactly(int(response_headers['content-length']))
+        elif status in (204, 304) or method == 'HEAD':
+            content = b''
+        else:
+            content = await self.reader.read()
+            response_headers['connection'] = 'close'
+        if response_headers.get('connection', '').lower() == 'close':
+            await self.close()
+        return status, response_headers, content
+
+
+class StepStats:
+    def __init__(self):
+        self.requests = 0
+        self.errors = 0
+        # 429 dari throttle server, dipisah dari error agar batas rate tidak terbaca sebagai kegagalan API
+        self.throttled = 0
+        self.latencies = []
+
+
+async def _send(connections, url, method, headers, body, timeout):
+    """
+    Sends a request on the user's connection to `url`'s host and follows redirects
+    like Postman does (e.g. APPEND_SLASH's 301 for /api/tickets/<id>).
+    """
+    for _ in range(MAX_REDIRECTS + 1):
+        address = (url.hostname, url.port or 80)
+        connection = connections.get(address)
+        if connection is None:
+            connection = connections[address] = HTTPConnection(*address, timeout)
+        try:
+            status, response_headers, content = await connection.request(
+                method, url.path + (f'?{url.query}' if url.query else ''), headers, body
+            )
+        except BaseException:
+            await connection.close()
+            raise
+        location = response_headers.get('location')
+        if status not in (301, 302, 303, 307, 308) or not location:
+            break
+        url = urlsplit(urljoin(url.geturl(), location))
+        if status == 303 or (status in (301, 302) and method != 'GET'):
+            method, body = 'GET', b''
+            headers = {name: value for name, value in headers.items() if name != 'Content-Type'}
+    return status, content
+
+
+async def run_virtual_user(steps, variables, base_url, iterations, timeout, stats):
+    """
+    Runs the steps `iterations` times with its own variables (tokens, ids) and its
+    own connections, recording latency in ms, errors and throttled (429) requests
+    per step into `stats`.
+    """
+    variables = dict(variables)
+    connections = {}
+    try:
+        for _ in range(iterations):
+            for step in steps:
+                url = urlsplit(resolve(step.url, variables))
+                if base_url:
+                    url = url._replace(scheme=base_url.scheme, netloc=base_url.netloc)
+                headers = {'Accept': 'application/json'}
+                token = resolve(step.token, variables) if step.token else None
+                if token:
+                    headers['Authorization'] = f'Bearer {token}'
+                if isinstance(step.body, list):
+                    body = urlencode([(resolve(key, variables), resolve(value, variables)) for key, value in step.body])
+                else:
+                    body = resolve(step.body or '', variables)
+                if step.content_type:
+                    headers['Content-Type'] = step.content_type
+
+                step_stats = stats.setdefault(step.name, StepStats())
+                step_stats.requests += 1
+                started = time.perf_counter()
+                try:
+                    status, content = await _send(connections, url, step.method, headers, body.encode(), timeout)
+                except (OSError, asyncio.TimeoutError, asyncio.IncompleteReadError, ValueError):
+                    step_stats.errors += 1
+                    continue
+                step_stats.latencies.append((time.perf_counter() - started) * 1000)
+                if status == 429 and step.expected_status != 429:
+                    step_stats.throttled += 1
+                    continue
+                failed = status != step.expected_status if step.expected_status else status >= 400
+                if failed:
+                    step_stats.errors += 1
+                    continue
+
+                if step.captures and content:
+                    try:
+                        data = json.loads(content)
+                        for name, path in step.captures:
+                            variables[name] = _extract(data, path)
+                    except (ValueError, KeyError, IndexError, TypeError):
+                        step_stats.errors += 1
+    finally:
+        for connection in connections.values():
+            await connection.close()
+
+
+async def replay(steps, variables, base_url=None, users=10, iterations=1, timeout=30):
+    """
+    Replays the steps with `users` concurrent virtual users. Returns the stats per
+    step name, in first-run order, and the wall-clock duration in seconds.
+    """
+    stats = {step.name: StepStats() for step in steps}
+    base_url = urlsplit(base_url) if base_url else None
+    started = time.perf_counter()
+    await asyncio.gather(*(
+        run_virtual_user(steps, variables, base_url, iterations, timeout, stats) for _ in range(users)
+    ))
+    return stats, time.perf_counter() - started
@@ -0,0 +1,100 @@
+import json
+
+from django.core.management.base import BaseCommand, CommandError
+from django.test import Client
+from django.test.utils import override_settings
+from rest_framework_simplejwt.tokens import AccessToken
+
+from core.compression import available_codecs
+from core.management.commands.bench_renderers import best_of, build_payloads
+from core.models import User
+from core.renderers import FastJSONRenderer, MessagePackRenderer, msgpack
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def formats():
+    """
+    (name, media type, render, parse) of the response formats that can be benchmarked here.
+    """
+    available = [('json', 'application/json', FastJSONRenderer().render, orjson.loads if orjson else json.loads)]
+    if msgpack is not None:
+        available.append((
+            'msgpack', 'application/msgpack', MessagePackRenderer().render,
+            lambda body: msgpack.unpackb(body, raw=False),
+        ))
+    return available
+
+
+class Command(BaseCommand):
+    help = (
+        'Compares response formats (JSON, MessagePack when msgpack is installed) and encodings '
+        '(identity, gzip, and br/zstd when brotli/zstandard are installed): payload size, server '
+        'time to render and compress, client time to decompress and parse. With --path, also '
+        'measures end-to-end requests through the full middleware stack as --user.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--rows', type=int, default=1000)
+        parser.add_argument('--repeat', type=int, default=20)
+        parser.add_argument('--path', action='append', help='API path to request, e.g. /api/registrations/me/?limit=100 (repeatable).')
+        parser.add_argument('--user', default='seed_admin', help='--path: username the requests are made as.')
+
+    def handle(self, *args, **options):
+        codecs = available_codecs()
+        encodings = [None] + codecs
+        self.stdout.write(
+            f'{"payload":<15} {"format":<8} {"encoding":<9} {"bytes":>9} {"ratio":>6} {"server ms":>10} {"client ms":>10}'
+        )
+        for name, data in build_payloads(options['rows']).items():
+            baseline = None
+            for format_name, _, render, parse in formats():
+                body = render(data)
+                for codec in encodings:
+                    if codec is None:
+                        server_ms, wire = best_of(lambda: render(data), options['repeat'])
+                        client_ms, _ = best_of(lambda: parse(wire), options['repeat'])
+                    else:
+                        server_ms, wire = best_of(lambda: codec.compress(render(data)), options['repeat'])
+                        client_ms, _ = best_of(lambda: parse(codec.decompress(wire)), options['repeat'])
+                    if codec is not None and codec.decompress(wire) != body:
+                        raise CommandError(f'{name}: {codec.name} does not round-trip')
+                    baseline = baseline or len(body)
+                    self.stdout.write(
+                        f'{name:<15} {format_name:<8} {codec.name if codec else "identity":<9} {len(wire):>9} '
+                        f'{len(wire) / baseline:>6.2f} {server_ms:>10.2f} {client_ms:>10.2f}'
+                    )
+
+        if options['path']:
+            self.bench_requests(options, encodings)
+
+    def bench_requests(self, options, encodings):
+        user = User.objects.filter(username=options['user']).first()
+        if user is None:
+            raise CommandError(f'User {options["user"]} does not exist, run seed_data first.')
+        client = Client(HTTP_AUTHORIZATION=f'Bearer {AccessToken.for_user(user)}')
+        self.stdout.write(f'\n{"path":<40} {"format":<8} {"encoding":<9} {"bytes":>9} {"ms":>8}')
+        with override_settings(ALLOWED_HOSTS=['*']):
+            for path in options['path']:
+                for format_name, media_type, _, parse in formats():
+                    for codec in encodings:
+                        headers = {'HTTP_ACCEPT': media_type, 'HTTP_ACCEPT_ENCODING': codec.name if codec else 'identity'}
+
+                        def request():
+                            response = client.get(path, **headers)
+                            if response.status_code != 200:
+                                raise CommandError(f'GET {path} answered {response.status_code}.')
+                            body = response.content
+                            if response.get('Content-Encoding'):
+                                body = codec.decompress(body)
+                            parse(body)
+                            return response
+
+                        elapsed, response = best_of(request, options['repeat'])
+                        self.stdout.write(
+                            f'{path[-40:]:<40} {format_name:<8} {response.get("Content-Encoding", "identity"):<9} '
+                            f'{len(response.content):>9} {elapsed:>8.2f}'
+                        )
@@ -0,0 +1,53 @@
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from django.conf import settings
+from django.contrib.auth.hashers import get_hasher
+from django.core.management.base import BaseCommand
+from django.utils.module_loading import import_string
+
+PASSWORD = '1234qwer!@#$'
+
+
+def _verify_loop(hasher_path, encoded, seconds):
+    hasher = import_string(hasher_path)()
+    done = 0
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        hasher.verify(PASSWORD, encoded)
+        done += 1
+    return done
+
+
+class Command(BaseCommand):
+    help = (
+        'Measures password hashing cost of the configured hashers: time per signup '
+        '(make_password) and login throughput (verify) per core and across workers.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--seconds', type=float, default=3, help='Duration of each verify run.')
+        parser.add_argument('--workers', type=int, default=1, help='Processes verifying in parallel.')
+
+    def handle(self, *args, **options):
+        seconds, workers = options['seconds'], options['workers']
+        self.stdout.write(f'{"hasher":<34} {"encode ms":>10} {"verify ms":>10} {"logins/s/core":>14} {"logins/s total":>15}')
+        for hasher_path in settings.PASSWORD_HASHERS:
+            hasher = import_string(hasher_path)()
+            try:
+                started = time.perf_counter()
+                encoded = hasher.encode(PASSWORD, hasher.salt())
+                encode_ms = (time.perf_counter() - started) * 1000
+            except ValueError as exc:
+                self.stdout.write(f'{hasher_path.rsplit(".", 1)[-1]:<34} skipped: {exc}')
+                continue
+
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                counts = list(pool.map(_verify_loop, [hasher_path] * workers, [encoded] * workers, [seconds] * workers))
+            total = sum(counts) / seconds
+            per_core = total / workers
+            self.stdout.write(
+                f'{hasher_path.rsplit(".", 1)[-1]:<34} {encode_ms:>10.1f} {1000 / per_core:>10.1f} '
+                f'{per_core:>14.1f} {total:>15.1f}'
+            )
+        self.stdout.write(f'Preferred hasher: {get_hasher().algorithm}')
@@ -0,0 +1,135 @@
+import statistics
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+
+SCHEMA = 'bench_partitions'
+
+# Kolom yang sama dengan registrations_registration, cukup untuk pola query-nya
+COLUMNS = 'id uuid NOT NULL, ticket_id uuid NOT NULL, user_id uuid NOT NULL, event_start timestamptz NOT NULL'
+
+QUERIES = [
+    (
+        'seats taken for a ticket',
+        'SELECT count(*) FROM {table} WHERE ticket_id = %(ticket)s AND event_start = %(event_start)s',
+    ),
+    (
+        "user's history page",
+        'SELECT id, ticket_id FROM {table} WHERE user_id = %(user)s ORDER BY id LIMIT 20',
+    ),
+    (
+        'registrations of the latest month',
+        'SELECT count(*) FROM {table} WHERE event_start >= %(month)s',
+    ),
+]
+
+
+class Command(BaseCommand):
+    help = (
+        'Benchmarks a plain registrations-like table against the same rows range-partitioned by '
+        'event start month. Both are filled with generate_series() in a scratch schema, then the '
+        "query patterns used by the API and VACUUM of the hot data are timed. Needs PostgreSQL 13+."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--rows', type=int, default=10_000_000)
+        parser.add_argument('--months', type=int, default=24, help='Months of events the rows are spread over.')
+        parser.add_argument('--tickets', type=int, default=20_000)
+        parser.add_argument('--users', type=int, default=1_000_000)
+        parser.add_argument('--repeat', type=int, default=50, help='Runs per query; the median is reported.')
+        parser.add_argument('--keep', action='store_true', help='Keep the scratch schema afterwards.')
+
+    def handle(self, *args, **options):
+        if connection.vendor != 'postgresql':
+            raise CommandError('This benchmark needs PostgreSQL.')
+        with connection.cursor() as cursor:
+            cursor.execute(f'DROP SCHEMA IF EXISTS {SCHEMA} CASCADE')
+            cursor.execute(f'CREATE SCHEMA {SCHEMA}')
+            try:
+                self.setup(cursor, options)
+                self.run(cursor, options)
+            finally:
+                if not options['keep']:
+                    cursor.execute(f'DROP SCHEMA {SCHEMA} CASCADE')
+
+    def setup(self, cursor, options):
+        months = options['months']
+        cursor.execute(f'CREATE TABLE {SCHEMA}.plain ({COLUMNS}, PRIMARY KEY (id))')
+        cursor.execute(
+            f'CREATE TABLE {SCHEMA}.partitioned ({COLUMNS}, PRIMARY KEY (id, event_start)) '
+            f'PARTITION BY RANGE (event_start)'
+        )
+        for offset in range(months):
+            cursor.execute(
+                """
+                SELECT date_trunc('month', now()) - make_interval(months => %(offset)s),
+                       date_trunc('month', now()) - make_interval(months => %(offset)s - 1)
+                """,
+                {'offset': offset},
+            )
+            start, end = cursor.fetchone()
+            cursor.execute(
+                f'CREATE TABLE {SCHEMA}.partitioned_{offset} PARTITION OF {SCHEMA}.partitioned '
+                f'FOR VALUES FROM (%s) TO (%s)',
+                [start, end],
+            )
+
+        # Tiket k selalu jatuh pada event yang sama: bulan k % months, hari (k / months) % 28
+        fill = """
+            INSERT INTO {table}
+            SELECT gen_random_uuid(),
+                   md5('ticket' || t)::uuid,
+                   md5('user' || ((i * 7919) %% %(users)s))::uuid,
+                   date_trunc('month', now())
+                   - make_interval(months => (t %% %(months)s)::int, days => -((t / %(months)s) %% 28)::int)
+            FROM (SELECT i, i %% %(tickets)s AS t FROM generate_series(%(low)s::bigint, %(high)s::bigint) AS i) AS rows
+        """
+        batch = 1_000_000
+        for table in ('plain', 'partitioned'):
+            started = time.perf_counter()
+            for low in range(1, options['rows'] + 1, batch):
+                cursor.execute(
+                    fill.format(table=f'{SCHEMA}.{table}'),
+                    {
+                        'users': options['users'], 'months': months, 'tickets': options['tickets'],
+                        'low': low, 'high': min(low + batch - 1, options['rows']),
+                    },
+                )
+            cursor.execute(f'CREATE INDEX ON {SCHEMA}.{table} (ticket_id)')
+            cursor.execute(f'CREATE INDEX ON {SCHEMA}.{table} (user_id, id)')
+            cursor.execute(f'ANALYZE {SCHEMA}.{table}')
+            self.stdout.write(f'Loaded {options["rows"]} rows into {table} in {time.perf_counter() - started:.1f}s')
+
+    def run(self, cursor, options):
+        cursor.execute(f'SELECT ticket_id, event_start, user_id FROM {SCHEMA}.plain ORDER BY event_start DESC LIMIT 1')
+        ticket, event_start, user = cursor.fetchone()
+        cursor.execute("SELECT date_trunc('month', now())")
+        params = {'ticket': ticket, 'event_start': event_start, 'user': user, 'month': cursor.fetchone()[0]}
+
+        self.stdout.write(f'{"query":<36} {"plain ms":>10} {"partitioned ms":>15}')
+        for label, sql in QUERIES:
+            timings = []
+            for table in ('plain', 'partitioned'):
+                query = sql.format(table=f'{SCHEMA}.{table}')
+                cursor.execute(query, params)
+                cursor.fetchall()
+                runs = []
+                for _ in range(options['repeat']):
+                    started = time.perf_counter()
+                    cursor.execute(query, params)
+                    cursor.fetchall()
+                    runs.append((time.perf_counter() - started) * 1000)
+                timings.append(statistics.median(runs))
+            self.stdout.write(f'{label:<36} {timings[0]:>10.2f} {timings[1]:>15.2f}')
+
+        # Vacuum setelah update di bulan terakhir: tabel biasa memindai semuanya, partisi hanya bulan itu
+        timings = []
+        for table, target in (('plain', 'plain'), ('partitioned', 'partitioned_0')):
+            cursor.execute(
+                f'UPDATE {SCHEMA}.{table} SET user_id = user_id WHERE event_start >= %(month)s', params
+            )
+            started = time.perf_counter()
+            cursor.execute(f'VACUUM {SCHEMA}.{target}')
+            timings.append((time.perf_counter() - started) * 1000)
+        self.stdout.write(f'{"vacuum after latest-month update":<36} {timings[0]:>10.2f} {timings[1]:>15.2f}')
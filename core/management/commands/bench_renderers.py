@@ -0,0 +1,76 @@
+import time
+import uuid
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+
+from core.models import User
+from core.parsers import FastJSONParser
+from core.renderers import FastJSONRenderer
+from events.models import Event
+from events.serializers import EventSerializer
+from registrations.models import Registration
+from registrations.serializers import RegistrationSerializer
+from tickets.models import Ticket
+
+
+def build_payloads(rows):
+    """
+    Serializes unsaved model instances, so the benchmark needs no database.
+    """
+    now = timezone.now()
+    organizer = User(id=uuid.uuid4(), username='organizer')
+    events = [
+        Event(
+            id=uuid.uuid4(), name=f'DevCoach {i}: Back-End Python', description='Belajar Django REST Framework ' * 8,
+            location='Online', start_time=now + timedelta(days=i), end_time=now + timedelta(days=i, hours=1),
+            status='scheduled', quota=200, category='Seminar', organizer_id=organizer,
+        )
+        for i in range(rows)
+    ]
+    ticket = Ticket(id=uuid.uuid4(), name='VIP', price=200000, sales_start=now, sales_end=now, quota=200, event_id=events[0])
+    registrations = [
+        Registration(id=uuid.uuid4(), ticket_id=ticket, user_id=User(id=uuid.uuid4(), username=f'user{i}'))
+        for i in range(rows)
+    ]
+    return {
+        'events': {'events': EventSerializer(events, many=True).data},
+        'registrations': {'registrations': RegistrationSerializer(registrations, many=True).data},
+    }
+
+
+def best_of(func, repeat):
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = func()
+        timings.append(time.perf_counter() - started)
+    return min(timings) * 1000, result
+
+
+class Command(BaseCommand):
+    help = 'Compares DRF JSONRenderer/JSONParser with FastJSONRenderer/FastJSONParser on event and registration lists.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--rows', type=int, default=1000)
+        parser.add_argument('--repeat', type=int, default=20)
+
+    def handle(self, *args, **options):
+        import io
+
+        self.stdout.write(f'{"payload":<15} {"bytes":>9} {"render std":>11} {"render fast":>12} {"parse std":>10} {"parse fast":>11}')
+        for name, data in build_payloads(options['rows']).items():
+            std_ms, std_bytes = best_of(lambda: JSONRenderer().render(data), options['repeat'])
+            fast_ms, fast_bytes = best_of(lambda: FastJSONRenderer().render(data), options['repeat'])
+            if std_bytes != fast_bytes:
+                raise CommandError(f'{name}: FastJSONRenderer output differs from JSONRenderer')
+            parse_std_ms, _ = best_of(lambda: JSONParser().parse(io.BytesIO(std_bytes)), options['repeat'])
+            parse_fast_ms, _ = best_of(lambda: FastJSONParser().parse(io.BytesIO(std_bytes)), options['repeat'])
+            self.stdout.write(
+                f'{name:<15} {len(std_bytes):>9} {std_ms:>9.2f}ms {fast_ms:>10.2f}ms '
+                f'{parse_std_ms:>8.2f}ms {parse_fast_ms:>9.2f}ms'
+            )
+        self.stdout.write('Rendered output is byte-identical.')
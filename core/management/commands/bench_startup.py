@@ -0,0 +1,98 @@
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+# Dijalankan di interpreter baru per profil, supaya impor benar-benar dingin
+PROBE = """
+import json, sys, time
+
+started = time.perf_counter()
+from dicoevent.wsgi import application
+imported = time.perf_counter() - started
+
+from django.conf import settings
+from django.test import RequestFactory
+
+path, host, seconds, token = sys.argv[1], sys.argv[2], float(sys.argv[3]), sys.argv[4]
+factory = RequestFactory()
+headers = {'HTTP_AUTHORIZATION': f'Bearer {token}'} if token else {}
+
+
+def request():
+    status = []
+    environ = factory.get(path, SERVER_NAME=host, **headers).environ
+    response = application(environ, lambda code, headers: status.append(int(code.split()[0])))
+    b''.join(response)
+    response.close()
+    return status[0]
+
+
+started = time.perf_counter()
+status = request()
+first = time.perf_counter() - started
+
+done = 0
+started = time.perf_counter()
+while time.perf_counter() - started < seconds:
+    request()
+    done += 1
+
+print(json.dumps({
+    'import': imported,
+    'first': first,
+    'rps': done / (time.perf_counter() - started),
+    'status': status,
+    'apps': len(settings.INSTALLED_APPS),
+    'middleware': len(settings.MIDDLEWARE),
+    'modules': len(sys.modules),
+}))
+"""
+
+
+class Command(BaseCommand):
+    help = (
+        'Compares settings profiles (by default the full dicoevent.settings and the lean '
+        'dicoevent.settings_api): cold import of dicoevent.wsgi, latency of the first request '
+        'and steady-state requests per second through the WSGI handler, each in a fresh interpreter.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--profiles', default='dicoevent.settings,dicoevent.settings_api',
+            help='Comma-separated settings modules to compare.',
+        )
+        parser.add_argument('--path', default='/api/events/', help='Request path, GET.')
+        parser.add_argument('--host', default='localhost', help='Host of the request; must be in ALLOWED_HOSTS.')
+        parser.add_argument('--token', default='', help='Access token sent as a Bearer header.')
+        parser.add_argument('--seconds', type=float, default=5, help='Duration of the steady-state run.')
+        parser.add_argument('--runs', type=int, default=5, help='Fresh interpreters per profile; medians are reported.')
+
+    def handle(self, *args, **options):
+        self.stdout.write(
+            f'{"profile":<28} {"import ms":>10} {"first ms":>9} {"req/s":>8} {"status":>7} '
+            f'{"apps":>5} {"middleware":>11} {"modules":>8}'
+        )
+        for profile in options['profiles'].split(','):
+            results = [self.probe(profile, options) for _ in range(options['runs'])]
+            median = {key: statistics.median(result[key] for result in results) for key in ('import', 'first', 'rps')}
+            last = results[-1]
+            self.stdout.write(
+                f'{profile:<28} {median["import"] * 1000:>10.1f} {median["first"] * 1000:>9.1f} '
+                f'{median["rps"]:>8.0f} {last["status"]:>7} {last["apps"]:>5} {last["middleware"]:>11} '
+                f'{last["modules"]:>8}'
+            )
+
+    def probe(self, profile, options):
+        env = {**os.environ, 'DJANGO_SETTINGS_MODULE': profile}
+        process = subprocess.run(
+            [sys.executable, '-c', PROBE, options['path'], options['host'], str(options['seconds']), options['token']],
+            cwd=settings.BASE_DIR, env=env, capture_output=True, text=True,
+        )
+        if process.returncode:
+            raise CommandError(f'{profile} failed:\n{process.stderr}')
+        return json.loads(process.stdout.strip().splitlines()[-1])
@@ -0,0 +1,125 @@
+import time
+import uuid
+
+from django.core.management.base import BaseCommand
+from django.db import connection
+
+from core.ids import uuid7
+
+SCHEMA = 'bench_uuid_keys'
+
+# Sama dengan core.ids.uuid7, tapi di sisi database supaya pengisian tidak lewat Python
+UUID7_SQL = """
+CREATE FUNCTION {schema}.uuid7() RETURNS uuid AS $$
+    SELECT encode(
+        set_bit(set_bit(
+            overlay(uuid_send(gen_random_uuid())
+                    PLACING substring(int8send(floor(extract(epoch FROM clock_timestamp()) * 1000)::bigint) FROM 3)
+                    FROM 1 FOR 6),
+        52, 1), 53, 1),
+        'hex')::uuid
+$$ LANGUAGE sql VOLATILE
+"""
+
+# (label, key type, expression generating a key)
+KEYS = [
+    ('uuid4', 'uuid', 'gen_random_uuid()'),
+    ('uuid7', 'uuid', f'{SCHEMA}.uuid7()'),
+    ('bigint', 'bigint', "nextval('{schema}.{table}_seq')"),
+]
+
+
+class Command(BaseCommand):
+    help = (
+        'Compares primary key flavours for the registrations/payments shape: random uuid4, '
+        'time-ordered uuid7 and bigint. Reports id generation cost in Python and, on PostgreSQL 13+, '
+        'insert throughput and table, primary key and FK index sizes in a scratch schema.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--rows', type=int, default=2_000_000, help='Parent rows; each gets one child row.')
+        parser.add_argument('--batch', type=int, default=10_000, help='Rows per INSERT, like a busy write path.')
+        parser.add_argument('--keep', action='store_true', help='Keep the scratch schema afterwards.')
+
+    def handle(self, *args, **options):
+        self.bench_python()
+        if connection.vendor != 'postgresql':
+            self.stdout.write('Skipping the database part: it needs PostgreSQL.')
+            return
+        with connection.cursor() as cursor:
+            cursor.execute(f'DROP SCHEMA IF EXISTS {SCHEMA} CASCADE')
+            cursor.execute(f'CREATE SCHEMA {SCHEMA}')
+            cursor.execute(UUID7_SQL.format(schema=SCHEMA))
+            try:
+                self.stdout.write(
+                    f'{"key":<8} {"parent rows/s":>14} {"child rows/s":>13} {"table MB":>9} '
+                    f'{"pkey MB":>8} {"fk index MB":>12}'
+                )
+                for label, key_type, expression in KEYS:
+                    self.bench_database(cursor, label, key_type, expression, options)
+            finally:
+                if not options['keep']:
+                    cursor.execute(f'DROP SCHEMA {SCHEMA} CASCADE')
+
+    def bench_python(self, count=200_000):
+        for label, generate in (('uuid4', uuid.uuid4), ('uuid7', uuid7)):
+            started = time.perf_counter()
+            for _ in range(count):
+                generate()
+            self.stdout.write(f'{label} generation: {(time.perf_counter() - started) / count * 1e6:.2f} µs/id')
+
+    def bench_database(self, cursor, label, key_type, expression, options):
+        parent, child = f'{SCHEMA}.{label}_parent', f'{SCHEMA}.{label}_child'
+        for table in ('parent', 'child'):
+            cursor.execute(f'CREATE SEQUENCE {SCHEMA}.{label}_{table}_seq')
+        # Bentuk registrations -> payments: kunci utama, FK yang diindeks, beberapa kolom data
+        # `seq` hanya untuk memilih induk per batch, tidak ikut diukur sebagai kunci
+        cursor.execute(
+            f'CREATE TABLE {parent} (id {key_type} PRIMARY KEY, seq bigint NOT NULL, ticket uuid NOT NULL, '
+            f'event_start timestamptz NOT NULL)'
+        )
+        cursor.execute(f'CREATE INDEX ON {parent} (seq)')
+        cursor.execute(
+            f'CREATE TABLE {child} (id {key_type} PRIMARY KEY, parent_id {key_type} NOT NULL REFERENCES {parent}, '
+            f'amount integer NOT NULL)'
+        )
+        cursor.execute(f'CREATE INDEX ON {child} (parent_id)')
+
+        rates = []
+        for table, insert in (
+            (
+                'parent',
+                f'INSERT INTO {parent} SELECT {{key}}, i, gen_random_uuid(), now() '
+                f'FROM generate_series(%(low)s::bigint, %(high)s::bigint) AS i',
+            ),
+            # Seperti pembayaran: dibuat tidak lama setelah registrasinya
+            (
+                'child',
+                f'INSERT INTO {child} SELECT {{key}}, id, 1 FROM {parent} WHERE seq BETWEEN %(low)s AND %(high)s',
+            ),
+        ):
+            key = expression.format(schema=SCHEMA, table=f'{label}_{table}')
+            started = time.perf_counter()
+            for low in range(1, options['rows'] + 1, options['batch']):
+                high = min(low + options['batch'] - 1, options['rows'])
+                cursor.execute(insert.format(key=key), {'low': low, 'high': high})
+            rates.append(options['rows'] / (time.perf_counter() - started))
+
+        cursor.execute(f'VACUUM ANALYZE {parent}')
+        cursor.execute(f'VACUUM ANALYZE {child}')
+        cursor.execute(
+            """
+            SELECT pg_table_size(%(parent)s::regclass) + pg_table_size(%(child)s::regclass),
+                   pg_relation_size(%(parent_pkey)s::regclass) + pg_relation_size(%(child_pkey)s::regclass),
+                   pg_relation_size(%(fk_index)s::regclass)
+            """,
+            {
+                'parent': parent, 'child': child,
+                'parent_pkey': f'{parent}_pkey', 'child_pkey': f'{child}_pkey',
+                'fk_index': f'{child}_parent_id_idx',
+            },
+        )
+        table_size, pkey_size, fk_size = (size / 2 ** 20 for size in cursor.fetchone())
+        self.stdout.write(
+            f'{label:<8} {rates[0]:>14.0f} {rates[1]:>13.0f} {table_size:>9.1f} {pkey_size:>8.1f} {fk_size:>12.1f}'
+        )
@@ -0,0 +1,123 @@
+import json
+from pathlib import Path
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.test.utils import CaptureQueriesContext, override_settings
+from rest_framework.test import APIClient
+
+from core.explain import compare, explain, fingerprint, seq_scans
+from core.models import User
+from payments.models import Payment
+
+# (name, path); {event}, {ticket}, {registration} and {payment} belong to the user
+ENDPOINTS = [
+    ('event list', '/api/events/'),
+    ('event detail', '/api/events/{event}/'),
+    ('event stats', '/api/events/{event}/stats/'),
+    ('event catalog', '/api/catalog/?upcoming=1'),
+    ('ticket list', '/api/tickets/'),
+    ('ticket detail', '/api/tickets/{ticket}/'),
+    ('registration list', '/api/registrations/'),
+    ('registration detail', '/api/registrations/{registration}/'),
+    ('my registrations', '/api/registrations/me/'),
+    ('payment list', '/api/payments/'),
+    ('payment detail', '/api/payments/{payment}/'),
+    ('my payments', '/api/payments/me/'),
+    ('user list', '/api/users/'),
+    ('user search', '/api/users/search/?q=seed&group=organizer'),
+]
+
+
+class Command(BaseCommand):
+    help = (
+        'Calls the API endpoints as one user, captures every distinct SELECT they issue and runs '
+        'EXPLAIN (ANALYZE, BUFFERS) on it. With --update the normalized plans are written to the '
+        'snapshot file; otherwise they are compared with it and the command fails when a statement '
+        'turned into a sequential scan or its estimated cost grew past --cost-threshold. '
+        'Needs PostgreSQL and a seeded database (manage.py seed_data).'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--snapshot', default=str(Path(settings.BASE_DIR) / 'explain_snapshots.json'),
+            help='Snapshot file of normalized plans.',
+        )
+        parser.add_argument('--update', action='store_true', help='Write the captured plans as the new snapshot.')
+        parser.add_argument(
+            '--cost-threshold', type=float, default=0.5, help='Allowed estimated cost growth, 0.5 = +50%%.'
+        )
+        parser.add_argument('--user', default='seed_admin', help='Username the requests are made as.')
+        parser.add_argument('--endpoint', action='append', help='Only these endpoint names (repeatable).')
+
+    def handle(self, *args, **options):
+        if connection.vendor != 'postgresql':
+            raise CommandError('EXPLAIN snapshots need PostgreSQL.')
+        user = User.objects.filter(username=options['user']).first()
+        if user is None:
+            raise CommandError(f'User {options["user"]} does not exist, run seed_data first.')
+        payment = Payment.objects.filter(registration_id__user_id=user).select_related(
+            'registration_id__ticket_id'
+        ).first()
+        if payment is None:
+            raise CommandError(f'{user.username} has no paid registration to look up.')
+        ids = {
+            'event': payment.registration_id.ticket_id.event_id_id,
+            'ticket': payment.registration_id.ticket_id_id,
+            'registration': payment.registration_id_id,
+            'payment': payment.pk,
+        }
+
+        client = APIClient()
+        client.force_authenticate(user)
+        current = {}
+        for name, path in ENDPOINTS:
+            if options['endpoint'] and name not in options['endpoint']:
+                continue
+            # Cache dikosongkan supaya query yang biasanya tertutup cache ikut terukur
+            cache.clear()
+            with override_settings(ALLOWED_HOSTS=['*']), CaptureQueriesContext(connection) as queries:
+                response = client.get(path.format(**ids))
+            if response.status_code != 200:
+                raise CommandError(f'{name}: GET {path} answered {response.status_code}.')
+            statements = {}
+            for query in queries.captured_queries:
+                sql = query['sql']
+                if not sql.lstrip().upper().startswith(('SELECT', 'WITH')):
+                    continue
+                statements.setdefault(fingerprint(sql), explain(sql))
+            current[name] = statements
+            self.report(name, statements)
+
+        snapshot_path = Path(options['snapshot'])
+        if options['update']:
+            # Waktu dan buffer berubah tiap run, tidak disimpan supaya diff snapshot tetap bermakna
+            stored = {
+                name: {key: {field: captured[field] for field in ('sql', 'plan', 'cost')} for key, captured in statements.items()}
+                for name, statements in current.items()
+            }
+            snapshot_path.write_text(json.dumps(stored, indent=2, sort_keys=True) + '\n')
+            self.stdout.write(self.style.SUCCESS(f'Wrote {snapshot_path}.'))
+            return
+        if not snapshot_path.exists():
+            raise CommandError(f'{snapshot_path} does not exist, create it with --update.')
+        snapshot = json.loads(snapshot_path.read_text())
+        regressions, notes = compare(snapshot, current, options['cost_threshold'])
+        for note in notes:
+            self.stdout.write(f'note: {note}')
+        if regressions:
+            for regression in regressions:
+                self.stderr.write(f'regression: {regression}')
+            raise CommandError(f'{len(regressions)} plan regression(s) against {snapshot_path}.')
+        self.stdout.write(self.style.SUCCESS('Plans match the snapshot.'))
+
+    def report(self, name, statements):
+        self.stdout.write(name)
+        for key, captured in statements.items():
+            scans = seq_scans(captured['plan'])
+            self.stdout.write(
+                f'  [{key}] cost {captured["cost"]:>10.1f}  {captured["time"] or 0:>8.2f} ms  '
+                f'{captured["buffers"]:>6} buffers  {"seq scan: " + ", ".join(sorted(scans)) if scans else ""}'
+            )
@@ -0,0 +1,316 @@
+import re
+from datetime import datetime, timezone as dt_timezone
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.utils import timezone
+
+from events.models import Event, EventCatalog
+from payments.models import Payment
+from registrations.models import Registration
+
+PARTITION_KEY = 'event_start'
+
+# Urutan penting: registrasi dikonversi dulu, pembayaran dilepas (detach) dulu
+PARTITIONED_MODELS = [Registration, Payment]
+
+# (model, FK column, referenced model): recreated as (column, event_start) -> (id, event_start)
+COMPOSITE_FOREIGN_KEYS = [(Payment, 'registration_id_id', Registration)]
+
+# Materialized view yang membaca tabel di atas; dibuat ulang setelah konversi
+DEPENDENT_VIEWS = [EventCatalog]
+
+MONTH_SUFFIX = re.compile(r'_p(\d{4})_(\d{2})$')
+
+
+def month_start(value):
+    return datetime(value.year, value.month, 1, tzinfo=dt_timezone.utc)
+
+
+def add_months(value, months):
+    month = value.month - 1 + months
+    return value.replace(year=value.year + month // 12, month=month % 12 + 1)
+
+
+def partition_name(table, month):
+    return f'{table}_p{month.year:04d}_{month.month:02d}'
+
+
+def default_partition_name(table):
+    return f'{table}_default'
+
+
+class Command(BaseCommand):
+    help = (
+        'Manages Postgres range partitioning of registrations and payments by event start month. '
+        '"convert" turns the existing tables into partitioned tables (one-off, takes an exclusive lock '
+        'and copies the rows; refused while other tables hold foreign keys to them), "create" adds partitions for upcoming months and scheduled events, '
+        '"detach" detaches (and optionally drops) partitions of past months, "list" shows partitions.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('action', choices=['convert', 'create', 'detach', 'list'])
+        parser.add_argument('--months-ahead', type=int, default=12, help='create: months after the current one.')
+        parser.add_argument('--before', help='detach: partitions of months before YYYY-MM.')
+        parser.add_argument('--drop', action='store_true', help='detach: drop the detached tables.')
+
+    def handle(self, *args, **options):
+        if connection.vendor != 'postgresql':
+            raise CommandError('Table partitioning needs PostgreSQL.')
+        getattr(self, options['action'])(**options)
+
+    # Introspection
+
+    def is_partitioned(self, cursor, table):
+        cursor.execute('SELECT relkind FROM pg_class WHERE oid = to_regclass(%s)', [table])
+        row = cursor.fetchone()
+        return row is not None and row[0] == 'p'
+
+    def partitions(self, cursor, table):
+        cursor.execute(
+            """
+            SELECT child.relname, child.reltuples::bigint
+            FROM pg_inherits
+            JOIN pg_class child ON child.oid = pg_inherits.inhrelid
+            WHERE pg_inherits.inhparent = to_regclass(%s)
+            ORDER BY child.relname
+            """,
+            [table],
+        )
+        return cursor.fetchall()
+
+    def month_partitions(self, cursor, table):
+        months = {}
+        for name, _ in self.partitions(cursor, table):
+            match = MONTH_SUFFIX.search(name)
+            if match:
+                months[datetime(int(match[1]), int(match[2]), 1, tzinfo=dt_timezone.utc)] = name
+        return months
+
+    # Actions
+
+    def referencing_foreign_keys(self, cursor):
+        """
+        (referencing table, constraint, referenced table) of the foreign keys pointing at
+        the tables to partition, except those rebuilt as COMPOSITE_FOREIGN_KEYS.
+        """
+        tables = {model._meta.db_table for model in PARTITIONED_MODELS}
+        rebuilt = {(model._meta.db_table, referenced._meta.db_table) for model, _, referenced in COMPOSITE_FOREIGN_KEYS}
+        blocking = []
+        for table in connection.introspection.table_names(cursor):
+            for name, constraint in connection.introspection.get_constraints(cursor, table).items():
+                referenced = (constraint['foreign_key'] or (None,))[0]
+                if referenced in tables and (table, referenced) not in rebuilt:
+                    blocking.append((table, name, referenced))
+        return blocking
+
+    def convert(self, **options):
+        with transaction.atomic(), connection.cursor() as cursor:
+            # Tabel berpartisi tidak punya unique index pada `id` saja, jadi FK tunggal ke sana
+            # akan hilang dan migrasi yang kemudian menambah FK seperti itu akan gagal
+            blocking = self.referencing_foreign_keys(cursor)
+            if blocking:
+                raise CommandError(
+                    'Foreign keys point at the tables to partition and would be lost: ' +
+                    ', '.join(f'{name} ({referencing} -> {referenced})' for referencing, name, referenced in blocking) +
+                    '. Before converting, make them composite (column, event_start) keys listed in '
+                    'COMPOSITE_FOREIGN_KEYS, or declare the fields with db_constraint=False.'
+                )
+            views = self.drop_dependent_views(cursor)
+            for model in PARTITIONED_MODELS:
+                table = model._meta.db_table
+                if self.is_partitioned(cursor, table):
+                    self.stdout.write(f'{table} is already partitioned.')
+                    continue
+                self.convert_table(cursor, table)
+            for model, column, referenced in COMPOSITE_FOREIGN_KEYS:
+                self.add_composite_foreign_key(cursor, model._meta.db_table, column, referenced._meta.db_table)
+            self.recreate_views(cursor, views)
+        self.stdout.write(self.style.SUCCESS('Conversion finished, run "create" to add partitions ahead.'))
+
+    def convert_table(self, cursor, table):
+        qn = connection.ops.quote_name
+        legacy = f'{table}_legacy'
+        cursor.execute(f'LOCK TABLE {qn(table)} IN ACCESS EXCLUSIVE MODE')
+
+        # The remaining foreign keys to this table are COMPOSITE_FOREIGN_KEYS (see convert),
+        # dropped here and recreated on (column, event_start) afterwards
+        cursor.execute(
+            """
+            SELECT conrelid::regclass::text, conname FROM pg_constraint
+            WHERE confrelid = to_regclass(%s) AND contype = 'f'
+            """,
+            [table],
+        )
+        for referencing, name in cursor.fetchall():
+            cursor.execute(f'ALTER TABLE {referencing} DROP CONSTRAINT {qn(name)}')
+            self.stdout.write(f'  dropped foreign key {name} on {referencing}')
+
+        cursor.execute(
+            "SELECT indexname, indexdef FROM pg_indexes WHERE schemaname = current_schema() AND tablename = %s",
+            [table],
+        )
+        indexes = cursor.fetchall()
+        cursor.execute(
+            """
+            SELECT conname, contype, pg_get_constraintdef(oid) FROM pg_constraint
+            WHERE conrelid = to_regclass(%s) AND contype IN ('f', 'c')
+            """,
+            [table],
+        )
+        constraints = cursor.fetchall()
+
+        cursor.execute(f'ALTER TABLE {qn(table)} RENAME TO {qn(legacy)}')
+        cursor.execute(
+            f'CREATE TABLE {qn(table)} (LIKE {qn(legacy)} INCLUDING DEFAULTS INCLUDING STORAGE) '
+            f'PARTITION BY RANGE ({qn(PARTITION_KEY)})'
+        )
+        cursor.execute(
+            f"SELECT DISTINCT date_trunc('month', {qn(PARTITION_KEY)} AT TIME ZONE 'UTC') FROM {qn(legacy)}"
+        )
+        months = [month.replace(tzinfo=dt_timezone.utc) for month, in cursor.fetchall()]
+        for month in sorted(months):
+            self.create_partition(cursor, table, month)
+        cursor.execute(f'CREATE TABLE {qn(default_partition_name(table))} PARTITION OF {qn(table)} DEFAULT')
+
+        cursor.execute(f'INSERT INTO {qn(table)} SELECT * FROM {qn(legacy)}')
+        self.stdout.write(f'  {table}: copied {cursor.rowcount} rows into {len(months)} monthly partitions')
+        cursor.execute(f'DROP TABLE {qn(legacy)}')
+
+        cursor.execute(f'ALTER TABLE {qn(table)} ADD PRIMARY KEY (id, {qn(PARTITION_KEY)})')
+        for name, definition in indexes:
+            if definition.startswith('CREATE UNIQUE'):
+                # Primary key dan unique(id) tidak bisa dipertahankan tanpa kunci partisi
+                continue
+            definition = re.sub(r' ON (ONLY )?\S+ ', f' ON {qn(table)} ', definition, count=1)
+            cursor.execute(definition)
+        for name, kind, definition in constraints:
+            cursor.execute(f'ALTER TABLE {qn(table)} ADD CONSTRAINT {qn(name)} {definition}')
+
+    def drop_dependent_views(self, cursor):
+        # Tabel lama tidak bisa di-DROP selama masih dibaca materialized view
+        views = []
+        for model in DEPENDENT_VIEWS:
+            view = model._meta.db_table
+            cursor.execute(
+                "SELECT pg_get_viewdef(to_regclass(%s)) WHERE to_regclass(%s) IS NOT NULL", [view, view]
+            )
+            row = cursor.fetchone()
+            if row is None:
+                continue
+            cursor.execute(
+                "SELECT indexdef FROM pg_indexes WHERE schemaname = current_schema() AND tablename = %s", [view]
+            )
+            views.append((view, row[0], [definition for definition, in cursor.fetchall()]))
+            cursor.execute(f'DROP MATERIALIZED VIEW {connection.ops.quote_name(view)}')
+            self.stdout.write(f'  dropped materialized view {view}')
+        return views
+
+    def recreate_views(self, cursor, views):
+        for view, definition, indexes in views:
+            cursor.execute(f'CREATE MATERIALIZED VIEW {connection.ops.quote_name(view)} AS {definition}')
+            for index in indexes:
+                cursor.execute(index)
+            self.stdout.write(f'  recreated materialized view {view}')
+
+    def add_composite_foreign_key(self, cursor, table, column, referenced):
+        qn = connection.ops.quote_name
+        name = f'{table}_{column}_partition_fk'
+        cursor.execute('SELECT 1 FROM pg_constraint WHERE conname = %s', [name])
+        if cursor.fetchone():
+            return
+        cursor.execute(
+            f'ALTER TABLE {qn(table)} ADD CONSTRAINT {qn(name)} '
+            f'FOREIGN KEY ({qn(column)}, {qn(PARTITION_KEY)}) REFERENCES {qn(referenced)} (id, {qn(PARTITION_KEY)}) '
+            f'ON UPDATE CASCADE DEFERRABLE INITIALLY DEFERRED'
+        )
+        self.stdout.write(f'  added foreign key {name}')
+
+    def create_partition(self, cursor, table, month):
+        qn = connection.ops.quote_name
+        name = partition_name(table, month)
+        cursor.execute(
+            f'CREATE TABLE {qn(name)} PARTITION OF {qn(table)} FOR VALUES FROM (%s) TO (%s)',
+            [month, add_months(month, 1)],
+        )
+        self.stdout.write(f'  created {name}')
+
+    def create(self, months_ahead, **options):
+        current = month_start(timezone.now())
+        wanted = {add_months(current, offset) for offset in range(months_ahead + 1)}
+        wanted.update(
+            month_start(start)
+            for start in Event.objects.filter(start_time__gte=current).values_list('start_time', flat=True).distinct()
+        )
+        qn = connection.ops.quote_name
+        with connection.cursor() as cursor:
+            for model in PARTITIONED_MODELS:
+                if not self.is_partitioned(cursor, model._meta.db_table):
+                    raise CommandError(f'{model._meta.db_table} is not partitioned yet, run "convert" first.')
+            for month in sorted(wanted):
+                with transaction.atomic():
+                    moved = []
+                    for model in PARTITIONED_MODELS:
+                        table = model._meta.db_table
+                        if month in self.month_partitions(cursor, table):
+                            continue
+                        # Baris yang sudah terlanjur masuk partisi default dipindahkan ke partisi barunya.
+                        # FK antar tabel ditunda (DEFERRED) sampai commit, jadi urutan pindahnya aman.
+                        default = default_partition_name(table)
+                        bounds = [month, add_months(month, 1)]
+                        cursor.execute(
+                            f'CREATE TEMPORARY TABLE moving ON COMMIT DROP AS SELECT * FROM {qn(default)} '
+                            f'WHERE {qn(PARTITION_KEY)} >= %s AND {qn(PARTITION_KEY)} < %s',
+                            bounds,
+                        )
+                        if cursor.rowcount:
+                            cursor.execute(
+                                f'DELETE FROM {qn(default)} WHERE {qn(PARTITION_KEY)} >= %s AND {qn(PARTITION_KEY)} < %s',
+                                bounds,
+                            )
+                        self.create_partition(cursor, table, month)
+                        cursor.execute(f'INSERT INTO {qn(table)} SELECT * FROM moving')
+                        moved.append(cursor.rowcount)
+                        cursor.execute('DROP TABLE moving')
+                    if any(moved):
+                        self.stdout.write(f'  moved {sum(moved)} rows out of the default partitions')
+        self.stdout.write(self.style.SUCCESS('Partitions are in place.'))
+
+    def detach(self, before, drop, **options):
+        if not before:
+            raise CommandError('detach needs --before YYYY-MM.')
+        try:
+            cutoff = datetime.strptime(before, '%Y-%m').replace(tzinfo=dt_timezone.utc)
+        except ValueError:
+            raise CommandError('--before must look like 2025-01.')
+        qn = connection.ops.quote_name
+        with connection.cursor() as cursor:
+            # Pembayaran dulu: partisi registrasi tidak bisa dilepas selama masih dirujuk
+            for model in reversed(PARTITIONED_MODELS):
+                table = model._meta.db_table
+                for month, name in sorted(self.month_partitions(cursor, table).items()):
+                    if month >= cutoff:
+                        continue
+                    with transaction.atomic():
+                        cursor.execute(f'ALTER TABLE {qn(table)} DETACH PARTITION {qn(name)}')
+                        cursor.execute(
+                            "SELECT conname FROM pg_constraint WHERE conrelid = to_regclass(%s) AND contype = 'f'",
+                            [name],
+                        )
+                        for constraint, in cursor.fetchall():
+                            cursor.execute(f'ALTER TABLE {qn(name)} DROP CONSTRAINT {qn(constraint)}')
+                        if drop:
+                            cursor.execute(f'DROP TABLE {qn(name)}')
+                    self.stdout.write(f'  {"dropped" if drop else "detached"} {name}')
+        self.stdout.write(self.style.SUCCESS(f'Partitions before {before} are {"dropped" if drop else "detached"}.'))
+
+    def list(self, **options):
+        with connection.cursor() as cursor:
+            for model in PARTITIONED_MODELS:
+                table = model._meta.db_table
+                if not self.is_partitioned(cursor, table):
+                    self.stdout.write(f'{table}: not partitioned')
+                    continue
+                self.stdout.write(f'{table}:')
+                for name, rows in self.partitions(cursor, table):
+                    self.stdout.write(f'  {name:<50} ~{max(rows, 0)} rows')
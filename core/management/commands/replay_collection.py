@@ -0,0 +1,85 @@
+import asyncio
+import json
+from pathlib import Path
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from core.loadgen import load_environment, load_steps, percentile, replay
+
+COLLECTIONS = Path(settings.BASE_DIR) / 'collections'
+
+
+class Command(BaseCommand):
+    help = (
+        'Replays a Postman collection against a running server with concurrent virtual users '
+        '(asyncio, keep-alive connections). Every user logs in and runs the flows with its own '
+        'captured tokens and ids. Reports latency percentiles and the error rate per step; '
+        "an error is a failed request or a status other than the one the step's test expects. "
+        '429 responses are counted separately: the server throttles logins per IP '
+        '(THROTTLE_RATE_LOGIN, 10/min by default), so for more than a handful of users start it '
+        'with higher THROTTLE_RATE_* values, e.g. THROTTLE_RATE_LOGIN=100000/min.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            'collection', nargs='?',
+            default=str(COLLECTIONS / '[788] DicoEvent-versi-1.postman_collection_new.json'),
+        )
+        parser.add_argument(
+            '--environment', default=str(COLLECTIONS / '[788] DicoEvent.postman_environment.json'),
+            help='Postman environment file with the initial variables.',
+        )
+        parser.add_argument('--base-url', help='Overrides scheme, host and port of every request, e.g. http://localhost:8000.')
+        parser.add_argument('--users', type=int, default=10, help='Concurrent virtual users.')
+        parser.add_argument('--iterations', type=int, default=1, help='Collection runs per user.')
+        parser.add_argument('--folder', action='append', help='Only top-level folders containing this text (repeatable); keep the one that logs in, e.g. Users.')
+        parser.add_argument('--var', action='append', default=[], help='Override a variable, KEY=VALUE (repeatable).')
+        parser.add_argument('--timeout', type=float, default=30, help='Seconds per request.')
+
+    def handle(self, *args, **options):
+        try:
+            collection = json.loads(Path(options['collection']).read_text())
+            variables = load_environment(json.loads(Path(options['environment']).read_text()))
+        except (OSError, ValueError) as exc:
+            raise CommandError(exc)
+        for assignment in options['var']:
+            key, separator, value = assignment.partition('=')
+            if not separator:
+                raise CommandError(f'--var expects KEY=VALUE, got {assignment!r}.')
+            variables[key] = value
+
+        steps = load_steps(collection, options['folder'])
+        if not steps:
+            raise CommandError('No requests selected.')
+        stats, elapsed = asyncio.run(replay(
+            steps, variables, options['base_url'], options['users'], options['iterations'], options['timeout'],
+        ))
+
+        self.stdout.write(
+            f'{"step":<60} {"n":>6} {"err %":>6} {"429 %":>6} {"p50 ms":>8} {"p95 ms":>8} {"p99 ms":>8} {"max ms":>8}'
+        )
+        requests = errors = throttled = 0
+        for name, step_stats in stats.items():
+            latencies = sorted(step_stats.latencies)
+            requests += step_stats.requests
+            errors += step_stats.errors
+            throttled += step_stats.throttled
+            self.stdout.write(
+                f'{name[-60:]:<60} {step_stats.requests:>6} '
+                f'{step_stats.errors / step_stats.requests * 100 if step_stats.requests else 0:>6.1f} '
+                f'{step_stats.throttled / step_stats.requests * 100 if step_stats.requests else 0:>6.1f} '
+                f'{percentile(latencies, 0.50):>8.1f} {percentile(latencies, 0.95):>8.1f} '
+                f'{percentile(latencies, 0.99):>8.1f} {latencies[-1] if latencies else 0:>8.1f}'
+            )
+        summary = (
+            f'{requests} requests by {options["users"]} users in {elapsed:.1f}s '
+            f'({requests / elapsed:.0f} req/s), {errors} errors ({errors / requests * 100 if requests else 0:.1f}%)'
+        )
+        self.stdout.write(self.style.ERROR(summary) if errors else self.style.SUCCESS(summary))
+        if throttled:
+            self.stdout.write(self.style.WARNING(
+                f'{throttled} requests were throttled (429), and steps after a throttled login fail for lack '
+                'of a token. Raise THROTTLE_RATE_LOGIN / THROTTLE_RATE_USER / THROTTLE_RATE_ANON / '
+                'THROTTLE_RATE_REGISTRATIONS on the server under test for load runs.'
+            ))
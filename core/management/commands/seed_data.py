@@ -0,0 +1,134 @@
+import random
+import uuid
+from datetime import timedelta
+
+from django.contrib.auth.hashers import make_password
+from django.contrib.auth.models import Group
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+from django.utils import timezone
+
+from core.models import User
+from events.models import Event
+from payments.models import Payment
+from registrations.models import Registration
+from tickets.models import Ticket
+
+PASSWORD = '1234qwer!@#$'
+
+BATCH_SIZE = 5000
+
+NAMES = ['Ani', 'Budi', 'Citra', 'Dewi', 'Eko', 'Fajar', 'Gita', 'Hadi', 'Indah', 'Joko', 'Kartika', 'Lestari']
+
+CITIES = ['Jakarta', 'Bandung', 'Surabaya', 'Yogyakarta', 'Medan', 'Makassar', 'Denpasar', 'Semarang']
+
+
+class Command(BaseCommand):
+    help = (
+        'Fills the database with a synthetic dataset: users, events spread over a year, tickets, '
+        'registrations and payments, plus the "seed_admin" superuser who also registers for events. '
+        'Rows are bulk inserted, so no signals are sent. Used for EXPLAIN snapshots and benchmarks.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--users', type=int, default=10_000)
+        parser.add_argument('--events', type=int, default=1_000)
+        parser.add_argument('--tickets-per-event', type=int, default=3)
+        parser.add_argument('--registrations', type=int, default=100_000)
+        parser.add_argument('--paid', type=float, default=0.8, help='Share of registrations with a payment.')
+        parser.add_argument('--seed', type=int, default=0, help='Random seed, for repeatable datasets.')
+
+    def handle(self, *args, **options):
+        rng = random.Random(options['seed'])
+        # Username unik per run (di luar --seed), supaya seed bisa dijalankan berulang kali
+        tag = uuid.uuid4().hex[:6]
+        now = timezone.now()
+        password = make_password(PASSWORD)
+
+        with transaction.atomic():
+            for name in ('admin', 'organizer', 'user'):
+                Group.objects.get_or_create(name=name)
+            admin, created = User.objects.get_or_create(
+                username='seed_admin',
+                defaults={'is_superuser': True, 'is_staff': True, 'password': password, 'email': 'seed_admin@dicoding.com'},
+            )
+
+            users = [admin] + User.objects.bulk_create(
+                [
+                    User(
+                        username=f'seed_{tag}_{index}',
+                        email=f'seed_{tag}_{index}@dicoding.com',
+                        first_name=rng.choice(NAMES),
+                        last_name=rng.choice(NAMES),
+                        password=password,
+                    )
+                    for index in range(options['users'])
+                ],
+                batch_size=BATCH_SIZE,
+            )
+            organizers = users[:max(1, len(users) // 100)]
+            Group.objects.get(name='organizer').user_set.add(*organizers)
+
+            events = []
+            for index in range(options['events']):
+                start = now + timedelta(days=rng.randint(-180, 180), hours=rng.randint(8, 20))
+                events.append(Event(
+                    name=f'Event {tag} {index}',
+                    description='Seeded event',
+                    location=rng.choice(CITIES),
+                    start_time=start,
+                    end_time=start + timedelta(hours=3),
+                    status='scheduled',
+                    quota=options['tickets_per_event'] * 1000,
+                    category=rng.choice(['conference', 'workshop', 'concert', 'meetup']),
+                    organizer_id=rng.choice(organizers),
+                ))
+            Event.objects.bulk_create(events, batch_size=BATCH_SIZE)
+
+            tickets = Ticket.objects.bulk_create(
+                [
+                    Ticket(
+                        name=f'Tier {tier}',
+                        price=rng.choice([0, 50_000, 150_000, 500_000]),
+                        sales_start=event.start_time - timedelta(days=60),
+                        sales_end=event.start_time,
+                        quota=1000,
+                        event_id=event,
+                    )
+                    for event in events
+                    for tier in range(options['tickets_per_event'])
+                ],
+                batch_size=BATCH_SIZE,
+            )
+
+            registrations = []
+            for _ in range(options['registrations']):
+                ticket = rng.choice(tickets)
+                registrations.append(Registration(
+                    ticket_id=ticket, user_id=rng.choice(users), event_start=ticket.event_id.start_time,
+                ))
+            Registration.objects.bulk_create(registrations, batch_size=BATCH_SIZE)
+
+            payments = [
+                Payment(
+                    payment_method=rng.choice(['QRIS', 'bank_transfer', 'credit_card']),
+                    payment_status=rng.choices(Payment.STATUSES, weights=[10, 80, 5, 5])[0],
+                    amount_paid=registration.ticket_id.price,
+                    registration_id=registration,
+                    event_start=registration.event_start,
+                )
+                for registration in registrations
+                if rng.random() < options['paid']
+            ]
+            Payment.objects.bulk_create(payments, batch_size=BATCH_SIZE)
+
+        if connection.vendor == 'postgresql':
+            # Statistik planner harus mengenal data baru sebelum EXPLAIN
+            with connection.cursor() as cursor:
+                cursor.execute('ANALYZE')
+
+        self.stdout.write(self.style.SUCCESS(
+            f'Seeded {len(users) - 1} users, {len(events)} events, {len(tickets)} tickets, '
+            f'{len(registrations)} registrations and {len(payments)} payments '
+            f'(login as seed_admin / {PASSWORD}{"" if created else ", existing password kept"}).'
+        ))
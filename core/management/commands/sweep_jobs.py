@@ -0,0 +1,21 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from core.jobs import fail_stale_jobs
+
+
+class Command(BaseCommand):
+    help = (
+        'Marks pending/running jobs whose worker died (no heartbeat for --stale-after seconds, '
+        'default JOB_STALE_AFTER) as failed. Run it periodically, e.g. from cron.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--stale-after', type=int, default=None)
+
+    def handle(self, *args, **options):
+        stale_after = options['stale_after'] or settings.JOB_STALE_AFTER
+        job_ids = fail_stale_jobs(stale_after)
+        for job_id in job_ids:
+            self.stdout.write(f'  failed job {job_id}')
+        self.stdout.write(self.style.SUCCESS(f'{len(job_ids)} stale jobs marked failed.'))
@@ -0,0 +1,59 @@
+from django.conf import settings
+from django.utils.cache import patch_vary_headers
+from django.utils.deprecation import MiddlewareMixin
+
+from core.compression import available_codecs, negotiate
+
+# Hanya format data API; HTML (admin, browsable API) memuat token CSRF di samping input
+# dari request, kombinasi yang dibutuhkan serangan BREACH
+COMPRESSIBLE_TYPES = ('application/json', 'application/msgpack', 'application/x-msgpack')
+
+
+class CompressionMiddleware(MiddlewareMixin):
+    """
+    Compresses API responses with the best encoding both sides support: zstd, br
+    or gzip (RESPONSE_COMPRESSION_ENCODINGS, in that order by default). Bodies under
+    RESPONSE_COMPRESSION_MIN_SIZE bytes are sent as they are, since the headers and
+    CPU would cost more than they save. Streaming responses are compressed chunk by
+    chunk, each chunk flushed so the client can decode it on arrival.
+
+    Only JSON and MessagePack responses are compressed. HTML pages (/admin/, the
+    browsable API) embed CSRF tokens next to reflected input, which is what
+    BREACH-style attacks need, so they are left alone, as is any response that
+    sets a cookie. Do not put secrets into JSON bodies that also echo request input.
+    """
+    def __init__(self, get_response):
+        super().__init__(get_response)
+        self.codecs = available_codecs()
+
+    def process_response(self, request, response):
+        content_type = response.get('Content-Type', '').split(';')[0].strip()
+        if response.has_header('Content-Encoding') or not content_type.startswith(COMPRESSIBLE_TYPES):
+            return response
+        if response.cookies:
+            return response
+        patch_vary_headers(response, ('Accept-Encoding',))
+        codec = negotiate(request.META.get('HTTP_ACCEPT_ENCODING'), self.codecs)
+        if codec is None:
+            return response
+
+        if response.streaming:
+            if getattr(response, 'is_async', False):
+                return response
+            response.streaming_content = codec.stream(response.streaming_content)
+            del response['Content-Length']
+        else:
+            if len(response.content) < settings.RESPONSE_COMPRESSION_MIN_SIZE:
+                return response
+            compressed = codec.compress(response.content)
+            if len(compressed) >= len(response.content):
+                return response
+            response.content = compressed
+            response['Content-Length'] = str(len(compressed))
+
+        # Isi berubah byte-per-byte, jadi ETag kuat diturunkan menjadi ETag lemah
+        etag = response.get('ETag')
+        if etag and etag.startswith('"'):
+            response['ETag'] = f'W/{etag}'
+        response['Content-Encoding'] = codec.name
+        return response
@@ -0,0 +1,20 @@
+# Generated by Django 4.2 on 2026-10-19 15:10
+
+import core.models
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0004_user_search'),
+    ]
+
+    operations = [
+        migrations.AlterModelManagers(
+            name='user',
+            managers=[
+                ('objects', core.models.CachedUserManager()),
+            ],
+        ),
+    ]
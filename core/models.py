@@ -1,13 +1,61 @@
-from django.db import models
-from django.contrib.auth.models import AbstractUser
-import uuid
+from django.db import models, transaction
+from django.db.models.functions import Upper
+from django.contrib.auth.models import AbstractUser, UserManager
+from django.contrib.postgres.indexes import GinIndex, OpClass
+
+from core.ids import new_id
 
 # Create your models here.
+class UserQuerySet(models.QuerySet):
+    def update(self, **kwargs):
+        # UPDATE massal tidak mengirim post_save, jadi cache autentikasi dibuang di sini
+        from core.authentication import forget_cached_users
+        user_ids = list(self.values_list('pk', flat=True))
+        updated = super().update(**kwargs)
+        transaction.on_commit(lambda: forget_cached_users(user_ids))
+        return updated
+
+class CachedUserManager(UserManager.from_queryset(UserQuerySet)):
+    pass
+
 class User(AbstractUser):
-    id = models.UUIDField(default=uuid.uuid4, unique=True, primary_key=True, editable=False)
+    id = models.UUIDField(default=new_id, unique=True, primary_key=True, editable=False)
+
+    objects = CachedUserManager()
 
     def __str__(self):
         return self.username
 
     class Meta:
-        db_table = 'users'
\ No newline at end of file
+        db_table = 'users'
+        # Trigram index untuk pencarian: icontains di Postgres menjadi UPPER(kolom) LIKE UPPER('%q%')
+        indexes = [
+            GinIndex(OpClass(Upper(field), name='gin_trgm_ops'), name=f'user_{field}_trgm')
+            for field in ('username', 'email', 'first_name', 'last_name')
+        ]
+
+class Job(models.Model):
+    """
+    Handle for work that runs after the response, e.g. deleting a large event.
+    """
+    STATUS_PENDING = 'pending'
+    STATUS_RUNNING = 'running'
+    STATUS_DONE = 'done'
+    STATUS_FAILED = 'failed'
+    STATUS_CHOICES = [
+        (STATUS_PENDING, 'Pending'),
+        (STATUS_RUNNING, 'Running'),
+        (STATUS_DONE, 'Done'),
+        (STATUS_FAILED, 'Failed'),
+    ]
+
+    id = models.UUIDField(primary_key=True, default=new_id, editable=False)
+    kind = models.CharField(max_length=50)
+    status = models.CharField(max_length=25, choices=STATUS_CHOICES, default=STATUS_PENDING)
+    progress = models.JSONField(default=dict, blank=True)
+    error = models.TextField(blank=True)
+    user_id = models.ForeignKey(User, on_delete=models.SET_NULL, null=True, blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    # Detak terakhir job; job pending/running yang lama tidak berdetak dianggap mati (sweep_jobs)
+    updated_at = models.DateTimeField(auto_now=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
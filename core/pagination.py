@@ -0,0 +1,23 @@
+from rest_framework.pagination import CursorPagination
+
+
+class KeysetPagination(CursorPagination):
+    """
+    Cursor (keyset) pagination on the primary key: each page is `WHERE pk > cursor
+    ORDER BY pk LIMIT n`, so with an index ending in `id` a page costs the same at the
+    first row as at the millionth. `?limit=` picks the page size.
+
+    The order is by id, not chronological: uuid7 ids (core.ids.new_id) follow creation
+    time, but rows created before the switch to uuid7, or with PRIMARY_KEY_UUID_VERSION=4,
+    have random uuid4 ids and come in no particular order.
+    """
+    ordering = 'pk'
+    page_size = 20
+    page_size_query_param = 'limit'
+    max_page_size = 100
+
+    def get_page_links(self):
+        return {
+            'next': self.get_next_link(),
+            'previous': self.get_previous_link(),
+        }
@@ -1,5 +1,14 @@
 from rest_framework.permissions import BasePermission
 
+def has_role(user, name):
+    """
+    Checks group membership through the role names cached on the user by
+    CachedJWTAuthentication, loading them at most once per request otherwise.
+    """
+    if not hasattr(user, 'role_names'):
+        user.role_names = frozenset(user.groups.values_list('name', flat=True))
+    return name in user.role_names
+
 class IsSuperUser(BasePermission):
     """
     Allows access to superusers.
@@ -12,14 +21,14 @@ class IsAdmin(BasePermission):
     Allows access to admin.
     """
     def has_permission(self, request, view):
-        return request.user and request.user.is_authenticated and request.user.groups.filter(name='admin').exists()
+        return request.user and request.user.is_authenticated and has_role(request.user, 'admin')
 
 class IsOrganizer(BasePermission):
     """
     Allows access to organizer.
     """
     def has_permission(self, request, view):
-        return request.user and request.user.is_authenticated and request.user.groups.filter(name='organizer').exists()
+        return request.user and request.user.is_authenticated and has_role(request.user, 'organizer')
 
 class IsAdminOrSuperUser(BasePermission):
     """
@@ -29,7 +38,7 @@ class IsAdminOrSuperUser(BasePermission):
       return (
           request.user and request.user.is_authenticated and (
               request.user.is_superuser or
-              request.user.groups.filter(name='admin').exists()
+              has_role(request.user, 'admin')
           )
       )
 
@@ -41,8 +50,8 @@ class IsAdminOrOrganizerOrSuperUser(BasePermission):
       return (
           request.user and request.user.is_authenticated and (
               request.user.is_superuser or
-              request.user.groups.filter(name='admin').exists() or
-              request.user.groups.filter(name='organizer').exists()
+              has_role(request.user, 'admin') or
+              has_role(request.user, 'organizer')
           )
       )
 
@@ -54,8 +63,33 @@ class IsOwnerOrAdminOrSuperUser(BasePermission):
         return (
             request.user and request.user.is_authenticated and (
                 request.user.is_superuser or
-                request.user.groups.filter(name='admin').exists() or
+                has_role(request.user, 'admin') or
                 obj == request.user
             )
         )
 
+class IsRegistrantOrAdminOrSuperUser(BasePermission):
+    """
+    Allows access to the user an object belongs to (through its `user_id`), admin, and superusers.
+    """
+    def has_object_permission(self, request, view, obj):
+        return (
+            request.user and request.user.is_authenticated and (
+                request.user.is_superuser or
+                has_role(request.user, 'admin') or
+                obj.user_id_id == request.user.pk
+            )
+        )
+
+class IsEventOrganizerOrAdminOrSuperUser(BasePermission):
+    """
+    Allows access to the organizer of an event (through its `organizer_id`), admin, and superusers.
+    """
+    def has_object_permission(self, request, view, obj):
+        return (
+            request.user and request.user.is_authenticated and (
+                request.user.is_superuser or
+                has_role(request.user, 'admin') or
+                obj.organizer_id_id == request.user.pk
+            )
+        )
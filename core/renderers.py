@@ -0,0 +1,76 @@
+import decimal
+
+from rest_framework.renderers import BaseRenderer, JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+
+class _Fallback(Exception):
+    pass
+
+
+class FastJSONRenderer(JSONRenderer):
+    """
+    JSONRenderer backed by orjson when it is installed, producing the same bytes as
+    DRF's JSONRenderer: datetimes, dates and times go through DRF's encoder, and
+    UUIDs, strings, ints and decimals are written identically by orjson. Payloads
+    orjson would write differently (decimals outside 1e-4..1e16, ints beyond 64 bits,
+    indented output) are rendered by the stdlib path. Plain floats match the stdlib
+    only inside that same range; none of our models have float fields.
+    """
+    _encoder = JSONEncoder()
+
+    def _default(self, obj):
+        if isinstance(obj, decimal.Decimal):
+            value = float(obj)
+            if value == 0 or 1e-4 <= abs(value) < 1e16:
+                return value
+            raise _Fallback
+        return self._encoder.default(obj)
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        renderer_context = renderer_context or {}
+        if (
+            orjson is None or data is None or self.ensure_ascii or not self.compact
+            or self.get_indent(accepted_media_type, renderer_context)
+        ):
+            return super().render(data, accepted_media_type, renderer_context)
+        try:
+            ret = orjson.dumps(
+                data,
+                default=self._default,
+                option=orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME,
+            )
+        except (orjson.JSONEncodeError, _Fallback):
+            return super().render(data, accepted_media_type, renderer_context)
+        # Sama seperti JSONRenderer: escape U+2028/U+2029 agar aman di dalam <script>
+        return ret.replace(b'\xe2\x80\xa8', b'\\u2028').replace(b'\xe2\x80\xa9', b'\\u2029')
+
+
+class MessagePackRenderer(BaseRenderer):
+    """
+    application/msgpack (or `?format=msgpack`): the data the JSON renderer would
+    send, in a binary encoding that is smaller and cheaper to parse on mobile
+    clients. Values DRF's JSON encoder turns into strings or numbers (datetimes,
+    UUIDs, decimals, lazy translations) are converted the same way. Only listed
+    in DEFAULT_RENDERER_CLASSES when msgpack is installed.
+    """
+    media_type = 'application/msgpack'
+    format = 'msgpack'
+    charset = None
+    render_style = 'binary'
+    _encoder = JSONEncoder()
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+        return msgpack.packb(data, default=self._encoder.default, use_bin_type=True)
@@ -0,0 +1,31 @@
+from django.db import transaction
+
+from core.authentication import forget_cached_users
+from core.models import User
+
+
+def assign_roles(pairs):
+    """
+    Adds users to groups with one INSERT into the User.groups table for the
+    (user_id, group_id) pairs that are not memberships yet, and returns how many
+    were added. Pairs inserted concurrently by another request are still skipped by
+    the unique constraint. bulk_create sends no m2m_changed, so the cached users are
+    forgotten here.
+    """
+    Membership = User.groups.through
+    pairs = set(pairs)
+    with transaction.atomic():
+        existing = set(
+            Membership.objects.filter(
+                user_id__in={user_id for user_id, _ in pairs}, group_id__in={group_id for _, group_id in pairs}
+            ).values_list('user_id', 'group_id')
+        )
+        added = pairs - existing
+        Membership.objects.bulk_create(
+            [Membership(user_id=user_id, group_id=group_id) for user_id, group_id in added],
+            batch_size=1000,
+            ignore_conflicts=True,
+        )
+        user_ids = {user_id for user_id, _ in added}
+        transaction.on_commit(lambda: forget_cached_users(user_ids))
+    return len(added)
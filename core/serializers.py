@@ -1,15 +1,22 @@
+from django.conf import settings
 from rest_framework import serializers
 from rest_framework.reverse import reverse
 from django.contrib.auth.hashers import make_password
 from django.contrib.auth.models import Group
-from core.models import User
+from rest_framework_simplejwt.exceptions import AuthenticationFailed
+from rest_framework_simplejwt.serializers import TokenRefreshSerializer
+from rest_framework_simplejwt.settings import api_settings
+from core.authentication import get_cached_user
+from core.fieldsets import SparseFieldsetMixin, SparseListSerializer
+from core.models import Job, User
 
-class UserSerializer(serializers.HyperlinkedModelSerializer):
+class UserSerializer(SparseFieldsetMixin, serializers.HyperlinkedModelSerializer):
     _links = serializers.SerializerMethodField()
 
     class Meta:
         model = User
         fields = ['id', 'username', 'email', 'first_name', 'last_name', 'password', '_links']
+        list_serializer_class = SparseListSerializer
         extra_kwargs = {
             'password': {'write_only': True}
         }
@@ -62,6 +69,15 @@ class UserSerializer(serializers.HyperlinkedModelSerializer):
             }
         ]
 
+class UserSearchSerializer(UserSerializer):
+    """
+    A user with the names of its groups, read from prefetched groups.
+    """
+    groups = serializers.SlugRelatedField(many=True, read_only=True, slug_field='name')
+
+    class Meta(UserSerializer.Meta):
+        fields = ['id', 'username', 'email', 'first_name', 'last_name', 'groups', '_links']
+
 class GroupSerializer(serializers.HyperlinkedModelSerializer):
     _links = serializers.SerializerMethodField()
 
@@ -99,5 +115,79 @@ class GroupSerializer(serializers.HyperlinkedModelSerializer):
         ]
 
 class AssignRoleSerializer(serializers.Serializer):
-    user_id = serializers.IntegerField()
-    group_id = serializers.IntegerField()
\ No newline at end of file
+    user_id = serializers.UUIDField()
+    group_id = serializers.IntegerField()
+
+class BulkAssignRoleSerializer(serializers.Serializer):
+    """
+    Many (user_id, group_id) pairs at once. Unknown users and groups are found with
+    one query per model and reported together.
+    """
+    assignments = AssignRoleSerializer(many=True, allow_empty=False, max_length=settings.ROLE_ASSIGNMENT_LIMIT)
+
+    def validate_assignments(self, assignments):
+        errors = {}
+        for field, model in (('user_id', User), ('group_id', Group)):
+            wanted = {assignment[field] for assignment in assignments}
+            missing = wanted - set(model.objects.filter(pk__in=wanted).values_list('pk', flat=True))
+            if missing:
+                errors[field] = [f'{model.__name__} {pk} does not exist.' for pk in sorted(missing, key=str)]
+        if errors:
+            raise serializers.ValidationError(errors)
+        return assignments
+
+class BatchIdsSerializer(serializers.Serializer):
+    """
+    Ids of a multi-get request, in the order the results are returned.
+    """
+    ids = serializers.ListField(child=serializers.UUIDField(), allow_empty=False, max_length=settings.BATCH_GET_LIMIT)
+
+class JobSerializer(serializers.HyperlinkedModelSerializer):
+    user_id = serializers.PrimaryKeyRelatedField(read_only=True)
+    _links = serializers.SerializerMethodField()
+
+    class Meta:
+        model = Job
+        fields = ['id', 'kind', 'status', 'progress', 'error', 'user_id', 'created_at', 'finished_at', '_links']
+
+    def get__links(self, obj):
+        request = self.context.get('request')
+        return [
+            {
+                "rel": "self",
+                "href": reverse('job-detail', kwargs={'pk': obj.pk}, request=request),
+                "action": "GET",
+                "types": ["application/json"]
+            }
+        ]
+
+class CachedTokenRefreshSerializer(TokenRefreshSerializer):
+    """
+    Same as TokenRefreshSerializer, but the token's user comes from the auth cache
+    instead of a fresh query on every refresh, and a deleted user is rejected
+    instead of raising an error.
+    """
+    def validate(self, attrs):
+        refresh = self.token_class(attrs['refresh'])
+
+        user_id = refresh.payload.get(api_settings.USER_ID_CLAIM, None)
+        if user_id and not api_settings.USER_AUTHENTICATION_RULE(get_cached_user(user_id)):
+            raise AuthenticationFailed(self.error_messages['no_active_account'], 'no_active_account')
+
+        data = {'access': str(refresh.access_token)}
+
+        if api_settings.ROTATE_REFRESH_TOKENS:
+            if api_settings.BLACKLIST_AFTER_ROTATION:
+                try:
+                    refresh.blacklist()
+                except AttributeError:
+                    pass
+
+            refresh.set_jti()
+            refresh.set_exp()
+            refresh.set_iat()
+            refresh.outstand()
+
+            data['refresh'] = str(refresh)
+
+        return data
@@ -0,0 +1,28 @@
+from django.contrib.auth.models import Group
+from django.db.models.signals import m2m_changed, post_delete, post_save, pre_delete
+from django.dispatch import receiver
+
+from core.authentication import forget_cached_users
+from core.models import User
+
+
+@receiver([post_save, post_delete], sender=User)
+def forget_user(sender, instance, **kwargs):
+    forget_cached_users([instance.pk])
+
+
+@receiver(m2m_changed, sender=User.groups.through)
+def forget_user_roles(sender, instance, action, reverse, pk_set, **kwargs):
+    if not reverse:
+        if action.startswith('post_'):
+            forget_cached_users([instance.pk])
+    elif action == 'pre_clear':
+        # Dari sisi Group, anggota harus diambil sebelum relasinya dihapus
+        forget_cached_users(instance.user_set.values_list('pk', flat=True))
+    elif action in ('post_add', 'post_remove'):
+        forget_cached_users(pk_set)
+
+
+@receiver([post_save, pre_delete], sender=Group)
+def forget_group_members(sender, instance, **kwargs):
+    forget_cached_users(instance.user_set.values_list('pk', flat=True))
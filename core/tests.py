@@ -1,3 +1,391 @@
-from django.test import TestCase
+import uuid
+from datetime import date, datetime, time, timedelta, timezone as dt_timezone
+from decimal import Decimal
+from unittest import mock
 
-# Create your tests here.
+from django.contrib.auth.models import Group
+from django.core.cache import cache
+from django.db import connection
+from django.http import HttpResponse, StreamingHttpResponse
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.utils import timezone
+from rest_framework.renderers import JSONRenderer
+from rest_framework.request import Request
+from rest_framework.test import APIClient, APIRequestFactory
+
+from core.authentication import _user_cache_key, get_cached_user
+from core.bulk import cascade_delete
+from core.compiled import compile_serializer
+from core.compression import GzipCodec, negotiate
+from core.explain import compare, normalize_sql, plan_shape
+from core.jobs import fail_stale_jobs
+from core.management.commands import manage_partitions
+from core.middleware import CompressionMiddleware
+from core.models import Job, User
+from core.renderers import FastJSONRenderer
+from core.serializers import UserSerializer
+from core.throttling import ScopedTokenBucketThrottle
+from events.models import Event
+from events.serializers import EventSerializer
+from payments.models import Payment
+from payments.serializers import PaymentSerializer
+from registrations.models import CheckIn, Registration, WaitlistEntry
+from registrations.serializers import RegistrationSerializer
+from tickets.models import Ticket
+from tickets.serializers import TicketSerializer
+
+
+class CompiledSerializerTest(TestCase):
+    """
+    Differential tests: the compiled list path must produce exactly what the regular
+    serializer produces for each instance, for full, sparse and compact field sets.
+    """
+    cases = [
+        (Event, EventSerializer),
+        (Ticket, TicketSerializer),
+        (Registration, RegistrationSerializer),
+        (Payment, PaymentSerializer),
+        (User, UserSerializer),
+    ]
+
+    @classmethod
+    def setUpTestData(cls):
+        now = timezone.now()
+        organizer = User.objects.create_user('organizer', 'organizer@example.com', 'secret', first_name='Örgänizer')
+        for i in range(3):
+            event = Event.objects.create(
+                name=f'Event {i}', description='Deskripsi   acara' if i else '', location='Jakarta',
+                start_time=now, end_time=now, status='scheduled', quota=100 + i, category='music',
+                organizer_id=organizer,
+            )
+            ticket = Ticket.objects.create(
+                name=f'Ticket {i}', price=150000 * i, sales_start=now, sales_end=now,
+                quota=10, event_id=event,
+            )
+            registration = Registration.objects.create(ticket_id=ticket, user_id=organizer)
+            Payment.objects.create(
+                registration_id=registration, payment_method='QRIS', payment_status='pending',
+                amount_paid=150000 * i,
+            )
+
+    def setUp(self):
+        self.context = {'request': Request(APIRequestFactory().get('/api/'))}
+
+    def fieldsets(self, serializer_class):
+        names = list(serializer_class(context=self.context).fields)
+        return [{}, {'compact': True}, {'fields': names[:2]}, {'fields': names[-2:]}, {'exclude': names[1:3]}]
+
+    def test_compiled_output_matches_serializer(self):
+        for model, serializer_class in self.cases:
+            for fieldset in self.fieldsets(serializer_class):
+                with self.subTest(serializer=serializer_class.__name__, **fieldset):
+                    queryset = model.objects.order_by('pk')
+                    expected = [serializer_class(obj, context=self.context, **fieldset).data for obj in queryset]
+                    serializer = serializer_class(queryset, many=True, context=self.context, **fieldset)
+                    compile_serializer(serializer.child)
+                    self.assertEqual([dict(row) for row in serializer.data], [dict(row) for row in expected])
+
+    def test_list_uses_single_query(self):
+        for model, serializer_class in self.cases:
+            with self.subTest(serializer=serializer_class.__name__):
+                serializer = serializer_class(model.objects.all(), many=True, context=self.context)
+                with self.assertNumQueries(1):
+                    serializer.data
+
+
+@override_settings(ALLOWED_HOSTS=['*'])
+class SparseFieldsetTest(TestCase):
+    def setUp(self):
+        now = timezone.now()
+        admin = User.objects.create(username='admin', is_superuser=True)
+        self.event = Event.objects.create(
+            name='Event', location='Jakarta', start_time=now, end_time=now, category='music', organizer_id=admin,
+        )
+        self.client = APIClient()
+        self.client.force_authenticate(admin)
+
+    def test_unknown_field_names_are_rejected(self):
+        response = self.client.get(f'/api/events/{self.event.pk}/', {'fields': 'id,nmae', 'exclude': 'descripton'})
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.data, {'fields': ['Unknown field: nmae.'], 'exclude': ['Unknown field: descripton.']})
+        response = self.client.get('/api/events/batch/', {'ids': str(self.event.pk), 'fields': 'id,nmae'})
+        self.assertEqual(response.status_code, 400)
+
+    def test_compact_drops_only_the_links(self):
+        full = self.client.get(f'/api/events/{self.event.pk}/').data
+        compact = self.client.get(f'/api/events/{self.event.pk}/', {'compact': 'true'}).data
+        self.assertIn('_links', full)
+        self.assertEqual(list(compact), [name for name in full if name != '_links'])
+        listed = self.client.get('/api/events/', {'compact': '1', 'fields': 'id,name,_links'}).data['events']
+        self.assertEqual([dict(event) for event in listed], [{'id': str(self.event.pk), 'name': 'Event'}])
+
+
+class CachedUserTest(TestCase):
+    def test_cache_holds_no_password_hash_and_follows_bulk_updates(self):
+        user = User.objects.create_user('member', 'member@example.com', 'secret')
+        self.assertTrue(get_cached_user(user.pk).is_active)
+        cached = cache.get(_user_cache_key(user.pk))
+        self.assertNotIn(user.password, repr(cached))
+
+        with self.captureOnCommitCallbacks(execute=True):
+            User.objects.filter(pk=user.pk).update(is_active=False)
+        self.assertFalse(get_cached_user(user.pk).is_active)
+        self.assertEqual(get_cached_user(user.pk).email, 'member@example.com')
+
+
+@override_settings(ALLOWED_HOSTS=['*'])
+class BulkAssignRoleTest(TestCase):
+    def setUp(self):
+        self.group = Group.objects.create(name='organizer')
+        self.member, self.newcomer = User.objects.create(username='member'), User.objects.create(username='newcomer')
+        self.member.groups.add(self.group)
+        self.client = APIClient()
+        self.client.force_authenticate(User.objects.create(username='admin', is_superuser=True))
+
+    def post(self, *pairs):
+        return self.client.post(
+            '/api/assign-roles/bulk/',
+            {'assignments': [{'user_id': str(user_id), 'group_id': group_id} for user_id, group_id in pairs]},
+            format='json',
+        )
+
+    def test_counts_only_added_memberships_and_forgets_cached_users(self):
+        self.assertEqual(get_cached_user(self.newcomer.pk).role_names, frozenset())
+        pairs = [(self.member.pk, self.group.pk), (self.newcomer.pk, self.group.pk), (self.newcomer.pk, self.group.pk)]
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.post(*pairs)
+        self.assertEqual((response.status_code, response.data), (201, {'assignments': 1}))
+        self.assertEqual(set(self.group.user_set.values_list('username', flat=True)), {'member', 'newcomer'})
+        self.assertIsNone(cache.get(_user_cache_key(self.newcomer.pk)))
+        self.assertEqual(self.post(*pairs).data, {'assignments': 0})
+
+    def test_reports_unknown_users_and_groups_with_one_query_each(self):
+        unknown = uuid.uuid4()
+        with self.assertNumQueries(2):
+            response = self.post((unknown, self.group.pk), (self.member.pk, 999))
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(
+            response.data['assignments'],
+            {'user_id': [f'User {unknown} does not exist.'], 'group_id': ['Group 999 does not exist.']},
+        )
+        self.assertEqual(self.member.groups.count(), 1)
+
+
+@override_settings(ALLOWED_HOSTS=['*'])
+class UserSearchTest(TestCase):
+    def setUp(self):
+        organizer, admin = Group.objects.create(name='organizer'), Group.objects.create(name='admin')
+        self.users = {
+            'budi': User.objects.create(username='budi', email='budi@dicoding.com', first_name='Budi', last_name='Santoso'),
+            'sari': User.objects.create(username='sari', email='sari@example.com', first_name='Sari', last_name='Dicoding'),
+            'andi': User.objects.create(username='andi', email='andi@example.com', first_name='Andi', last_name='Wijaya'),
+            'rina': User.objects.create(username='rina', email='rina@example.com', first_name='Rina', last_name='Santoso'),
+        }
+        self.users['budi'].groups.add(organizer, admin)
+        self.users['rina'].groups.add(organizer)
+        self.client = APIClient()
+        self.client.force_authenticate(User.objects.create(username='zz-admin', is_superuser=True))
+
+    def search(self, **params):
+        response = self.client.get('/api/users/search/', params)
+        self.assertEqual(response.status_code, 200)
+        return [user['username'] for user in response.data['users']]
+
+    def test_every_term_matches_any_name_field_case_insensitively(self):
+        self.assertEqual(self.search(q='DICODING'), ['budi', 'sari'])
+        self.assertEqual(self.search(q='santoso RIN'), ['rina'])
+        self.assertEqual(self.search(q='wij example'), ['andi'])
+        self.assertEqual(self.client.get('/api/users/search/', {'q': 'ab'}).status_code, 400)
+
+    def test_group_filter_lists_each_member_once(self):
+        self.assertEqual(self.search(group='organizer,admin'), ['budi', 'rina'])
+        self.assertEqual(self.search(q='santoso', group='admin'), ['budi'])
+
+    def test_pages_follow_the_username(self):
+        response = self.client.get('/api/users/search/', {'limit': 2})
+        seen = [user['username'] for user in response.data['users']]
+        while response.data['next']:
+            response = self.client.get(response.data['next'])
+            seen += [user['username'] for user in response.data['users']]
+        self.assertEqual(seen, ['andi', 'budi', 'rina', 'sari', 'zz-admin'])
+
+
+class ThrottleTest(SimpleTestCase):
+    def test_zero_rate_denies_without_a_wait(self):
+        throttle = ScopedTokenBucketThrottle('closed')
+        throttle.get_rate = lambda: '0/min'
+        self.assertFalse(throttle.allow_request(Request(APIRequestFactory().get('/api/')), None))
+        self.assertIsNone(throttle.wait())
+
+
+class JobSweepTest(TestCase):
+    def test_only_jobs_without_heartbeat_fail(self):
+        stale, alive, done = (Job.objects.create(kind='test', status=status) for status in (
+            Job.STATUS_RUNNING, Job.STATUS_PENDING, Job.STATUS_DONE,
+        ))
+        Job.objects.filter(pk__in=[stale.pk, done.pk]).update(updated_at=timezone.now() - timedelta(hours=1))
+        self.assertEqual(fail_stale_jobs(600), [stale.pk])
+        self.assertEqual(
+            [Job.objects.get(pk=job.pk).status for job in (stale, alive, done)],
+            [Job.STATUS_FAILED, Job.STATUS_PENDING, Job.STATUS_DONE],
+        )
+
+
+class CascadeDeleteTest(TestCase):
+    def setUp(self):
+        now = timezone.now()
+        self.organizer = User.objects.create(username='organizer')
+        self.buyer = User.objects.create(username='buyer')
+        self.event = Event.objects.create(
+            name='Event', location='Jakarta', start_time=now, end_time=now, category='music', organizer_id=self.organizer,
+        )
+        ticket = Ticket.objects.create(name='Ticket', price=50000, sales_start=now, sales_end=now, quota=10, event_id=self.event)
+        self.registrations = [Registration.objects.create(ticket_id=ticket, user_id=self.buyer) for _ in range(3)]
+        for registration in self.registrations:
+            Payment.objects.create(
+                registration_id=registration, payment_method='QRIS', payment_status='Pending', amount_paid=50000,
+            )
+            CheckIn.objects.create(registration_id=registration, event_id=self.event, scanned_at=now)
+        self.entry = WaitlistEntry.objects.create(
+            ticket_id=ticket, user_id=self.buyer, position=1,
+            status=WaitlistEntry.STATUS_PROMOTED, registration_id=self.registrations[0],
+        )
+        self.job = Job.objects.create(kind='test', user_id=self.buyer)
+
+    def test_cascades_and_sets_null_in_chunks(self):
+        chunks = []
+        deleted = cascade_delete(
+            Registration.objects.filter(pk__in=[r.pk for r in self.registrations[:2]]), 1,
+            lambda model, count: chunks.append((model.__name__, count)),
+        )
+        self.assertEqual(deleted, 2)
+        # Baris yang mereferensikan dihapus lebih dulu, satu baris per chunk
+        self.assertEqual(sorted(chunks[:4]), [('CheckIn', 1), ('CheckIn', 1), ('Payment', 1), ('Payment', 1)])
+        self.assertEqual(chunks[4:], [('Registration', 1), ('Registration', 1)])
+        self.assertEqual(list(Registration.objects.values_list('pk', flat=True)), [self.registrations[2].pk])
+        self.assertEqual((Payment.objects.count(), CheckIn.objects.count()), (1, 1))
+        # SET_NULL: entri waitlist tetap ada, hanya tautannya yang dilepas
+        self.assertIsNone(WaitlistEntry.objects.get(pk=self.entry.pk).registration_id)
+
+    def test_deleting_users_matches_model_delete(self):
+        cascade_delete(User.objects.filter(pk=self.buyer.pk), 100)
+        self.assertFalse(Registration.objects.exists())
+        self.assertFalse(WaitlistEntry.objects.exists())
+        self.assertIsNone(Job.objects.get(pk=self.job.pk).user_id)
+        self.assertTrue(Event.objects.filter(pk=self.event.pk).exists())
+
+
+class PartitionForeignKeyTest(TestCase):
+    def test_only_composite_foreign_keys_point_at_partitioned_tables(self):
+        command = manage_partitions.Command()
+        with connection.cursor() as cursor:
+            self.assertEqual(command.referencing_foreign_keys(cursor), [])
+            with mock.patch.object(manage_partitions, 'COMPOSITE_FOREIGN_KEYS', []):
+                blocking = command.referencing_foreign_keys(cursor)
+        self.assertEqual(
+            [(referencing, referenced) for referencing, _, referenced in blocking],
+            [(Payment._meta.db_table, Registration._meta.db_table)],
+        )
+
+
+class FastJSONRendererTest(SimpleTestCase):
+    def test_bytes_match_drf_json_renderer(self):
+        jakarta = dt_timezone(timedelta(hours=7))
+        cases = {
+            'uuid': uuid.UUID('0191d3a2-7c4e-7b3a-9f1e-2d4c6b8a0e1f'),
+            'aware datetime': datetime(2026, 10, 19, 8, 30, 15, 123456, tzinfo=jakarta),
+            'utc datetime': datetime(2026, 10, 19, 1, 30, tzinfo=dt_timezone.utc),
+            'naive datetime': datetime(2026, 10, 19, 8, 30),
+            'date and time': [date(2026, 10, 19), time(8, 30, 15, 500)],
+            'decimal': Decimal('150000.50'),
+            'decimal edges': [Decimal('0'), Decimal('-0.0001'), Decimal('9999999999999999')],
+            # Di luar 1e-4..1e16 orjson menulis float berbeda, jadi jalur stdlib yang dipakai
+            'decimal fallback': [Decimal('0.00001'), Decimal('1E+16'), Decimal('-123456789012345678.9')],
+            'big ints': [2 ** 63 - 1, -2 ** 63, 2 ** 64, -2 ** 100],
+            'set': {'music'},
+            'text': 'Café Jakarta\u2028\u2029 "quoted" </script>',
+            'nested': {'tickets': [{'price': 50000, 'remaining': None, 'sold_out': False}], 1: 'int key'},
+        }
+        for name, data in cases.items():
+            with self.subTest(name):
+                self.assertEqual(FastJSONRenderer().render(data), JSONRenderer().render(data))
+
+
+class ExplainPlanTest(SimpleTestCase):
+    """
+    Plan normalization and snapshot comparison behind manage.py explain_endpoints.
+    """
+    index_plan = {
+        'Node Type': 'Limit',
+        'Plans': [{
+            'Node Type': 'Index Scan', 'Index Name': 'registration_user_idx',
+            'Relation Name': 'registrations_registration', 'Total Cost': 8.0,
+        }],
+    }
+    seq_plan = {
+        'Node Type': 'Limit',
+        'Plans': [{'Node Type': 'Seq Scan', 'Relation Name': 'registrations_registration'}],
+    }
+
+    def captured(self, plan, cost):
+        return {'sql': 'SELECT ...', 'plan': plan_shape(plan), 'cost': cost}
+
+    def test_normalize_sql_drops_literals(self):
+        self.assertEqual(
+            normalize_sql("SELECT * FROM t WHERE id IN ('a', 'b''c') AND n > 10 LIMIT 21"),
+            normalize_sql("SELECT * FROM t WHERE id IN ('d') AND n > 3 LIMIT 5"),
+        )
+
+    def test_plan_shape_keeps_access_path(self):
+        self.assertEqual(
+            plan_shape(self.index_plan),
+            ['Limit', '  Index Scan using registration_user_idx on registrations_registration'],
+        )
+
+    def test_compare(self):
+        snapshot = {'my registrations': {'abc': self.captured(self.index_plan, 10.0)}}
+        cases = [
+            (self.captured(self.index_plan, 12.0), 0),
+            (self.captured(self.index_plan, 20.0), 1),
+            (self.captured(self.seq_plan, 10.0), 1),
+        ]
+        for captured, expected in cases:
+            with self.subTest(plan=captured['plan'], cost=captured['cost']):
+                regressions, notes = compare(snapshot, {'my registrations': {'abc': captured}}, 0.5)
+                self.assertEqual(len(regressions), expected)
+        regressions, notes = compare(snapshot, {'my registrations': {'new': self.captured(self.seq_plan, 1.0)}}, 0.5)
+        self.assertEqual(len(regressions), 1)
+        self.assertEqual(len(notes), 1)
+
+
+class CompressionTest(SimpleTestCase):
+    body = b'{"results": [%s]}' % b','.join([b'{"name": "Event", "location": "Jakarta"}'] * 100)
+
+    def respond(self, response, accept_encoding='gzip, deflate'):
+        request = APIRequestFactory().get('/api/events/', HTTP_ACCEPT_ENCODING=accept_encoding)
+        return CompressionMiddleware(lambda request: response)(request)
+
+    def test_negotiate_follows_server_preference_and_quality(self):
+        gzip = GzipCodec()
+        self.assertIs(negotiate('br;q=1, gzip;q=0.5', [gzip]), gzip)
+        self.assertIs(negotiate('*', [gzip]), gzip)
+        self.assertIsNone(negotiate('gzip;q=0, *', [gzip]))
+        self.assertIsNone(negotiate('', [gzip]))
+
+    def test_compresses_large_bodies_only(self):
+        response = self.respond(HttpResponse(self.body, content_type='application/json'))
+        self.assertEqual(response['Content-Encoding'], 'gzip')
+        self.assertEqual(response['Vary'], 'Accept-Encoding')
+        self.assertEqual(GzipCodec().decompress(response.content), self.body)
+
+        small = self.respond(HttpResponse(b'{}', content_type='application/json'))
+        self.assertFalse(small.has_header('Content-Encoding'))
+        identity = self.respond(HttpResponse(self.body, content_type='application/json'), 'identity')
+        self.assertEqual(identity.content, self.body)
+        html = self.respond(HttpResponse(self.body, content_type='text/html'))
+        self.assertFalse(html.has_header('Content-Encoding'))
+
+    def test_streaming_chunks_decode_as_a_whole(self):
+        chunks = [self.body[:500], self.body[500:]]
+        response = self.respond(StreamingHttpResponse(iter(chunks), content_type='application/json'))
+        self.assertEqual(GzipCodec().decompress(b''.join(response.streaming_content)), self.body)
@@ -0,0 +1,150 @@
+import threading
+import time
+from collections import OrderedDict
+
+from django.conf import settings
+from django.core.cache import cache
+from rest_framework.settings import api_settings
+from rest_framework.throttling import BaseThrottle
+
+
+class MemoryBucketStore:
+    """
+    In-process token buckets. Buckets are refilled lazily on access and kept in LRU
+    order, so memory is capped at `max_keys` buckets however many clients show up.
+    """
+    def __init__(self, max_keys):
+        self.max_keys = max_keys
+        self.buckets = OrderedDict()
+        self.lock = threading.Lock()
+
+    def consume(self, key, capacity, refill_rate, now=None):
+        now = time.monotonic() if now is None else now
+        with self.lock:
+            tokens, updated_at = self.buckets.pop(key, (capacity, now))
+            tokens = min(capacity, tokens + (now - updated_at) * refill_rate)
+            wait = 0 if tokens >= 1 else (1 - tokens) / refill_rate
+            if not wait:
+                tokens -= 1
+            self.buckets[key] = (tokens, now)
+            if len(self.buckets) > self.max_keys:
+                # Bucket yang paling lama tidak dipakai kemungkinan besar sudah penuh lagi
+                self.buckets.popitem(last=False)
+        return wait
+
+
+class CacheBucketStore:
+    """
+    Token buckets kept in the Django cache, shared by every worker when the cache is
+    Redis. Read-modify-write is not atomic, so concurrent bursts may slip a few extra
+    requests through; entries expire once a bucket would be full again.
+    """
+    def consume(self, key, capacity, refill_rate, now=None):
+        now = time.time() if now is None else now
+        tokens, updated_at = cache.get(key, (capacity, now))
+        tokens = min(capacity, tokens + (now - updated_at) * refill_rate)
+        wait = 0 if tokens >= 1 else (1 - tokens) / refill_rate
+        if not wait:
+            tokens -= 1
+        cache.set(key, (tokens, now), int((capacity - tokens) / refill_rate) + 1)
+        return wait
+
+
+_memory_store = None
+
+
+def get_bucket_store():
+    global _memory_store
+    if settings.THROTTLE_STORE == 'cache':
+        return CacheBucketStore()
+    if _memory_store is None:
+        _memory_store = MemoryBucketStore(settings.THROTTLE_MEMORY_MAX_KEYS)
+    return _memory_store
+
+
+class TokenBucketThrottle(BaseThrottle):
+    """
+    Token-bucket throttle. Rates use the DRF format, e.g. `'20/min'` gives a bucket of
+    20 requests that refills at 20 per minute, so short bursts are allowed while the
+    sustained rate stays bounded. `'0/min'` denies every request.
+    """
+    scope = None
+
+    def __init__(self):
+        self.wait_time = None
+
+    def get_rate(self):
+        return api_settings.DEFAULT_THROTTLE_RATES.get(self.scope)
+
+    def parse_rate(self, rate):
+        num, period = rate.split('/')
+        duration = {'s': 1, 'm': 60, 'h': 3600, 'd': 86400}[period[0]]
+        return int(num), int(num) / duration
+
+    def get_cache_key(self, request, view):
+        raise NotImplementedError('.get_cache_key() must be overridden')
+
+    def allow_request(self, request, view):
+        rate = self.get_rate()
+        if rate is None:
+            return True
+        key = self.get_cache_key(request, view)
+        if key is None:
+            return True
+        capacity, refill_rate = self.parse_rate(rate)
+        if refill_rate <= 0:
+            # '0/min' menutup rute sepenuhnya; bucket kosong tidak pernah terisi lagi
+            self.wait_time = None
+            return False
+        self.wait_time = get_bucket_store().consume(key, capacity, refill_rate)
+        return not self.wait_time
+
+    def wait(self):
+        return self.wait_time
+
+
+class UserTokenBucketThrottle(TokenBucketThrottle):
+    """
+    Limits authenticated users, keyed by user id.
+    """
+    scope = 'user'
+
+    def get_cache_key(self, request, view):
+        if not request.user or not request.user.is_authenticated:
+            return None
+        return f'throttle:{self.scope}:{request.user.pk}'
+
+
+class AnonTokenBucketThrottle(TokenBucketThrottle):
+    """
+    Limits unauthenticated requests, keyed by client IP.
+    """
+    scope = 'anon'
+
+    def get_cache_key(self, request, view):
+        if request.user and request.user.is_authenticated:
+            return None
+        return f'throttle:{self.scope}:{self.get_ident(request)}'
+
+
+class ScopedTokenBucketThrottle(TokenBucketThrottle):
+    """
+    Limits a route class, keyed by user id or client IP. The scope is taken from the
+    constructor or from the view's `throttle_scope` attribute.
+    """
+    def __init__(self, scope=None):
+        super().__init__()
+        self.scope = scope
+
+    def allow_request(self, request, view):
+        self.scope = self.scope or getattr(view, 'throttle_scope', None)
+        if self.scope is None:
+            return True
+        return super().allow_request(request, view)
+
+    def get_cache_key(self, request, view):
+        if request.user and request.user.is_authenticated:
+            ident = request.user.pk
+        else:
+            ident = self.get_ident(request)
+        return f'throttle:{self.scope}:{ident}'
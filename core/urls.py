@@ -3,9 +3,11 @@ from . import views
 
 urlpatterns = [
   path('users/', views.UserListCreateView.as_view(), name='user-list'),
+  path('users/search/', views.UserSearchView.as_view(), name='user-search'),
   path('users/<uuid:pk>/', views.UserDetailView.as_view(), name='user-detail'),
   path('groups/', views.GroupListCreateView.as_view(), name='group-list'),
   path('groups/<int:pk>/', views.GroupDetailView.as_view(), name='group-detail'),
-  # TODO: Fix ['“null” is not a valid UUID.'] POST /api/assign-roles
   path('assign-roles/', views.AssignRoleView.as_view(), name='assign-roles'),
+  path('assign-roles/bulk/', views.BulkAssignRoleView.as_view(), name='assign-roles-bulk'),
+  path('jobs/<uuid:pk>/', views.JobDetailView.as_view(), name='job-detail'),
 ]
\ No newline at end of file
@@ -2,16 +2,28 @@ from rest_framework import status
 from rest_framework.response import Response
 from rest_framework.views import APIView
 from django.shortcuts import get_object_or_404
+from django.db.models import Exists, OuterRef, Q
 from django.contrib.auth.models import Group
-from rest_framework_simplejwt.authentication import JWTAuthentication
+from core.authentication import CachedJWTAuthentication
+from rest_framework_simplejwt.views import TokenObtainPairView
 from rest_framework.permissions import IsAuthenticated
-from core.permissions import IsAdminOrSuperUser, IsOwnerOrAdminOrSuperUser
-from .models import User
-from .serializers import UserSerializer, GroupSerializer
+from core.fieldsets import get_fieldset
+from core.pagination import KeysetPagination
+from core.permissions import IsAdminOrSuperUser, IsOwnerOrAdminOrSuperUser, IsRegistrantOrAdminOrSuperUser
+from core.roles import assign_roles
+from .models import Job, User
+from .serializers import (
+    AssignRoleSerializer, BulkAssignRoleSerializer, GroupSerializer, JobSerializer, UserSearchSerializer,
+    UserSerializer,
+)
 from django.http import Http404
 
+class LoginView(TokenObtainPairView):
+    # Setiap login menjalankan password hasher, batasi per IP
+    throttle_scope = 'login'
+
 class UserListCreateView(APIView):
-    authentication_classes = [JWTAuthentication]
+    authentication_classes = [CachedJWTAuthentication]
 
     def get_permissions(self):
         if self.request.method == 'GET':
@@ -20,7 +32,7 @@ class UserListCreateView(APIView):
 
     def get(self, request):
         users = User.objects.all().order_by('username')[:10]
-        serializer = UserSerializer(users, many=True)
+        serializer = UserSerializer(users, many=True, **get_fieldset(request))
         return Response({'users': serializer.data})
 
     def post(self, request):
@@ -30,8 +42,48 @@ class UserListCreateView(APIView):
             return Response(serializer.data, status=status.HTTP_201_CREATED)
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
+class UserSearchPagination(KeysetPagination):
+    # username unik dan sudah ber-index, jadi aman dipakai sebagai kunci cursor
+    ordering = 'username'
+
+class UserSearchView(APIView):
+    """
+    `?q=` matches every whitespace-separated term against username, email, first
+    and last name (case-insensitive substring, served by the trigram indexes);
+    `?group=admin,organizer` keeps members of any of those groups.
+    """
+    authentication_classes = [CachedJWTAuthentication]
+    permission_classes = [IsAuthenticated, IsAdminOrSuperUser]
+
+    # Trigram index hanya terpakai untuk pola minimal 3 karakter
+    min_term_length = 3
+
+    def get(self, request):
+        terms = request.query_params.get('q', '').split()
+        if any(len(term) < self.min_term_length for term in terms):
+            return Response(
+                {'q': [f'Each search term needs at least {self.min_term_length} characters.']},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        users = User.objects.prefetch_related('groups')
+        for term in terms:
+            users = users.filter(
+                Q(username__icontains=term) | Q(email__icontains=term) |
+                Q(first_name__icontains=term) | Q(last_name__icontains=term)
+            )
+        groups = [name for name in request.query_params.get('group', '').split(',') if name]
+        if groups:
+            # Semi-join: tidak ada baris ganda untuk user yang ada di beberapa grup
+            users = users.filter(Exists(
+                User.groups.through.objects.filter(user_id=OuterRef('pk'), group__name__in=groups)
+            ))
+        paginator = UserSearchPagination()
+        page = paginator.paginate_queryset(users, request, view=self)
+        serializer = UserSearchSerializer(page, many=True, **get_fieldset(request))
+        return Response({'users': serializer.data, **paginator.get_page_links()})
+
 class UserDetailView(APIView):
-    authentication_classes = [JWTAuthentication]
+    authentication_classes = [CachedJWTAuthentication]
 
     def get_permissions(self):
         if self.request.method == 'DELETE':
@@ -48,7 +100,7 @@ class UserDetailView(APIView):
 
     def get(self, request, pk):
         user = self.get_object(pk)
-        serializer = UserSerializer(user)
+        serializer = UserSerializer(user, **get_fieldset(request))
         return Response(serializer.data)
 
     def put(self, request, pk):
@@ -65,7 +117,7 @@ class UserDetailView(APIView):
         return Response(status=status.HTTP_204_NO_CONTENT)
 
 class GroupListCreateView(APIView):
-    authentication_classes = [JWTAuthentication]
+    authentication_classes = [CachedJWTAuthentication]
     permission_classes = [IsAuthenticated, IsAdminOrSuperUser]
 
     def get(self, request):
@@ -81,7 +133,7 @@ class GroupListCreateView(APIView):
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
 class GroupDetailView(APIView):
-    authentication_classes = [JWTAuthentication]
+    authentication_classes = [CachedJWTAuthentication]
     permission_classes = [IsAuthenticated, IsAdminOrSuperUser]
 
     def get_object(self, pk):
@@ -111,11 +163,42 @@ class GroupDetailView(APIView):
         return Response(status=status.HTTP_204_NO_CONTENT)
 
 class AssignRoleView(APIView):
-    authentication_classes = [JWTAuthentication]
+    authentication_classes = [CachedJWTAuthentication]
     permission_classes = [IsAuthenticated, IsAdminOrSuperUser]
 
     def post(self, request):
-        user = get_object_or_404(User, pk=request.data['user_id'])
-        group = get_object_or_404(Group, pk=request.data['group_id'])
+        serializer = AssignRoleSerializer(data=request.data)
+        if not serializer.is_valid():
+            return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+        user = get_object_or_404(User, pk=serializer.validated_data['user_id'])
+        group = get_object_or_404(Group, pk=serializer.validated_data['group_id'])
         user.groups.add(group)
-        return Response(status=status.HTTP_201_CREATED)
\ No newline at end of file
+        return Response(status=status.HTTP_201_CREATED)
+
+class BulkAssignRoleView(APIView):
+    """
+    Adds many users to groups in one call. `assignments` in the response is the
+    number of memberships added; pairs that already existed are not counted.
+    """
+    authentication_classes = [CachedJWTAuthentication]
+    permission_classes = [IsAuthenticated, IsAdminOrSuperUser]
+
+    def post(self, request):
+        serializer = BulkAssignRoleSerializer(data=request.data)
+        if not serializer.is_valid():
+            return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+        assigned = assign_roles(
+            (assignment['user_id'], assignment['group_id'])
+            for assignment in serializer.validated_data['assignments']
+        )
+        return Response({'assignments': assigned}, status=status.HTTP_201_CREATED)
+
+class JobDetailView(APIView):
+    authentication_classes = [CachedJWTAuthentication]
+    permission_classes = [IsAuthenticated, IsRegistrantOrAdminOrSuperUser]
+
+    def get(self, request, pk):
+        job = get_object_or_404(Job, pk=pk)
+        self.check_object_permissions(request, job)
+        serializer = JobSerializer(job, context={'request': request})
+        return Response(serializer.data)
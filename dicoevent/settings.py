@@ -13,6 +13,7 @@ import os
 from dotenv import load_dotenv
 from pathlib import Path
 from datetime import timedelta
+from importlib.util import find_spec
 
 load_dotenv()
 
@@ -40,6 +41,7 @@ INSTALLED_APPS = [
     'tickets.apps.TicketsConfig',
     'registrations.apps.RegistrationsConfig',
     'payments.apps.PaymentsConfig',
+    'archives.apps.ArchivesConfig',
     'rest_framework',
     'django.contrib.admin',
     'django.contrib.auth',
@@ -47,10 +49,12 @@ INSTALLED_APPS = [
     'django.contrib.sessions',
     'django.contrib.messages',
     'django.contrib.staticfiles',
+    'django.contrib.postgres',
 ]
 
 MIDDLEWARE = [
     'django.middleware.security.SecurityMiddleware',
+    'core.middleware.CompressionMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
@@ -95,6 +99,25 @@ DATABASES = {
 }
 
 
+# Cache
+# https://docs.djangoproject.com/en/4.2/topics/cache/
+
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'OPTIONS': {
+            'MAX_ENTRIES': 100000,
+        },
+    }
+}
+
+if os.getenv('REDIS_URL'):
+    CACHES['default'] = {
+        'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+        'LOCATION': os.getenv('REDIS_URL'),
+    }
+
+
 # Password validation
 # https://docs.djangoproject.com/en/4.2/ref/settings/#auth-password-validators
 
@@ -114,6 +137,42 @@ AUTH_PASSWORD_VALIDATORS = [
 ]
 
 
+# Password hashing
+# https://docs.djangoproject.com/en/4.2/topics/auth/passwords/
+# 'argon2' needs argon2-cffi and 'bcrypt' needs bcrypt installed. New and rehashed
+# passwords use PASSWORD_HASHER; the others stay listed so older hashes still verify.
+
+PASSWORD_HASHER = os.getenv('PASSWORD_HASHER', 'pbkdf2')
+
+PASSWORD_ARGON2_TIME_COST = int(os.getenv('PASSWORD_ARGON2_TIME_COST', 2))
+PASSWORD_ARGON2_MEMORY_COST = int(os.getenv('PASSWORD_ARGON2_MEMORY_COST', 19456))
+PASSWORD_ARGON2_PARALLELISM = int(os.getenv('PASSWORD_ARGON2_PARALLELISM', 1))
+PASSWORD_BCRYPT_ROUNDS = int(os.getenv('PASSWORD_BCRYPT_ROUNDS', 12))
+PASSWORD_PBKDF2_ITERATIONS = int(os.getenv('PASSWORD_PBKDF2_ITERATIONS', 600000))
+
+_PASSWORD_HASHERS = {
+    'argon2': 'core.hashers.TunedArgon2PasswordHasher',
+    'bcrypt': 'core.hashers.TunedBCryptSHA256PasswordHasher',
+    'pbkdf2': 'core.hashers.TunedPBKDF2PasswordHasher',
+}
+
+PASSWORD_HASHERS = [_PASSWORD_HASHERS[PASSWORD_HASHER]] + [
+    hasher for name, hasher in _PASSWORD_HASHERS.items() if name != PASSWORD_HASHER
+] + [
+    'django.contrib.auth.hashers.PBKDF2SHA1PasswordHasher',
+    'django.contrib.auth.hashers.ScryptPasswordHasher',
+]
+
+# Authenticated users (with their role names) are cached for this many seconds
+AUTH_USER_CACHE_TTL = int(os.getenv('AUTH_USER_CACHE_TTL', 300))
+
+# Most (user, group) pairs accepted by one POST /api/assign-roles/bulk/
+ROLE_ASSIGNMENT_LIMIT = int(os.getenv('ROLE_ASSIGNMENT_LIMIT', 10000))
+
+# Default of the UUID primary keys: 7 = time-ordered (RFC 9562), 4 = random
+PRIMARY_KEY_UUID_VERSION = int(os.getenv('PRIMARY_KEY_UUID_VERSION', 7))
+
+
 # Internationalization
 # https://docs.djangoproject.com/en/4.2/topics/i18n/
 
@@ -137,13 +196,112 @@ DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 
 AUTH_USER_MODEL = 'core.User'
 
+# MessagePack (Accept / Content-Type: application/msgpack) is offered when msgpack is installed
+_MSGPACK_INSTALLED = find_spec('msgpack') is not None
+
 REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': (
-        'rest_framework_simplejwt.authentication.JWTAuthentication',
+        'core.authentication.CachedJWTAuthentication',
+    ),
+    'DEFAULT_RENDERER_CLASSES': (
+        'core.renderers.FastJSONRenderer',
+        *(['core.renderers.MessagePackRenderer'] if _MSGPACK_INSTALLED else []),
+        'rest_framework.renderers.BrowsableAPIRenderer',
+    ),
+    'DEFAULT_PARSER_CLASSES': (
+        'core.parsers.FastJSONParser',
+        *(['core.parsers.MessagePackParser'] if _MSGPACK_INSTALLED else []),
+        'rest_framework.parsers.FormParser',
+        'rest_framework.parsers.MultiPartParser',
     ),
+    'DEFAULT_THROTTLE_CLASSES': (
+        'core.throttling.UserTokenBucketThrottle',
+        'core.throttling.AnonTokenBucketThrottle',
+        'core.throttling.ScopedTokenBucketThrottle',
+    ),
+    'DEFAULT_THROTTLE_RATES': {
+        'user': os.getenv('THROTTLE_RATE_USER', '1200/min'),
+        'anon': os.getenv('THROTTLE_RATE_ANON', '120/min'),
+        'login': os.getenv('THROTTLE_RATE_LOGIN', '10/min'),
+        'registrations': os.getenv('THROTTLE_RATE_REGISTRATIONS', '30/min'),
+    },
 }
 
+# 'memory' keeps buckets per process, 'cache' shares them through CACHES (e.g. Redis)
+THROTTLE_STORE = os.getenv('THROTTLE_STORE', 'memory')
+
+THROTTLE_MEMORY_MAX_KEYS = int(os.getenv('THROTTLE_MEMORY_MAX_KEYS', 50000))
+
+# Response compression (core.middleware.CompressionMiddleware), by server preference;
+# 'br' needs brotli and 'zstd' needs zstandard installed, otherwise they are skipped
+RESPONSE_COMPRESSION_ENCODINGS = os.getenv('RESPONSE_COMPRESSION_ENCODINGS', 'zstd,br,gzip').split(',')
+
+# Smaller bodies are sent uncompressed
+RESPONSE_COMPRESSION_MIN_SIZE = int(os.getenv('RESPONSE_COMPRESSION_MIN_SIZE', 1024))
+
+# Most ids one multi-get request (events/tickets/registrations batch/) may ask for
+BATCH_GET_LIMIT = int(os.getenv('BATCH_GET_LIMIT', 100))
+
 SIMPLE_JWT = {
     "ACCESS_TOKEN_LIFETIME": timedelta(minutes=180),
     "REFRESH_TOKEN_LIFETIME": timedelta(days=30),
-}
\ No newline at end of file
+    "TOKEN_REFRESH_SERIALIZER": "core.serializers.CachedTokenRefreshSerializer",
+}
+
+# Background tasks & waitlist
+
+BACKGROUND_TASK_WORKERS = int(os.getenv('BACKGROUND_TASK_WORKERS', 2))
+
+WAITLIST_PROMOTION_BATCH_SIZE = int(os.getenv('WAITLIST_PROMOTION_BATCH_SIZE', 100))
+
+# Ticket sales gate & waiting room
+
+TICKET_SALES_WINDOW_CACHE_TTL = int(os.getenv('TICKET_SALES_WINDOW_CACHE_TTL', 300))
+
+# Admissions per second per ticket once sales open; 0 turns the waiting room off
+TICKET_ADMISSION_RATE = float(os.getenv('TICKET_ADMISSION_RATE', 0))
+
+TICKET_ADMISSION_TOKEN_TTL = int(os.getenv('TICKET_ADMISSION_TOKEN_TTL', 300))
+
+# Venue check-in
+
+# Secret the per-event gate keys are derived from; rotating it invalidates issued tokens
+CHECKIN_SIGNING_KEY = os.getenv('CHECKIN_SIGNING_KEY', SECRET_KEY)
+
+# Most scans accepted by one POST /api/events/<id>/check-in/
+CHECKIN_SCAN_LIMIT = int(os.getenv('CHECKIN_SCAN_LIMIT', 5000))
+
+# Payment gateway callbacks
+
+# Shared secret the gateway signs callbacks with (X-Gateway-Signature); its own value,
+# never SECRET_KEY. While unset, POST /api/payments/callbacks/ answers 503
+PAYMENT_GATEWAY_SECRET = os.getenv('PAYMENT_GATEWAY_SECRET', '')
+
+# Seconds a signed callback stays acceptable, against replayed requests
+PAYMENT_CALLBACK_TOLERANCE = int(os.getenv('PAYMENT_CALLBACK_TOLERANCE', 300))
+
+# Most notifications accepted by one POST /api/payments/callbacks/
+PAYMENT_CALLBACK_BATCH_LIMIT = int(os.getenv('PAYMENT_CALLBACK_BATCH_LIMIT', 5000))
+
+# Event dashboards & deletion
+
+# Stats are invalidated on writes; the TTL only bounds staleness after bulk writes
+EVENT_STATS_CACHE_TTL = int(os.getenv('EVENT_STATS_CACHE_TTL', 60))
+
+# Events with more registrations than this are deleted by a background job
+EVENT_DELETE_SYNC_LIMIT = int(os.getenv('EVENT_DELETE_SYNC_LIMIT', 10000))
+
+# Rows per DELETE statement (and transaction) when deleting an event
+EVENT_DELETE_CHUNK_SIZE = int(os.getenv('EVENT_DELETE_CHUNK_SIZE', 5000))
+
+# Rows copied and deleted per transaction when archiving ended events (archive_events)
+ARCHIVE_CHUNK_SIZE = int(os.getenv('ARCHIVE_CHUNK_SIZE', 5000))
+
+# Seconds without a heartbeat after which a pending/running job counts as dead (sweep_jobs),
+# and an interrupted event deletion is resumed (resume_event_deletions)
+JOB_STALE_AFTER = int(os.getenv('JOB_STALE_AFTER', 900))
+
+# Public catalog
+
+# Seconds between refreshes of the events_catalog materialized view (refresh_catalog --loop)
+EVENT_CATALOG_REFRESH_INTERVAL = int(os.getenv('EVENT_CATALOG_REFRESH_INTERVAL', 60))
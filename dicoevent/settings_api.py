@@ -0,0 +1,43 @@
+"""
+API-only settings profile: DJANGO_SETTINGS_MODULE=dicoevent.settings_api
+
+Everything from dicoevent.settings, minus what a JWT-only JSON API never uses on
+its request path: the admin, sessions, messages, static files, CSRF, templates and
+the browsable API. Run migrations and the admin with the full profile.
+"""
+from dicoevent.settings import *  # noqa: F401,F403
+from dicoevent.settings import INSTALLED_APPS, MIDDLEWARE, REST_FRAMEWORK
+
+# auth dan contenttypes tetap dibutuhkan oleh User, Group dan permission
+INSTALLED_APPS = [
+    app for app in INSTALLED_APPS
+    if app not in (
+        'django.contrib.admin',
+        'django.contrib.sessions',
+        'django.contrib.messages',
+        'django.contrib.staticfiles',
+        'django.contrib.postgres',
+    )
+]
+
+# DRF mengautentikasi sendiri (JWT) dan APIView sudah csrf_exempt
+MIDDLEWARE = [
+    middleware for middleware in MIDDLEWARE
+    if middleware not in (
+        'django.contrib.sessions.middleware.SessionMiddleware',
+        'django.middleware.csrf.CsrfViewMiddleware',
+        'django.contrib.auth.middleware.AuthenticationMiddleware',
+        'django.contrib.messages.middleware.MessageMiddleware',
+        'django.middleware.clickjacking.XFrameOptionsMiddleware',
+    )
+]
+
+TEMPLATES = []
+
+REST_FRAMEWORK = {
+    **REST_FRAMEWORK,
+    'DEFAULT_RENDERER_CLASSES': tuple(
+        renderer for renderer in REST_FRAMEWORK['DEFAULT_RENDERER_CLASSES']
+        if renderer != 'rest_framework.renderers.BrowsableAPIRenderer'
+    ),
+}
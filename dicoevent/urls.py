@@ -14,16 +14,15 @@ Including another URLconf
     1. Import the include() function: from django.urls import include, path
     2. Add a URL to urlpatterns:  path('blog/', include('blog.urls'))
 """
-from django.contrib import admin
+from django.apps import apps
 from django.urls import path, include
 
-from rest_framework_simplejwt.views import (
-    TokenObtainPairView,
-    TokenRefreshView,
-)
+from rest_framework_simplejwt.views import TokenRefreshView
+
+from core.views import LoginView
+
 urlpatterns = [
-    path('admin/', admin.site.urls),
-    path('api/login/', TokenObtainPairView.as_view()),
+    path('api/login/', LoginView.as_view()),
     path('api/token/', TokenRefreshView.as_view()),
     path('api/', include('core.urls')),
     path('api/', include('events.urls')),
@@ -31,3 +30,9 @@ urlpatterns = [
     path('api/', include('registrations.urls')),
     path('api/', include('payments.urls')),
 ]
+
+# Profil dicoevent.settings_api tidak memasang admin
+if apps.is_installed('django.contrib.admin'):
+    from django.contrib import admin
+
+    urlpatterns.insert(0, path('admin/', admin.site.urls))
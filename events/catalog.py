@@ -0,0 +1,42 @@
+from django.db import connection
+
+from events.models import Event, EventCatalog
+from registrations.models import Registration
+from tickets.models import Ticket
+
+# Tabel sumber materialized view; perubahan di sini yang membuat katalog basi
+SOURCE_MODELS = [Event, Ticket, Registration]
+
+
+def source_changes():
+    """
+    Inserted, updated and deleted rows of the catalog's source tables since the
+    statistics were reset, from pg_stat_user_tables. Cheap to read and shared by
+    every process, so a refresher can skip a refresh when nothing changed. The
+    counters lag writes by up to a second; partitions count toward their parent.
+    """
+    tables = [model._meta.db_table for model in SOURCE_MODELS]
+    with connection.cursor() as cursor:
+        cursor.execute(
+            """
+            SELECT coalesce(sum(n_tup_ins + n_tup_upd + n_tup_del), 0)
+            FROM pg_stat_user_tables
+            WHERE relid = ANY(ARRAY(SELECT to_regclass(name) FROM unnest(%s::text[]) AS name))
+               OR relid IN (SELECT inhrelid FROM pg_inherits
+                            WHERE inhparent = ANY(ARRAY(SELECT to_regclass(name) FROM unnest(%s::text[]) AS name)))
+            """,
+            [tables, tables],
+        )
+        return cursor.fetchone()[0]
+
+
+def refresh_catalog():
+    """
+    Rebuilds the catalog with `REFRESH MATERIALIZED VIEW CONCURRENTLY`: the new
+    contents are computed aside and merged by the unique index on id, so readers
+    keep seeing the previous rows instead of waiting on an exclusive lock.
+    """
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f'REFRESH MATERIALIZED VIEW CONCURRENTLY {connection.ops.quote_name(EventCatalog._meta.db_table)}'
+        )
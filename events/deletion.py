@@ -0,0 +1,68 @@
+from collections import Counter
+
+from django.conf import settings
+from django.db import IntegrityError
+from django.utils import timezone
+
+from core.bulk import cascade_delete
+from core.jobs import update_job_progress
+from events.models import Event
+from events.stats import forget_event_stats
+from registrations.models import Registration
+from tickets.models import Ticket
+from tickets.sales import forget_sales_window
+
+JOB_DELETE_EVENT = 'delete_event'
+
+
+def event_size(event):
+    """
+    Number of registrations of `event`, used to decide whether deleting it is done
+    inline or as a background job.
+    """
+    return Registration.objects.filter(ticket_id__event_id=event.pk, event_start=event.start_time).count()
+
+
+def mark_deleted(event_id):
+    """
+    Hides the event from the API and refuses new registrations for it, before any
+    of its rows are deleted. Returns False if the event does not exist (anymore).
+    """
+    events = Event.objects.filter(pk=event_id)
+    events.filter(deleted_at__isnull=True).update(deleted_at=timezone.now())
+    return events.exists()
+
+
+def delete_event(job_id, event_id):
+    """
+    Deletes an event with its tickets, registrations, payments and waitlists through
+    `cascade_delete`: chunked DELETE statements, nothing loaded into memory. Returns
+    the number of deleted rows per model.
+
+    Every chunk commits on its own, so an interrupted deletion leaves part of the
+    rows behind; the event is marked deleted first (hidden, no new registrations)
+    and calling this again resumes where it stopped.
+    """
+    deleted = Counter()
+    if not mark_deleted(event_id):
+        return {}
+
+    def on_chunk(model, count):
+        deleted[model._meta.label] += count
+        if job_id:
+            update_job_progress(job_id, dict(deleted))
+
+    ticket_ids = list(Ticket.objects.filter(event_id=event_id).values_list('pk', flat=True))
+    for attempt in range(3):
+        try:
+            cascade_delete(Event.objects.filter(pk=event_id), settings.EVENT_DELETE_CHUNK_SIZE, on_chunk)
+            break
+        except IntegrityError:
+            # Registrasi yang sudah berjalan sebelum event ditandai bisa masuk di tengah penghapusan;
+            # ulangi dari anak-anaknya
+            if attempt == 2:
+                raise
+    forget_event_stats([event_id])
+    for ticket_id in ticket_ids:
+        forget_sales_window(ticket_id)
+    return dict(deleted)
@@ -0,0 +1,28 @@
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import connection
+
+from events.status import advance_event_statuses
+
+
+class Command(BaseCommand):
+    help = (
+        'Advances event statuses from the schedule: scheduled events that started become live, '
+        'scheduled and live events that ended become finished. Run it from cron every minute, '
+        'or keep it running with --loop.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--loop', action='store_true', help='Keep running, e.g. as a sidecar process.')
+        parser.add_argument('--interval', type=int, default=60, help='--loop: seconds between rounds.')
+
+    def handle(self, *args, **options):
+        while True:
+            advanced = advance_event_statuses()
+            self.stdout.write(', '.join(f'{count} {status}' for status, count in advanced.items()))
+            if not options['loop']:
+                return
+            # Koneksi ditutup di antara ronde agar proses sidecar tidak memegang koneksi menganggur
+            connection.close()
+            time.sleep(options['interval'])
@@ -0,0 +1,136 @@
+import json
+import statistics
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+
+from core.explain import plan_shape
+
+SCHEMA = 'bench_event_ranges'
+
+# Kolom events_event yang dipakai query rentang waktu
+COLUMNS = 'id uuid PRIMARY KEY, location text NOT NULL, start_time timestamptz NOT NULL, end_time timestamptz NOT NULL'
+
+RANGE = "tstzrange(start_time, end_time, '[)')"
+
+# (label, index definitions); "model" is what events.Event ships with
+VARIANTS = [
+    ('no index', []),
+    ('btree', ['(start_time)', '(location, start_time)']),
+    ('model', [f'USING gist ({RANGE})', '(start_time)']),
+    ('gist + location', [f'USING gist ({RANGE})', '(start_time)', f'USING gist (location, {RANGE})']),
+]
+
+QUERIES = [
+    (
+        'weekend overlap',
+        f'SELECT id FROM {{table}} WHERE {RANGE} && tstzrange(%(saturday)s, %(monday)s) ORDER BY start_time LIMIT 20',
+    ),
+    (
+        'weekend, start/end compare',
+        'SELECT id FROM {table} WHERE start_time < %(monday)s AND end_time > %(saturday)s ORDER BY start_time LIMIT 20',
+    ),
+    (
+        'weekend overlap count',
+        f'SELECT count(*) FROM {{table}} WHERE {RANGE} && tstzrange(%(saturday)s, %(monday)s)',
+    ),
+    (
+        'location overlap',
+        f'SELECT id FROM {{table}} WHERE location = %(location)s AND {RANGE} && tstzrange(%(saturday)s, %(monday)s)',
+    ),
+    (
+        'upcoming',
+        'SELECT id FROM {table} WHERE start_time >= %(now)s ORDER BY start_time LIMIT 20',
+    ),
+]
+
+
+class Command(BaseCommand):
+    help = (
+        'Benchmarks the "events happening between X and Y" queries on an events-like table filled '
+        'with generate_series() in a scratch schema, without an index, with btree indexes on '
+        'start_time, with the GiST index on tstzrange(start_time, end_time) the Event model ships '
+        'and with an extra (location, range) GiST index. Reports the median time and the access path.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--rows', type=int, default=1_000_000)
+        parser.add_argument('--days', type=int, default=730, help='Days the event starts are spread over.')
+        parser.add_argument('--locations', type=int, default=200)
+        parser.add_argument('--repeat', type=int, default=20, help='Runs per query; the median is reported.')
+        parser.add_argument('--keep', action='store_true', help='Keep the scratch schema afterwards.')
+
+    def handle(self, *args, **options):
+        if connection.vendor != 'postgresql':
+            raise CommandError('This benchmark needs PostgreSQL.')
+        with connection.cursor() as cursor:
+            cursor.execute(f'DROP SCHEMA IF EXISTS {SCHEMA} CASCADE')
+            cursor.execute(f'CREATE SCHEMA {SCHEMA}')
+            try:
+                cursor.execute('CREATE EXTENSION IF NOT EXISTS btree_gist')
+                params = self.setup(cursor, options)
+                self.stdout.write(f'{"indexes":<16} {"query":<28} {"ms":>9}  access path')
+                for label, indexes in VARIANTS:
+                    self.run(cursor, label, indexes, params, options)
+            finally:
+                if not options['keep']:
+                    cursor.execute(f'DROP SCHEMA {SCHEMA} CASCADE')
+
+    def setup(self, cursor, options):
+        started = time.perf_counter()
+        cursor.execute(f'CREATE TABLE {SCHEMA}.events ({COLUMNS})')
+        # Sebagian besar event 1-8 jam, sekitar 5% berhari-hari (festival, pameran); 10% online
+        cursor.execute(
+            f"""
+            INSERT INTO {SCHEMA}.events
+            SELECT gen_random_uuid(),
+                   CASE WHEN i %% 10 = 0 THEN 'Online' ELSE 'City ' || (i * 7919) %% %(locations)s END,
+                   start_time,
+                   start_time + CASE WHEN i %% 20 = 0 THEN make_interval(days => 1 + i %% 14)
+                                     ELSE make_interval(hours => 1 + i %% 8) END
+            FROM (
+                SELECT i, date_trunc('hour', now()) - make_interval(days => %(days)s / 2)
+                          + make_interval(hours => ((i * 104729) %% (%(days)s * 24))::int) AS start_time
+                FROM generate_series(1, %(rows)s) AS i
+            ) AS rows
+            """,
+            {'rows': options['rows'], 'days': options['days'], 'locations': options['locations']},
+        )
+        cursor.execute(f'ANALYZE {SCHEMA}.events')
+        self.stdout.write(f'Loaded {options["rows"]} events in {time.perf_counter() - started:.1f}s')
+
+        cursor.execute(
+            "SELECT now(), date_trunc('week', now()) + interval '5 days', date_trunc('week', now()) + interval '7 days'"
+        )
+        now, saturday, monday = cursor.fetchone()
+        return {'now': now, 'saturday': saturday, 'monday': monday, 'location': 'City 1'}
+
+    def run(self, cursor, label, indexes, params, options):
+        table = f'{SCHEMA}.events'
+        created = []
+        for number, definition in enumerate(indexes):
+            name = f'events_idx_{number}'
+            cursor.execute(f'CREATE INDEX {name} ON {table} {definition}')
+            created.append(name)
+        cursor.execute(f'ANALYZE {table}')
+        try:
+            for query_label, sql in QUERIES:
+                query = sql.format(table=table)
+                cursor.execute(f'EXPLAIN (FORMAT JSON) {query}', params)
+                plan = cursor.fetchone()[0]
+                if isinstance(plan, str):
+                    plan = json.loads(plan)
+                scans = [line.strip() for line in plan_shape(plan[0]['Plan']) if 'Scan' in line]
+                runs = []
+                for _ in range(options['repeat']):
+                    started = time.perf_counter()
+                    cursor.execute(query, params)
+                    cursor.fetchall()
+                    runs.append((time.perf_counter() - started) * 1000)
+                self.stdout.write(
+                    f'{label:<16} {query_label:<28} {statistics.median(runs):>9.2f}  {", ".join(scans)}'
+                )
+        finally:
+            for name in created:
+                cursor.execute(f'DROP INDEX {SCHEMA}.{name}')
@@ -0,0 +1,77 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+
+from events.models import EVENT_LOCATION_EXCLUSION, Event
+
+# Pasangan event di lokasi yang sama dengan waktu yang beririsan
+CONFLICTS_SQL = """
+SELECT a.id, b.id, a.location, a.start_time, a.end_time, b.start_time, b.end_time
+FROM {table} a
+JOIN {table} b
+  ON a.location = b.location AND a.id < b.id
+ AND tstzrange(a.start_time, a.end_time, '[)') && tstzrange(b.start_time, b.end_time, '[)')
+WHERE a.location <> ALL(%s) AND a.status <> %s AND b.status <> %s
+ORDER BY a.location, a.start_time
+LIMIT %s
+"""
+
+
+class Command(BaseCommand):
+    help = (
+        'Manages an opt-in exclusion constraint that rejects two events at the same location '
+        'with overlapping [start_time, end_time) ranges. "check" lists the pairs that would '
+        'violate it, "add" creates it (btree_gist) after checking, "drop" removes it. '
+        'Virtual locations (--exclude-location, default "Online") and cancelled events are never '
+        'constrained.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('action', choices=['check', 'add', 'drop'])
+        parser.add_argument(
+            '--exclude-location', action='append',
+            help='Location that may host overlapping events (repeatable, default: Online).',
+        )
+        parser.add_argument('--limit', type=int, default=20, help='check: conflicting pairs to show.')
+
+    def handle(self, *args, **options):
+        if connection.vendor != 'postgresql':
+            raise CommandError('Exclusion constraints need PostgreSQL.')
+        excluded = options['exclude_location'] or ['Online']
+        table = connection.ops.quote_name(Event._meta.db_table)
+        with connection.cursor() as cursor:
+            if options['action'] == 'drop':
+                cursor.execute(f'ALTER TABLE {table} DROP CONSTRAINT IF EXISTS {EVENT_LOCATION_EXCLUSION}')
+                self.stdout.write(self.style.SUCCESS(f'Dropped {EVENT_LOCATION_EXCLUSION}.'))
+                return
+
+            cursor.execute(
+                CONFLICTS_SQL.format(table=table),
+                [excluded, Event.STATUS_CANCELLED, Event.STATUS_CANCELLED, options['limit']],
+            )
+            conflicts = cursor.fetchall()
+            for first, second, location, *times in conflicts:
+                self.stdout.write(
+                    f'{location}: {first} [{times[0]:%Y-%m-%d %H:%M}, {times[1]:%Y-%m-%d %H:%M}) overlaps '
+                    f'{second} [{times[2]:%Y-%m-%d %H:%M}, {times[3]:%Y-%m-%d %H:%M})'
+                )
+            if conflicts:
+                raise CommandError(
+                    f'{len(conflicts)}{"+" if len(conflicts) == options["limit"] else ""} conflicting pair(s); '
+                    f'reschedule them before adding {EVENT_LOCATION_EXCLUSION}.'
+                )
+            if options['action'] == 'check':
+                self.stdout.write(self.style.SUCCESS('No overlapping events at the same location.'))
+                return
+
+            # btree_gist dibutuhkan untuk operator = pada kolom teks di dalam index GiST
+            cursor.execute('CREATE EXTENSION IF NOT EXISTS btree_gist')
+            cursor.execute(f'ALTER TABLE {table} DROP CONSTRAINT IF EXISTS {EVENT_LOCATION_EXCLUSION}')
+            cursor.execute(
+                f'ALTER TABLE {table} ADD CONSTRAINT {EVENT_LOCATION_EXCLUSION} EXCLUDE USING gist '
+                f"(location WITH =, tstzrange(start_time, end_time, '[)') WITH &&) "
+                f'WHERE (location <> ALL(%s) AND status <> %s)',
+                [excluded, Event.STATUS_CANCELLED],
+            )
+            self.stdout.write(self.style.SUCCESS(
+                f'Added {EVENT_LOCATION_EXCLUSION} (not applied to: {", ".join(excluded)}).'
+            ))
@@ -0,0 +1,40 @@
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+
+from events.catalog import refresh_catalog, source_changes
+
+
+class Command(BaseCommand):
+    help = (
+        'Refreshes the events_catalog materialized view concurrently, so catalog readers are never '
+        'blocked. With --loop it keeps refreshing every EVENT_CATALOG_REFRESH_INTERVAL seconds and '
+        'skips rounds in which events, tickets and registrations saw no writes. Needs PostgreSQL.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--loop', action='store_true', help='Keep running, e.g. as a sidecar process.')
+        parser.add_argument(
+            '--interval', type=int, default=settings.EVENT_CATALOG_REFRESH_INTERVAL, help='--loop: seconds between rounds.'
+        )
+
+    def handle(self, *args, **options):
+        if connection.vendor != 'postgresql':
+            raise CommandError('The event catalog is a PostgreSQL materialized view.')
+        seen = None
+        while True:
+            changes = source_changes()
+            if changes == seen:
+                self.stdout.write('No writes since the last refresh, skipped.')
+            else:
+                started = time.perf_counter()
+                refresh_catalog()
+                seen = changes
+                self.stdout.write(f'Refreshed the event catalog in {(time.perf_counter() - started) * 1000:.0f} ms.')
+            if not options['loop']:
+                return
+            # Koneksi ditutup di antara ronde agar proses sidecar tidak memegang koneksi menganggur
+            connection.close()
+            time.sleep(options['interval'])
@@ -0,0 +1,30 @@
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from events.deletion import delete_event
+from events.models import Event
+
+
+class Command(BaseCommand):
+    help = (
+        'Finishes deleting events whose deletion started more than --older-than seconds ago '
+        '(default JOB_STALE_AFTER) but was interrupted, e.g. by a crashed worker. Deleting is '
+        'idempotent, so an event whose job is still running is only deleted faster.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--older-than', type=int, default=None)
+
+    def handle(self, *args, **options):
+        older_than = options['older_than'] or settings.JOB_STALE_AFTER
+        event_ids = list(
+            Event.objects.filter(deleted_at__lt=timezone.now() - timedelta(seconds=older_than))
+            .values_list('pk', flat=True)
+        )
+        for event_id in event_ids:
+            deleted = delete_event(None, event_id)
+            self.stdout.write(f'  {event_id}: ' + ', '.join(f'{count} {name}' for name, count in deleted.items()))
+        self.stdout.write(self.style.SUCCESS(f'{len(event_ids)} interrupted deletions finished.'))
@@ -0,0 +1,23 @@
+# Generated by Django 4.2 on 2026-10-19 14:46
+
+import django.contrib.postgres.indexes
+from django.db import migrations, models
+import events.models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('events', '0002_uuid7_default'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='event',
+            index=django.contrib.postgres.indexes.GistIndex(events.models.TsTzRange(), name='event_time_range_gist'),
+        ),
+        migrations.AddIndex(
+            model_name='event',
+            index=models.Index(fields=['start_time'], name='event_start_time_idx'),
+        ),
+    ]
@@ -0,0 +1,86 @@
+from django.db import migrations, models
+
+CATALOG_SQL = """
+CREATE MATERIALIZED VIEW events_catalog AS
+SELECT e.id, e.name, e.location, e.category, e.status, e.start_time, e.end_time,
+       coalesce(t.ticket_types, 0) AS ticket_types,
+       t.min_price,
+       t.max_price,
+       coalesce(t.capacity, 0) AS capacity,
+       greatest(coalesce(t.capacity, 0) - coalesce(r.registered, 0), 0) AS remaining,
+       s.sales_start AS next_sales_start,
+       s.sales_end AS next_sales_end,
+       now() AS refreshed_at
+FROM events_event e
+LEFT JOIN (
+    SELECT event_id_id, count(*) AS ticket_types, min(price) AS min_price, max(price) AS max_price,
+           sum(quota) AS capacity
+    FROM tickets_ticket
+    GROUP BY event_id_id
+) t ON t.event_id_id = e.id
+LEFT JOIN (
+    SELECT ticket.event_id_id, count(*) AS registered
+    FROM registrations_registration registration
+    JOIN tickets_ticket ticket ON ticket.id = registration.ticket_id_id
+    GROUP BY ticket.event_id_id
+) r ON r.event_id_id = e.id
+LEFT JOIN LATERAL (
+    SELECT sales_start, sales_end
+    FROM tickets_ticket
+    WHERE event_id_id = e.id AND sales_end > now()
+    ORDER BY sales_start
+    LIMIT 1
+) s ON true
+"""
+
+
+def create_catalog(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute(CATALOG_SQL)
+    # Index unik wajib untuk REFRESH MATERIALIZED VIEW CONCURRENTLY
+    schema_editor.execute('CREATE UNIQUE INDEX events_catalog_id ON events_catalog (id)')
+    schema_editor.execute('CREATE INDEX events_catalog_start_time ON events_catalog (start_time, id)')
+
+
+def drop_catalog(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute('DROP MATERIALIZED VIEW IF EXISTS events_catalog')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('events', '0003_event_time_indexes'),
+        ('registrations', '0006_checkin'),
+        ('tickets', '0002_uuid7_default'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='EventCatalog',
+            fields=[
+                ('id', models.UUIDField(primary_key=True, serialize=False)),
+                ('name', models.CharField(max_length=100)),
+                ('location', models.CharField(max_length=100)),
+                ('category', models.CharField(max_length=100)),
+                ('status', models.CharField(max_length=25)),
+                ('start_time', models.DateTimeField()),
+                ('end_time', models.DateTimeField()),
+                ('ticket_types', models.PositiveIntegerField()),
+                ('min_price', models.PositiveIntegerField(null=True)),
+                ('max_price', models.PositiveIntegerField(null=True)),
+                ('capacity', models.PositiveIntegerField()),
+                ('remaining', models.PositiveIntegerField()),
+                ('next_sales_start', models.DateTimeField(null=True)),
+                ('next_sales_end', models.DateTimeField(null=True)),
+                ('refreshed_at', models.DateTimeField()),
+            ],
+            options={
+                'db_table': 'events_catalog',
+                'managed': False,
+            },
+        ),
+        migrations.RunPython(create_catalog, drop_catalog),
+    ]
@@ -0,0 +1,41 @@
+from django.db import migrations, models
+from django.utils import timezone
+
+
+def normalize_status(apps, schema_editor):
+    """
+    Maps the free-text statuses onto the state machine: anything mentioning
+    "cancel" is cancelled, everything else follows start_time and end_time.
+    """
+    Event = apps.get_model('events', 'Event')
+    now = timezone.now()
+    known = ['scheduled', 'live', 'finished', 'cancelled']
+    Event.objects.filter(status__icontains='cancel').exclude(status='cancelled').update(status='cancelled')
+    free_text = Event.objects.exclude(status__in=known)
+    free_text.filter(end_time__lte=now).update(status='finished')
+    free_text.filter(start_time__lte=now, end_time__gt=now).update(status='live')
+    Event.objects.exclude(status__in=known).update(status='scheduled')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('events', '0004_event_catalog'),
+    ]
+
+    operations = [
+        migrations.RunPython(normalize_status, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name='event',
+            name='status',
+            field=models.CharField(choices=[('scheduled', 'Scheduled'), ('live', 'Live'), ('finished', 'Finished'), ('cancelled', 'Cancelled')], default='scheduled', max_length=25),
+        ),
+        migrations.AddIndex(
+            model_name='event',
+            index=models.Index(condition=models.Q(('status__in', ['scheduled', 'live'])), fields=['start_time', 'end_time'], name='event_active_start_idx'),
+        ),
+        migrations.AddConstraint(
+            model_name='event',
+            constraint=models.CheckConstraint(check=models.Q(('status__in', ['scheduled', 'live', 'finished', 'cancelled'])), name='event_status_valid'),
+        ),
+    ]
@@ -1,17 +1,119 @@
-import uuid
+from core.ids import new_id
 from core.models import User
 
-from django.db import models
+from django.contrib.postgres.fields import DateTimeRangeField, RangeBoundary
+from django.contrib.postgres.indexes import GistIndex
+from django.db import models, transaction
+
+# Nama exclusion constraint opsional (manage.py event_location_exclusion)
+EVENT_LOCATION_EXCLUSION = 'event_location_no_overlap'
+
+class TsTzRange(models.Func):
+    """
+    tstzrange(start, end, '[)'): the time an event occupies, as a range.
+    """
+    function = 'TSTZRANGE'
+    output_field = DateTimeRangeField()
+
+    def __init__(self, start='start_time', end='end_time', **extra):
+        super().__init__(start, end, RangeBoundary(), **extra)
+
+class EventQuerySet(models.QuerySet):
+    def update(self, **kwargs):
+        if 'start_time' not in kwargs:
+            return super().update(**kwargs)
+        # UPDATE massal tidak mengirim post_save, jadi kunci partisi event_start disalin di sini
+        from events.signals import copy_event_start
+        with transaction.atomic(using=self.db):
+            event_ids = list(self.values_list('pk', flat=True))
+            updated = super().update(**kwargs)
+            copy_event_start(event_ids)
+        return updated
 
 # Create your models here
 class Event(models.Model):
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False, unique=True)
+    STATUS_SCHEDULED = 'scheduled'
+    STATUS_LIVE = 'live'
+    STATUS_FINISHED = 'finished'
+    STATUS_CANCELLED = 'cancelled'
+    STATUS_CHOICES = [
+        (STATUS_SCHEDULED, 'Scheduled'),
+        (STATUS_LIVE, 'Live'),
+        (STATUS_FINISHED, 'Finished'),
+        (STATUS_CANCELLED, 'Cancelled'),
+    ]
+    # Event yang masih berjalan atau akan datang; dilayani partial index event_active_start_idx
+    ACTIVE_STATUSES = [STATUS_SCHEDULED, STATUS_LIVE]
+    # Perubahan yang boleh dilakukan organizer lewat PUT; live/finished dari jadwal diatur advance_event_status
+    MANUAL_TRANSITIONS = {
+        STATUS_SCHEDULED: {STATUS_CANCELLED},
+        STATUS_LIVE: {STATUS_FINISHED, STATUS_CANCELLED},
+        STATUS_FINISHED: set(),
+        STATUS_CANCELLED: {STATUS_SCHEDULED},
+    }
+
+    id = models.UUIDField(primary_key=True, default=new_id, editable=False, unique=True)
     name = models.CharField(max_length=100)
     description = models.TextField(blank=True)
     location = models.CharField(max_length=100)
     start_time = models.DateTimeField(blank=True)
     end_time = models.DateTimeField(blank=True)
-    status = models.CharField(max_length=25)
+    status = models.CharField(max_length=25, choices=STATUS_CHOICES, default=STATUS_SCHEDULED)
     quota = models.PositiveIntegerField(default=0)
     category = models.CharField(max_length=100)
-    organizer_id = models.ForeignKey(User, on_delete=models.CASCADE)
\ No newline at end of file
+    organizer_id = models.ForeignKey(User, on_delete=models.CASCADE)
+    # Diisi saat penghapusan dimulai: event langsung disembunyikan, penghapusan bisa dilanjutkan bila terputus
+    deleted_at = models.DateTimeField(null=True, blank=True, editable=False)
+
+    objects = EventQuerySet.as_manager()
+
+    def save(self, *args, **kwargs):
+        # post_save (events.signals.sync_event_start) menyalin start_time ke registrasi dan
+        # pembayaran; keduanya harus commit bersama UPDATE event ini
+        with transaction.atomic(using=kwargs.get('using')):
+            super().save(*args, **kwargs)
+
+    class Meta:
+        indexes = [
+            # Query overlap ("event antara X dan Y") memakai TsTzRange() yang sama persis
+            GistIndex(TsTzRange(), name='event_time_range_gist'),
+            models.Index(fields=['start_time', 'id'], name='event_start_id_idx'),
+            models.Index(
+                fields=['start_time', 'end_time'],
+                name='event_active_start_idx',
+                condition=models.Q(status__in=['scheduled', 'live']),
+            ),
+            models.Index(fields=['deleted_at'], name='event_deleted_idx', condition=models.Q(deleted_at__isnull=False)),
+        ]
+        constraints = [
+            models.CheckConstraint(
+                check=models.Q(status__in=['scheduled', 'live', 'finished', 'cancelled']),
+                name='event_status_valid',
+            ),
+        ]
+
+class EventCatalog(models.Model):
+    """
+    Read-only row of the `events_catalog` materialized view: an event with its
+    ticket prices, remaining capacity and next sales window, as of `refreshed_at`
+    (manage.py refresh_catalog).
+    """
+    id = models.UUIDField(primary_key=True)
+    name = models.CharField(max_length=100)
+    location = models.CharField(max_length=100)
+    category = models.CharField(max_length=100)
+    status = models.CharField(max_length=25)
+    start_time = models.DateTimeField()
+    end_time = models.DateTimeField()
+    ticket_types = models.PositiveIntegerField()
+    min_price = models.PositiveIntegerField(null=True)
+    max_price = models.PositiveIntegerField(null=True)
+    capacity = models.PositiveIntegerField()
+    remaining = models.PositiveIntegerField()
+    next_sales_start = models.DateTimeField(null=True)
+    next_sales_end = models.DateTimeField(null=True)
+    refreshed_at = models.DateTimeField()
+
+    class Meta:
+        managed = False
+        db_table = 'events_catalog'
@@ -1,15 +1,43 @@
 from rest_framework import serializers
 from rest_framework.reverse import reverse
-from .models import Event
+from .models import Event, EventCatalog
+from core.fieldsets import SparseFieldsetMixin, SparseListSerializer
 from core.models import User
+from events.status import status_for_window
 
-class EventSerializer(serializers.HyperlinkedModelSerializer):
+class EventSerializer(SparseFieldsetMixin, serializers.HyperlinkedModelSerializer):
     organizer_id = serializers.PrimaryKeyRelatedField(queryset=User.objects.all())
     _links = serializers.SerializerMethodField()
 
     class Meta:
         model = Event
         fields = ['id', 'name', 'description', 'location', 'start_time', 'end_time', 'status', 'quota', 'category', 'organizer_id', '_links']
+        list_serializer_class = SparseListSerializer
+
+    def validate_status(self, value):
+        if self.instance is None:
+            if value != Event.STATUS_SCHEDULED:
+                raise serializers.ValidationError(f'New events start as {Event.STATUS_SCHEDULED}.')
+        elif value != self.instance.status and value not in Event.MANUAL_TRANSITIONS[self.instance.status]:
+            allowed = sorted(Event.MANUAL_TRANSITIONS[self.instance.status])
+            raise serializers.ValidationError(
+                f'Cannot change status from {self.instance.status} to {value}'
+                f'{"; allowed: " + ", ".join(allowed) if allowed else ""}.'
+            )
+        return value
+
+    def validate(self, attrs):
+        start = attrs.get('start_time', getattr(self.instance, 'start_time', None))
+        end = attrs.get('end_time', getattr(self.instance, 'end_time', None))
+        # tstzrange(start, end) di index GiST menolak rentang terbalik
+        if start and end and end < start:
+            raise serializers.ValidationError({'end_time': ['End time must not be before start time.']})
+        if self.instance is not None and (start, end) != (self.instance.start_time, self.instance.end_time):
+            # Jadwal berubah: status live/finished lama tidak berlaku lagi; advance_event_status
+            # hanya menggerakkan event aktif, jadi statusnya dihitung ulang di sini
+            if attrs.get('status', self.instance.status) != Event.STATUS_CANCELLED:
+                attrs['status'] = status_for_window(start, end)
+        return attrs
 
     def get__links(self, obj):
         request = self.context.get('request')
@@ -38,4 +66,42 @@ class EventSerializer(serializers.HyperlinkedModelSerializer):
                 "action": "DELETE",
                 "types": ["application/json"]
             },
-        ]
\ No newline at end of file
+        ]
+class EventWindowSerializer(serializers.Serializer):
+    """
+    Query parameters `from` and `to` of the event list: events whose [start_time,
+    end_time) overlaps [from, to). Either end may be left open.
+    """
+    def get_fields(self):
+        return {
+            'from': serializers.DateTimeField(required=False),
+            'to': serializers.DateTimeField(required=False),
+        }
+
+    def validate(self, attrs):
+        if attrs.get('from') and attrs.get('to') and attrs['to'] <= attrs['from']:
+            raise serializers.ValidationError({'to': ['Must be after from.']})
+        return attrs
+
+class EventCatalogSerializer(SparseFieldsetMixin, serializers.HyperlinkedModelSerializer):
+    _links = serializers.SerializerMethodField()
+
+    class Meta:
+        model = EventCatalog
+        fields = [
+            'id', 'name', 'location', 'category', 'status', 'start_time', 'end_time', 'ticket_types',
+            'min_price', 'max_price', 'capacity', 'remaining', 'next_sales_start', 'next_sales_end',
+            'refreshed_at', '_links',
+        ]
+        list_serializer_class = SparseListSerializer
+
+    def get__links(self, obj):
+        request = self.context.get('request')
+        return [
+            {
+                "rel": "event",
+                "href": reverse('event-detail', kwargs={'pk': obj.pk}, request=request),
+                "action": "GET",
+                "types": ["application/json"]
+            }
+        ]
@@ -0,0 +1,61 @@
+from django.db.models import F, OuterRef, Subquery
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from events.models import Event
+from events.stats import forget_event_stats
+from payments.models import Payment
+from registrations.models import Registration
+from tickets.models import Ticket
+
+
+def _ticket_event_id(registration):
+    # Pakai relasi yang sudah dimuat bila ada agar tidak menambah query di jalur tulis
+    if Registration._meta.get_field('ticket_id').is_cached(registration):
+        return registration.ticket_id.event_id_id
+    return Ticket.objects.filter(pk=registration.ticket_id_id).values_list('event_id', flat=True).first()
+
+
+@receiver([post_save, post_delete], sender=Event)
+def forget_stats_for_event(sender, instance, **kwargs):
+    forget_event_stats([instance.pk])
+
+
+def copy_event_start(event_ids):
+    """
+    Copies Event.start_time of `event_ids` to the denormalized `event_start` partition
+    key of their registrations and payments; on Postgres the rows move to the new
+    month's partition. Must run in the transaction that changed start_time: seat
+    counts, stats and archiving select rows by `event_start`.
+    """
+    Registration.objects.filter(ticket_id__event_id__in=event_ids).exclude(
+        event_start=F('ticket_id__event_id__start_time')
+    ).update(event_start=Subquery(Event.objects.filter(ticket__pk=OuterRef('ticket_id')).values('start_time')))
+    Payment.objects.filter(registration_id__ticket_id__event_id__in=event_ids).exclude(
+        event_start=F('registration_id__event_start')
+    ).update(event_start=Subquery(Registration.objects.filter(pk=OuterRef('registration_id')).values('event_start')))
+
+
+@receiver(post_save, sender=Event)
+def sync_event_start(sender, instance, created, **kwargs):
+    # Berjalan di dalam transaksi Event.save(); UPDATE massal ditangani EventQuerySet.update
+    if not created:
+        copy_event_start([instance.pk])
+
+
+@receiver([post_save, post_delete], sender=Ticket)
+def forget_stats_for_ticket(sender, instance, **kwargs):
+    forget_event_stats([instance.event_id_id])
+
+
+@receiver([post_save, post_delete], sender=Registration)
+def forget_stats_for_registration(sender, instance, **kwargs):
+    forget_event_stats([_ticket_event_id(instance)])
+
+
+@receiver([post_save, post_delete], sender=Payment)
+def forget_stats_for_payment(sender, instance, **kwargs):
+    event_id = Ticket.objects.filter(
+        registration__pk=instance.registration_id_id
+    ).values_list('event_id', flat=True).first()
+    forget_event_stats([event_id])
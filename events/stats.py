@@ -0,0 +1,122 @@
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Count, F, FilteredRelation, Func, IntegerField, Q, Sum, Window
+from django.db.models.functions import Coalesce, Rank
+
+from events.models import Event
+from payments.models import Payment
+
+PAYMENT = 'event_payment'
+
+
+class WindowSum(Func):
+    """
+    `SUM(...) OVER (...)` over an aggregate of the same query, which Sum() refuses.
+    """
+    function = 'SUM'
+    window_compatible = True
+    output_field = IntegerField()
+
+
+def _stats_key(event_id):
+    return f'event-stats:{event_id}'
+
+
+def forget_event_stats(event_ids):
+    cache.delete_many([_stats_key(event_id) for event_id in event_ids if event_id])
+
+
+def _paid():
+    return Q(**{f'{PAYMENT}__payment_status__iexact': Payment.STATUS_COMPLETED})
+
+
+def compute_event_stats(event_id):
+    """
+    Builds the dashboard of an event from a single query: one row per ticket type
+    (LEFT JOINed through registrations and payments), counted with conditional
+    aggregation, with event totals and rankings taken from window functions over
+    those rows. Returns None if the event does not exist.
+    """
+    # Syarat event_start di klausa JOIN membuat Postgres hanya membaca partisi bulan event ini
+    partitioned = {
+        'event_registration': FilteredRelation(
+            'ticket__registration', condition=Q(ticket__registration__event_start=F('start_time'))
+        ),
+        'event_payment': FilteredRelation(
+            'event_registration__payment', condition=Q(event_registration__payment__event_start=F('start_time'))
+        ),
+    }
+    breakdown = {
+        f'payments_{status}': Count(f'{PAYMENT}__id', filter=Q(**{f'{PAYMENT}__payment_status__iexact': status}))
+        for status in Payment.STATUSES
+    }
+    rows = list(
+        Event.objects.filter(pk=event_id)
+        .annotate(**partitioned)
+        .values('id', 'name', 'quota', 'ticket__id', 'ticket__name', 'ticket__price', 'ticket__quota')
+        .annotate(
+            sold=Count('event_registration__id', distinct=True),
+            revenue=Coalesce(Sum(f'{PAYMENT}__amount_paid', filter=_paid()), 0),
+            payments=Count(f'{PAYMENT}__id'),
+            **breakdown,
+        )
+        .annotate(
+            event_sold=Window(WindowSum('sold')),
+            event_revenue=Window(WindowSum('revenue')),
+            sold_rank=Window(Rank(), order_by=F('sold').desc()),
+            revenue_rank=Window(Rank(), order_by=F('revenue').desc()),
+        )
+        .order_by('ticket__name', 'ticket__id')
+    )
+    if not rows:
+        return None
+
+    first = rows[0]
+    payments = dict.fromkeys(Payment.STATUSES, 0)
+    payments['other'] = 0
+    tickets = []
+    for row in rows:
+        if row['ticket__id'] is None:
+            # Event tanpa tiket tetap menghasilkan satu baris karena LEFT JOIN
+            continue
+        ticket_payments = {status: row[f'payments_{status}'] for status in Payment.STATUSES}
+        ticket_payments['other'] = row['payments'] - sum(ticket_payments.values())
+        for status, count in ticket_payments.items():
+            payments[status] += count
+        tickets.append({
+            'id': row['ticket__id'],
+            'name': row['ticket__name'],
+            'price': row['ticket__price'],
+            'quota': row['ticket__quota'],
+            'sold': row['sold'],
+            'remaining': max(row['ticket__quota'] - row['sold'], 0),
+            'revenue': row['revenue'],
+            'sold_rank': row['sold_rank'],
+            'revenue_rank': row['revenue_rank'],
+            'payments': ticket_payments,
+        })
+    return {
+        'id': first['id'],
+        'name': first['name'],
+        'quota': first['quota'],
+        'sold': first['event_sold'] if tickets else 0,
+        'ticket_quota': sum(ticket['quota'] for ticket in tickets),
+        'revenue': first['event_revenue'] if tickets else 0,
+        'payments': payments,
+        'tickets': tickets,
+    }
+
+
+def get_event_stats(event_id):
+    """
+    Cached `compute_event_stats`. Entries are dropped by events.signals whenever a
+    ticket, registration or payment of the event is written.
+    """
+    key = _stats_key(event_id)
+    stats = cache.get(key)
+    if stats is None:
+        stats = compute_event_stats(event_id)
+        if stats is None:
+            return None
+        cache.set(key, stats, settings.EVENT_STATS_CACHE_TTL)
+    return stats
@@ -0,0 +1,33 @@
+from django.db import transaction
+from django.utils import timezone
+
+from events.models import Event
+
+
+def status_for_window(start_time, end_time, now=None):
+    """
+    The status the schedule gives an event running over [start_time, end_time).
+    """
+    now = now or timezone.now()
+    if end_time <= now:
+        return Event.STATUS_FINISHED
+    if start_time <= now:
+        return Event.STATUS_LIVE
+    return Event.STATUS_SCHEDULED
+
+
+def advance_event_statuses(now=None):
+    """
+    Moves events along the schedule with two set-based UPDATEs: active events
+    whose end_time has passed become finished, scheduled events that have
+    started become live. Both only read the active slice of the table (partial
+    index event_active_start_idx). Returns the number of events per new status.
+    """
+    now = now or timezone.now()
+    active = Event.objects.filter(status__in=Event.ACTIVE_STATUSES)
+    with transaction.atomic():
+        finished = active.filter(end_time__lte=now).update(status=Event.STATUS_FINISHED)
+        live = active.filter(
+            status=Event.STATUS_SCHEDULED, start_time__lte=now, end_time__gt=now
+        ).update(status=Event.STATUS_LIVE)
+    return {Event.STATUS_FINISHED: finished, Event.STATUS_LIVE: live}
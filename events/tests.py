@@ -1,3 +1,260 @@
-from django.test import TestCase
+import uuid
+from datetime import timedelta
+from unittest import mock
 
-# Create your tests here.
+from django.conf import settings
+from django.contrib.auth.models import Group
+from django.db import transaction
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.utils import timezone
+from rest_framework.exceptions import ValidationError
+from rest_framework.test import APIClient
+
+from core.models import User
+from events.deletion import delete_event, mark_deleted
+from events.models import Event
+from events.serializers import EventSerializer, EventWindowSerializer
+from events.stats import compute_event_stats, get_event_stats
+from events.status import advance_event_statuses
+from payments.models import Payment
+from registrations.models import Registration
+from registrations import waitlist
+from registrations.waitlist import is_sold_out
+from tickets.models import Ticket
+
+
+class PaidRegistrationMixin:
+    def setUp(self):
+        now = timezone.now()
+        organizer = User.objects.create(username='organizer')
+        self.event = Event.objects.create(
+            name='Event', location='Jakarta', start_time=now, end_time=now + timedelta(hours=2),
+            category='music', organizer_id=organizer,
+        )
+        self.ticket = Ticket.objects.create(
+            name='Ticket', price=50000, sales_start=now, sales_end=now + timedelta(days=1), quota=1,
+            event_id=self.event,
+        )
+        registration = Registration.objects.create(ticket_id=self.ticket, user_id=organizer)
+        Payment.objects.create(
+            registration_id=registration, payment_method='QRIS', payment_status='completed', amount_paid=50000,
+        )
+
+
+class EventStartSyncTest(PaidRegistrationMixin, TestCase):
+    def test_reschedule_moves_partition_key_with_the_event(self):
+        self.event.start_time += timedelta(days=40)
+        self.event.end_time += timedelta(days=40)
+        self.event.save()
+        self.assertEqual(set(Registration.objects.values_list('event_start', flat=True)), {self.event.start_time})
+        self.assertEqual(set(Payment.objects.values_list('event_start', flat=True)), {self.event.start_time})
+
+    def test_queryset_update_moves_partition_key_too(self):
+        # UPDATE massal tidak mengirim post_save; EventQuerySet.update menyalin event_start sendiri
+        start_time = self.event.start_time + timedelta(days=40)
+        Event.objects.filter(pk=self.event.pk).update(start_time=start_time, end_time=start_time + timedelta(hours=2))
+        self.assertEqual(set(Registration.objects.values_list('event_start', flat=True)), {start_time})
+        self.assertEqual(set(Payment.objects.values_list('event_start', flat=True)), {start_time})
+        # Kursi dan statistik memfilter event_start, jadi baris yang dipindah tetap terhitung
+        with transaction.atomic():
+            self.assertTrue(is_sold_out(self.ticket))
+        stats = compute_event_stats(self.event.pk)
+        self.assertEqual((stats['sold'], stats['revenue']), (1, 50000))
+
+
+@override_settings(ALLOWED_HOSTS=['*'])
+class EventDeletionTest(PaidRegistrationMixin, TestCase):
+    def test_interrupted_deletion_hides_the_event_and_resumes(self):
+        client = APIClient()
+        client.force_authenticate(User.objects.create(username='admin', is_superuser=True))
+        # Terputus setelah event ditandai dan pembayarannya sudah terhapus
+        mark_deleted(self.event.pk)
+        Payment.objects.all().delete()
+
+        self.assertEqual(client.get(f'/api/events/{self.event.pk}/').status_code, 404)
+        self.assertEqual(client.get('/api/events/').data['events'], [])
+        response = client.post(
+            '/api/registrations/', {'ticket_id': str(self.ticket.pk), 'user_id': str(self.event.organizer_id_id)},
+        )
+        self.assertIn('ticket_id', response.data)
+
+        self.assertEqual(client.delete(f'/api/events/{self.event.pk}/').status_code, 204)
+        self.assertFalse(Event.objects.exists())
+        self.assertFalse(Registration.objects.exists())
+        self.assertEqual(delete_event(None, self.event.pk), {})
+
+    def test_deletion_racing_a_purchase_answers_like_validation(self):
+        client = APIClient()
+        client.force_authenticate(User.objects.create(username='admin', is_superuser=True))
+        data = {'ticket_id': str(self.ticket.pk), 'user_id': str(self.event.organizer_id_id)}
+
+        def delete_then_check(ticket):
+            # Event ditandai terhapus di antara validasi serializer dan penguncian tiket
+            mark_deleted(self.event.pk)
+            return is_sold_out(ticket)
+
+        with mock.patch.object(waitlist, 'is_sold_out', side_effect=delete_then_check):
+            racing = client.post('/api/registrations/', data)
+        validated = client.post('/api/registrations/', data)
+        self.assertEqual((racing.status_code, racing.data), (400, validated.data))
+
+
+class EventWindowTest(SimpleTestCase):
+    def test_open_ended_window(self):
+        window = EventWindowSerializer(data={'from': '2026-01-01T00:00:00Z'})
+        self.assertTrue(window.is_valid(), window.errors)
+        self.assertNotIn('to', window.validated_data)
+
+    def test_rejects_reversed_window_and_event(self):
+        window = EventWindowSerializer(data={'from': '2026-01-02T00:00:00Z', 'to': '2026-01-01T00:00:00Z'})
+        self.assertFalse(window.is_valid())
+        self.assertIn('to', window.errors)
+        self.assertFalse(EventWindowSerializer(data={'from': 'tomorrow'}).is_valid())
+
+        start = timezone.now()
+        with self.assertRaises(ValidationError) as raised:
+            EventSerializer().validate({'start_time': start, 'end_time': start - timedelta(hours=1)})
+        self.assertIn('end_time', raised.exception.detail)
+
+
+class EventStatusTest(TestCase):
+    def test_advance_moves_only_active_events_along_the_schedule(self):
+        organizer = User.objects.create(username='organizer')
+        now = timezone.now()
+
+        def event(start, end, status=Event.STATUS_SCHEDULED):
+            return Event.objects.create(
+                name='Event', location='Hall', start_time=now + timedelta(hours=start),
+                end_time=now + timedelta(hours=end), status=status, category='Seminar', organizer_id=organizer,
+            )
+
+        started, ended, upcoming = event(-1, 1), event(-3, -2), event(1, 2)
+        cancelled = event(-3, -2, Event.STATUS_CANCELLED)
+
+        self.assertEqual(advance_event_statuses(now), {Event.STATUS_FINISHED: 1, Event.STATUS_LIVE: 1})
+        self.assertEqual(
+            [Event.objects.get(pk=event.pk).status for event in (started, ended, upcoming, cancelled)],
+            [Event.STATUS_LIVE, Event.STATUS_FINISHED, Event.STATUS_SCHEDULED, Event.STATUS_CANCELLED],
+        )
+        self.assertEqual(advance_event_statuses(now + timedelta(hours=3))[Event.STATUS_FINISHED], 2)
+
+    def test_rescheduling_recomputes_status(self):
+        now = timezone.now()
+        event = Event.objects.create(
+            name='Event', location='Hall', start_time=now - timedelta(hours=3), end_time=now - timedelta(hours=2),
+            status=Event.STATUS_FINISHED, category='Seminar', organizer_id=User.objects.create(username='organizer'),
+        )
+        for start, expected in ((timedelta(days=30), Event.STATUS_SCHEDULED), (-timedelta(hours=1), Event.STATUS_LIVE)):
+            serializer = EventSerializer(
+                event, data={'start_time': now + start, 'end_time': now + start + timedelta(hours=2)}, partial=True,
+            )
+            self.assertTrue(serializer.is_valid(), serializer.errors)
+            event = serializer.save()
+            self.assertEqual(event.status, expected)
+
+
+@override_settings(ALLOWED_HOSTS=['*'])
+class BatchGetTest(TestCase):
+    def setUp(self):
+        now = timezone.now()
+        self.organizer = User.objects.create(username='organizer')
+        self.events = [
+            Event.objects.create(
+                name=f'Event {i}', location='Jakarta', start_time=now, end_time=now, category='music',
+                organizer_id=self.organizer,
+            )
+            for i in range(3)
+        ]
+        self.client = APIClient()
+        self.client.force_authenticate(self.organizer)
+
+    def test_results_follow_request_order_with_one_query(self):
+        ids = [self.events[2].pk, self.events[0].pk, self.events[2].pk]
+        with self.assertNumQueries(1):
+            response = self.client.get('/api/events/batch/', {'ids': ','.join(map(str, ids)), 'fields': 'id,name'})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([event['name'] for event in response.data['events']], ['Event 2', 'Event 0'])
+
+        unknown = uuid.uuid4()
+        response = self.client.post('/api/events/batch/', {'ids': [str(unknown), str(self.events[1].pk)]}, format='json')
+        self.assertEqual([event['name'] for event in response.data['events']], ['Event 1'])
+        self.assertEqual(response.data['missing'], [unknown])
+
+    def test_rejects_invalid_and_oversized_batches(self):
+        self.assertEqual(self.client.get('/api/events/batch/', {'ids': 'not-a-uuid'}).status_code, 400)
+        self.assertEqual(self.client.get('/api/events/batch/').status_code, 400)
+        ids = [str(uuid.uuid4()) for _ in range(settings.BATCH_GET_LIMIT + 1)]
+        self.assertEqual(self.client.post('/api/events/batch/', {'ids': ids}, format='json').status_code, 400)
+
+
+@override_settings(ALLOWED_HOSTS=['*'])
+class EventPaginationTest(TestCase):
+    def test_events_starting_together_are_paged_once_each(self):
+        now = timezone.now() + timedelta(days=1)
+        organizer = User.objects.create(username='organizer', is_superuser=True)
+        events = [
+            # id menurun terhadap urutan insert, supaya urutan fisik tabel tidak kebetulan benar
+            Event.objects.create(
+                id=uuid.UUID(int=5 - i), name=f'Event {i}', location='Jakarta', start_time=now,
+                end_time=now + timedelta(hours=2), category='music', organizer_id=organizer,
+            )
+            for i in range(5)
+        ]
+        client = APIClient()
+        client.force_authenticate(organizer)
+        seen, url = [], '/api/events/?status=scheduled&limit=2'
+        while url:
+            response = client.get(url)
+            seen += [event['id'] for event in response.data['events']]
+            url = response.data['next']
+        self.assertEqual(seen, sorted(str(event.pk) for event in events))
+
+
+@override_settings(ALLOWED_HOSTS=['*'])
+class EventStatsTest(TestCase):
+    def setUp(self):
+        now = timezone.now()
+        self.organizer = User.objects.create(username='organizer')
+        self.organizer.groups.add(Group.objects.create(name='organizer'))
+        self.event = Event.objects.create(
+            name='Event', location='Jakarta', start_time=now, end_time=now + timedelta(hours=2), quota=10,
+            category='music', organizer_id=self.organizer,
+        )
+        self.regular, self.vip = (
+            Ticket.objects.create(name=name, price=price, sales_start=now, sales_end=now, quota=quota, event_id=self.event)
+            for name, price, quota in (('Regular', 50000, 5), ('VIP', 150000, 2))
+        )
+        for ticket, payment_status in ((self.regular, 'Completed'), (self.regular, 'pending'), (self.vip, 'completed')):
+            Payment.objects.create(
+                registration_id=Registration.objects.create(ticket_id=ticket, user_id=self.organizer),
+                payment_method='QRIS', payment_status=payment_status, amount_paid=ticket.price,
+            )
+        # Registrasi tanpa pembayaran tetap terhitung terjual
+        Registration.objects.create(ticket_id=self.regular, user_id=self.organizer)
+
+    def test_stats_come_from_one_query(self):
+        with self.assertNumQueries(1):
+            stats = compute_event_stats(self.event.pk)
+        self.assertEqual((stats['sold'], stats['ticket_quota'], stats['revenue']), (4, 7, 200000))
+        self.assertEqual(stats['payments'], {'pending': 1, 'completed': 2, 'failed': 0, 'refunded': 0, 'other': 0})
+        self.assertEqual(
+            [(ticket['name'], ticket['sold'], ticket['quota'], ticket['remaining'], ticket['revenue']) for ticket in stats['tickets']],
+            [('Regular', 3, 5, 2, 50000), ('VIP', 1, 2, 1, 150000)],
+        )
+        self.assertEqual([ticket['revenue_rank'] for ticket in stats['tickets']], [2, 1])
+
+    def test_writes_drop_the_cached_stats(self):
+        self.assertEqual(get_event_stats(self.event.pk)['revenue'], 200000)
+        Payment.objects.filter(payment_status='pending').get().delete()
+        with self.assertNumQueries(1):
+            self.assertEqual(get_event_stats(self.event.pk)['payments']['pending'], 0)
+        with self.assertNumQueries(0):
+            get_event_stats(self.event.pk)
+
+    def test_only_the_events_organizer_reads_its_stats(self):
+        other = User.objects.create(username='other')
+        other.groups.add(Group.objects.get(name='organizer'))
+        client = APIClient()
+        for user, expected in ((other, 403), (self.organizer, 200)):
+            client.force_authenticate(user)
+            self.assertEqual(client.get(f'/api/events/{self.event.pk}/stats/').status_code, expected)
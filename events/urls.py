@@ -3,5 +3,8 @@ from . import views
 
 urlpatterns = [
     path('events/', views.EventListCreateView.as_view(), name='event-list'),
+    path('events/batch/', views.EventBatchView.as_view(), name='event-batch'),
     path('events/<uuid:pk>/', views.EventDetailView.as_view(), name='event-detail'),
+    path('events/<uuid:pk>/stats/', views.EventStatsView.as_view(), name='event-stats'),
+    path('catalog/', views.EventCatalogView.as_view(), name='event-catalog'),
 ]
\ No newline at end of file
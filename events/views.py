@@ -1,16 +1,53 @@
+from django.conf import settings
+from django.db import IntegrityError
+from django.db.backends.postgresql.psycopg_any import DateTimeTZRange
 from django.http import Http404
+from django.utils import timezone
+from django.utils.cache import patch_cache_control
 from rest_framework import status
-from rest_framework.permissions import IsAuthenticated
+from rest_framework.permissions import AllowAny, IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.views import APIView
-from rest_framework_simplejwt.authentication import JWTAuthentication
 
-from core.permissions import IsAdminOrOrganizerOrSuperUser
-from events.models import Event
-from events.serializers import EventSerializer
+from archives.archiver import get_archived
+from core.authentication import CachedJWTAuthentication
+from core.batch import batch_response
+from core.fieldsets import get_fieldset
+from core.jobs import start_job
+from core.pagination import KeysetPagination
+from core.permissions import IsAdminOrOrganizerOrSuperUser, IsEventOrganizerOrAdminOrSuperUser
+from core.serializers import JobSerializer
+from events.deletion import JOB_DELETE_EVENT, delete_event, event_size
+from events.models import EVENT_LOCATION_EXCLUSION, Event, EventCatalog, TsTzRange
+from events.serializers import EventCatalogSerializer, EventSerializer, EventWindowSerializer
+from events.stats import get_event_stats
+
+def save_event(serializer, status_code=status.HTTP_200_OK):
+    try:
+        serializer.save()
+    except IntegrityError as exc:
+        # Hanya aktif jika constraint dipasang lewat manage.py event_location_exclusion
+        if EVENT_LOCATION_EXCLUSION not in str(exc):
+            raise
+        return Response(
+            {'location': ['Another event takes place at this location at the same time.']},
+            status=status.HTTP_409_CONFLICT,
+        )
+    return Response(serializer.data, status=status_code)
+
+class EventTimePagination(KeysetPagination):
+    # start_time tidak unik: id memberi urutan yang pasti untuk event yang mulai bersamaan
+    # (index event_start_id_idx, dan events_catalog_start_time di katalog)
+    ordering = ('start_time', 'id')
 
 class EventListCreateView(APIView):
-    authentication_classes = [JWTAuthentication]
+    """
+    `?from=` and `?to=` (ISO 8601, either may be omitted) list the events running
+    at any moment of that window, `?status=live,scheduled` the events in those
+    statuses, ordered by start time and paginated; `?location=` narrows them to
+    one place. Without them the first ten events by name are listed.
+    """
+    authentication_classes = [CachedJWTAuthentication]
 
     def get_permissions(self):
         if self.request.method == 'POST':
@@ -18,27 +55,58 @@ class EventListCreateView(APIView):
         return [IsAuthenticated()]
 
     def get(self, request):
-        events = Event.objects.all().order_by('name')[:10]
-        serializer = EventSerializer(events, many=True)
-        return Response({'events': serializer.data})
+        if not {'from', 'to', 'status'} & request.query_params.keys():
+            events = Event.objects.filter(deleted_at__isnull=True).order_by('name')[:10]
+            serializer = EventSerializer(events, many=True, **get_fieldset(request))
+            return Response({'events': serializer.data})
+
+        window = EventWindowSerializer(data=request.query_params)
+        if not window.is_valid():
+            return Response(window.errors, status=status.HTTP_400_BAD_REQUEST)
+        statuses = [name for name in request.query_params.get('status', '').split(',') if name]
+        unknown = set(statuses) - {choice for choice, _ in Event.STATUS_CHOICES}
+        if unknown:
+            return Response(
+                {'status': [f'Unknown status: {", ".join(sorted(unknown))}.']}, status=status.HTTP_400_BAD_REQUEST
+            )
+
+        events = Event.objects.filter(deleted_at__isnull=True)
+        if window.validated_data:
+            # Overlap tstzrange dilayani index GiST event_time_range_gist
+            events = events.alias(time_range=TsTzRange()).filter(
+                time_range__overlap=DateTimeTZRange(window.validated_data.get('from'), window.validated_data.get('to'))
+            )
+        if statuses:
+            # live/scheduled saja cukup dibaca dari partial index event_active_start_idx
+            events = events.filter(status__in=statuses)
+        if request.query_params.get('location'):
+            events = events.filter(location=request.query_params['location'])
+        paginator = EventTimePagination()
+        page = paginator.paginate_queryset(events, request, view=self)
+        serializer = EventSerializer(page, many=True, **get_fieldset(request))
+        return Response({'events': serializer.data, **paginator.get_page_links()})
 
     def post(self, request):
         serializer = EventSerializer(data=request.data)
         if serializer.is_valid():
-            serializer.save()
-            return Response(serializer.data, status=status.HTTP_201_CREATED)
+            return save_event(serializer, status.HTTP_201_CREATED)
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
 class EventDetailView(APIView):
-    def get_object(self, pk):
+    def get_object(self, pk, archived=False, deleted=False):
+        # Event yang sedang dihapus hanya terlihat oleh DELETE, agar penghapusannya bisa dilanjutkan
+        events = Event.objects.all() if deleted else Event.objects.filter(deleted_at__isnull=True)
         try:
-            event = Event.objects.get(pk=pk)
-            self.check_object_permissions(self.request, event)
-            return event
+            event = events.get(pk=pk)
         except Event.DoesNotExist:
-            raise Http404
+            # Data yang sudah diarsipkan tetap bisa dibaca (read-only)
+            event = get_archived(Event, pk) if archived else None
+            if event is None:
+                raise Http404
+        self.check_object_permissions(self.request, event)
+        return event
 
-    authentication_classes = [JWTAuthentication]
+    authentication_classes = [CachedJWTAuthentication]
 
     def get_permissions(self):
         if self.request.method in ['PUT', 'DELETE']:
@@ -46,19 +114,85 @@ class EventDetailView(APIView):
         return [IsAuthenticated()]
 
     def get(self, request, pk):
-        event = self.get_object(pk)
-        serializer = EventSerializer(event)
+        event = self.get_object(pk, archived=True)
+        serializer = EventSerializer(event, **get_fieldset(request))
         return Response(serializer.data)
 
     def put(self, request, pk):
         event = self.get_object(pk)
         serializer = EventSerializer(event, data=request.data)
         if serializer.is_valid():
-            serializer.save()
-            return Response(serializer.data)
+            return save_event(serializer)
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
     def delete(self, request, pk):
-        event = self.get_object(pk)
-        event.delete()
-        return Response(status=status.HTTP_204_NO_CONTENT)
\ No newline at end of file
+        event = self.get_object(pk, deleted=True)
+        if event_size(event) <= settings.EVENT_DELETE_SYNC_LIMIT:
+            try:
+                delete_event(None, event.pk)
+                return Response(status=status.HTTP_204_NO_CONTENT)
+            except IntegrityError:
+                # Event sudah ditandai terhapus; sisanya dilanjutkan di background
+                pass
+        # Event besar dihapus di background; klien memantau lewat job-detail
+        job = start_job(JOB_DELETE_EVENT, delete_event, event.pk, user=request.user)
+        serializer = JobSerializer(job, context={'request': request})
+        return Response(serializer.data, status=status.HTTP_202_ACCEPTED)
+
+class EventBatchView(APIView):
+    """
+    Many events by id in one call: `GET ?ids=a,b,c` or `POST {"ids": [...]}`, up to
+    BATCH_GET_LIMIT ids. Results follow the order of the ids; unknown ids are
+    listed under `missing`.
+    """
+    authentication_classes = [CachedJWTAuthentication]
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request):
+        return batch_response(self, request, Event.objects.filter(deleted_at__isnull=True), EventSerializer, 'events')
+
+    def post(self, request):
+        return batch_response(self, request, Event.objects.filter(deleted_at__isnull=True), EventSerializer, 'events')
+
+class EventStatsView(APIView):
+    authentication_classes = [CachedJWTAuthentication]
+
+    def get_permissions(self):
+        return [IsAuthenticated(), IsAdminOrOrganizerOrSuperUser(), IsEventOrganizerOrAdminOrSuperUser()]
+
+    def get(self, request, pk):
+        # Pendapatan dan pembayaran hanya untuk organizer event itu sendiri (atau admin)
+        try:
+            event = Event.objects.only('pk', 'organizer_id').get(pk=pk, deleted_at__isnull=True)
+        except Event.DoesNotExist:
+            raise Http404
+        self.check_object_permissions(request, event)
+        stats = get_event_stats(pk)
+        if stats is None:
+            raise Http404
+        return Response(stats)
+
+class EventCatalogView(APIView):
+    """
+    Public, read-only event catalog served from the `events_catalog` materialized
+    view: no joins at request time. `?location=`, `?category=` and `?upcoming=1`
+    filter it; rows are ordered by start time and paginated.
+    """
+    authentication_classes = []
+    permission_classes = [AllowAny]
+
+    def get(self, request):
+        # Katalog baru diperbarui saat refresh; event yang sedang dihapus langsung disembunyikan
+        entries = EventCatalog.objects.exclude(pk__in=Event.objects.filter(deleted_at__isnull=False).values('pk'))
+        for field in ('location', 'category'):
+            if request.query_params.get(field):
+                entries = entries.filter(**{field: request.query_params[field]})
+        if request.query_params.get('upcoming'):
+            entries = entries.filter(start_time__gte=timezone.now())
+        paginator = EventTimePagination()
+        page = paginator.paginate_queryset(entries, request, view=self)
+        serializer = EventCatalogSerializer(page, many=True, **get_fieldset(request))
+        response = Response({'events': serializer.data, **paginator.get_page_links()})
+        # Isi katalog hanya berubah saat refresh, jadi boleh di-cache klien/CDN selama interval itu
+        patch_cache_control(response, public=True, max_age=settings.EVENT_CATALOG_REFRESH_INTERVAL)
+        return response
@@ -0,0 +1,125 @@
+import hashlib
+import hmac
+import time
+
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from django.db import transaction
+from django.db.models.functions import Lower
+
+from events.stats import forget_event_stats
+from payments.models import Payment, PaymentCallback
+
+SIGNATURE_HEADER = 'X-Gateway-Signature'
+
+# Status baru -> status lama yang boleh digantinya; notifikasi lain (terlambat/ganda) diabaikan
+ALLOWED_FROM = {
+    Payment.STATUS_FAILED: (Payment.STATUS_PENDING,),
+    Payment.STATUS_COMPLETED: (Payment.STATUS_PENDING, Payment.STATUS_FAILED),
+    Payment.STATUS_REFUNDED: (Payment.STATUS_COMPLETED,),
+}
+
+
+def sign(body, secret=None, timestamp=None):
+    """
+    The signature header value of a callback body: `t=<unix time>,v1=<hex
+    HMAC-SHA256 of "<t>." + body>`. Used by the gateway stub and in tests.
+    """
+    timestamp = int(time.time()) if timestamp is None else timestamp
+    secret = secret or settings.PAYMENT_GATEWAY_SECRET
+    if not secret:
+        raise ImproperlyConfigured('PAYMENT_GATEWAY_SECRET is not set.')
+    digest = hmac.new(secret.encode(), f'{timestamp}.'.encode() + body, hashlib.sha256).hexdigest()
+    return f't={timestamp},v1={digest}'
+
+
+def verify_signature(header, body, secret=None, tolerance=None, now=None):
+    """
+    True if `header` signs `body` with the gateway secret within the tolerance;
+    the timestamp is part of the signed text, so old requests cannot be replayed.
+    """
+    secret = secret or settings.PAYMENT_GATEWAY_SECRET
+    if not secret:
+        # Tanpa secret siapa pun bisa membuat tanda tangan yang "valid"
+        return False
+    tolerance = settings.PAYMENT_CALLBACK_TOLERANCE if tolerance is None else tolerance
+    now = time.time() if now is None else now
+    try:
+        fields = dict(part.split('=', 1) for part in (header or '').split(','))
+        timestamp = int(fields['t'])
+    except (KeyError, ValueError):
+        return False
+    if abs(now - timestamp) > tolerance:
+        return False
+    expected = sign(body, secret, timestamp).split('v1=', 1)[1]
+    return hmac.compare_digest(expected, fields.get('v1', ''))
+
+
+def ingest_notifications(notifications):
+    """
+    Applies a batch of validated gateway notifications (`id`, `payment_id`,
+    `status`, optional `amount` and `occurred_at`) with a fixed number of queries:
+    one SELECT of the payments, one INSERT of the new notifications (already
+    received ids are skipped by the unique index) and at most one UPDATE per
+    target status.
+
+    The UPDATEs run in the order failed, completed, refunded and only move a
+    payment forward (ALLOWED_FROM), so notifications arriving out of order or
+    twice never move a payment backwards.
+    """
+    result = {'received': len(notifications), 'applied': 0, 'duplicate': [], 'unknown': [], 'rejected': []}
+    batch = {}
+    for notification in notifications:
+        if notification['id'] in batch:
+            result['duplicate'].append(notification['id'])
+        else:
+            batch[notification['id']] = notification
+
+    payments = {
+        pk: (amount_paid, event_id)
+        for pk, amount_paid, event_id in Payment.objects.filter(
+            pk__in={notification['payment_id'] for notification in batch.values()}
+        ).values_list('pk', 'amount_paid', 'registration_id__ticket_id__event_id')
+    }
+    callbacks = []
+    for notification in batch.values():
+        payment = payments.get(notification['payment_id'])
+        if payment is None:
+            result['unknown'].append(notification['id'])
+        elif notification.get('amount') is not None and notification['amount'] != payment[0]:
+            result['rejected'].append(notification['id'])
+        else:
+            callbacks.append(PaymentCallback(
+                notification_id=notification['id'],
+                payment_id_id=notification['payment_id'],
+                status=notification['status'],
+                occurred_at=notification.get('occurred_at'),
+            ))
+
+    with transaction.atomic():
+        PaymentCallback.objects.bulk_create(callbacks, batch_size=1000, ignore_conflicts=True)
+        inserted = set(
+            PaymentCallback.objects.filter(pk__in=[callback.pk for callback in callbacks]).values_list('pk', flat=True)
+        )
+        targets = {}
+        for callback in callbacks:
+            if callback.pk not in inserted:
+                result['duplicate'].append(callback.notification_id)
+            elif callback.status in ALLOWED_FROM:
+                targets.setdefault(callback.status, set()).add(callback.payment_id_id)
+
+        updated = set()
+        for new_status, allowed in ALLOWED_FROM.items():
+            if new_status not in targets:
+                continue
+            # payment_status masih teks bebas, jadi dibandingkan dalam huruf kecil
+            payments_to_update = Payment.objects.filter(pk__in=targets[new_status]).alias(
+                current=Lower('payment_status')
+            ).filter(current__in=allowed)
+            result['applied'] += payments_to_update.update(payment_status=new_status)
+            updated |= targets[new_status]
+
+        # UPDATE massal tidak mengirim sinyal, jadi statistik event dibuang di sini
+        event_ids = {payments[payment_id][1] for payment_id in updated}
+        transaction.on_commit(lambda: forget_event_stats(event_ids))
+    return result
@@ -0,0 +1,96 @@
+import secrets
+import statistics
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext, override_settings
+from rest_framework.test import APIClient
+
+from core.loadgen import percentile
+from payments.models import Payment
+from payments.stub_gateway import StubGateway
+
+
+class Command(BaseCommand):
+    help = (
+        'Pushes stub gateway notifications for existing pending payments (seed_data) through '
+        'POST /api/payments/callbacks/ in batches and reports notifications per second, request '
+        'latency and queries per request. --batch 1 gives the one-callback-per-request baseline. '
+        'In-process runs are rolled back unless --commit; --url sends to a running server instead.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--payments', type=int, default=10_000, help='Pending payments to drive.')
+        parser.add_argument('--batch', type=int, default=1000, help='Notifications per request.')
+        parser.add_argument('--duplicate-rate', type=float, default=0.05, help='Share of redelivered notifications.')
+        parser.add_argument('--shuffle', action='store_true', help='Deliver notifications out of order.')
+        parser.add_argument('--url', help='Callback URL of a running server, e.g. http://localhost:8000/api/payments/callbacks/.')
+        parser.add_argument('--commit', action='store_true', help='In-process: keep the status changes.')
+        parser.add_argument('--secret', help='Gateway secret to sign with (default PAYMENT_GATEWAY_SECRET).')
+
+    def handle(self, *args, **options):
+        payments = list(
+            Payment.objects.filter(payment_status__iexact=Payment.STATUS_PENDING).values_list('pk', 'amount_paid')[
+                :options['payments']
+            ]
+        )
+        if not payments:
+            raise CommandError('No pending payments, run seed_data first.')
+        secret = options['secret'] or settings.PAYMENT_GATEWAY_SECRET
+        if not secret:
+            if options['url']:
+                raise CommandError('The server checks PAYMENT_GATEWAY_SECRET, pass the same value with --secret.')
+            # In-process: secret sekali pakai, dipasang di override_settings di bawah
+            secret = secrets.token_hex(32)
+        gateway = StubGateway(secret, duplicate_rate=options['duplicate_rate'], shuffle=options['shuffle'])
+        notifications = gateway.notifications(payments, {
+            Payment.STATUS_COMPLETED: 85, Payment.STATUS_FAILED: 10, Payment.STATUS_REFUNDED: 5,
+        })
+        batches = [notifications[i:i + options['batch']] for i in range(0, len(notifications), options['batch'])]
+
+        latencies, query_counts, totals = [], [], {'applied': 0, 'duplicate': 0, 'unknown': 0, 'rejected': 0}
+        started = time.perf_counter()
+        if options['url']:
+            for batch in batches:
+                sent = time.perf_counter()
+                code, result = gateway.deliver(options['url'], batch)
+                latencies.append((time.perf_counter() - sent) * 1000)
+                self.add_result(code, result, totals)
+        else:
+            client = APIClient()
+            with transaction.atomic(), override_settings(ALLOWED_HOSTS=['*'], PAYMENT_GATEWAY_SECRET=secret):
+                for batch in batches:
+                    body, headers = gateway.request(batch)
+                    sent = time.perf_counter()
+                    with CaptureQueriesContext(connection) as queries:
+                        response = client.generic(
+                            'POST', '/api/payments/callbacks/', body,
+                            content_type='application/json', HTTP_X_GATEWAY_SIGNATURE=headers['X-Gateway-Signature'],
+                        )
+                    latencies.append((time.perf_counter() - sent) * 1000)
+                    query_counts.append(len(queries))
+                    self.add_result(response.status_code, response.json(), totals)
+                if not options['commit']:
+                    transaction.set_rollback(True)
+        elapsed = time.perf_counter() - started
+
+        latencies.sort()
+        self.stdout.write(
+            f'{len(notifications)} notifications for {len(payments)} payments in {len(batches)} requests '
+            f'of up to {options["batch"]}: {len(notifications) / elapsed:.0f} notifications/s'
+        )
+        self.stdout.write(
+            f'request ms: p50 {percentile(latencies, 0.5):.1f}, p95 {percentile(latencies, 0.95):.1f}, '
+            f'max {latencies[-1]:.1f}'
+            + (f'; queries per request: {statistics.median(query_counts):.0f}' if query_counts else '')
+        )
+        self.stdout.write(', '.join(f'{count} {name}' for name, count in totals.items()))
+
+    def add_result(self, code, result, totals):
+        if code != 200:
+            raise CommandError(f'Callback answered {code}: {result}')
+        totals['applied'] += result['applied']
+        for name in ('duplicate', 'unknown', 'rejected'):
+            totals[name] += len(result[name])
@@ -0,0 +1,17 @@
+# Generated by Django 4.2 on 2026-10-19 14:24
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('payments', '0003_alter_payment_amount_paid'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='payment',
+            index=models.Index(fields=['registration_id', 'id'], name='payment_registration_idx'),
+        ),
+    ]
@@ -0,0 +1,32 @@
+from django.db import migrations, models
+from django.db.models import OuterRef, Subquery
+
+
+def backfill_event_start(apps, schema_editor):
+    Registration = apps.get_model('registrations', 'Registration')
+    Payment = apps.get_model('payments', 'Payment')
+    Payment.objects.update(
+        event_start=Subquery(Registration.objects.filter(pk=OuterRef('registration_id')).values('event_start')[:1])
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('registrations', '0004_registration_event_start'),
+        ('payments', '0004_payment_payment_registration_idx'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='payment',
+            name='event_start',
+            field=models.DateTimeField(editable=False, null=True),
+        ),
+        migrations.RunPython(backfill_event_start, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name='payment',
+            name='event_start',
+            field=models.DateTimeField(editable=False),
+        ),
+    ]
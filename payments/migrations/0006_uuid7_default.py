@@ -0,0 +1,19 @@
+# Generated by Django 4.2 on 2026-10-19 14:36
+
+import core.ids
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('payments', '0005_payment_event_start'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='payment',
+            name='id',
+            field=models.UUIDField(default=core.ids.new_id, editable=False, primary_key=True, serialize=False),
+        ),
+    ]
@@ -0,0 +1,26 @@
+# Generated by Django 4.2 on 2026-10-19 14:54
+
+import core.ids
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('payments', '0006_uuid7_default'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PaymentCallback',
+            fields=[
+                ('id', models.UUIDField(default=core.ids.new_id, editable=False, primary_key=True, serialize=False)),
+                ('notification_id', models.CharField(max_length=100, unique=True)),
+                ('status', models.CharField(max_length=50)),
+                ('occurred_at', models.DateTimeField(blank=True, null=True)),
+                ('received_at', models.DateTimeField(auto_now_add=True)),
+                ('payment_id', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='payments.payment')),
+            ],
+        ),
+    ]
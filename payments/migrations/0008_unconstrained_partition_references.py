@@ -0,0 +1,19 @@
+# Generated by Django 4.2 on 2026-10-19 15:26
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('payments', '0007_payment_callback'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='paymentcallback',
+            name='payment_id',
+            field=models.ForeignKey(db_constraint=False, on_delete=django.db.models.deletion.CASCADE, to='payments.payment'),
+        ),
+    ]
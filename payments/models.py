@@ -1,13 +1,53 @@
-import uuid
-
 from django.db import models
 
+from core.ids import new_id
 from registrations.models import Registration
 
 # Create your models here.
 class Payment(models.Model):
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    # payment_status masih teks bebas; nilai-nilai ini dibandingkan tanpa memperhatikan huruf besar/kecil
+    STATUS_PENDING = 'pending'
+    STATUS_COMPLETED = 'completed'
+    STATUS_FAILED = 'failed'
+    STATUS_REFUNDED = 'refunded'
+    STATUSES = (STATUS_PENDING, STATUS_COMPLETED, STATUS_FAILED, STATUS_REFUNDED)
+
+    id = models.UUIDField(primary_key=True, default=new_id, editable=False)
     payment_method = models.CharField(max_length=50)
     payment_status = models.CharField(max_length=50)
     amount_paid = models.PositiveIntegerField(default=0)
-    registration_id = models.ForeignKey(Registration, on_delete=models.CASCADE)
\ No newline at end of file
+    registration_id = models.ForeignKey(Registration, on_delete=models.CASCADE)
+    # Salinan Registration.event_start, dipakai sebagai kunci partisi (lihat manage_partitions)
+    event_start = models.DateTimeField(editable=False)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['registration_id', 'id'], name='payment_registration_idx'),
+        ]
+
+    def save(self, *args, **kwargs):
+        update_fields = kwargs.get('update_fields')
+        if update_fields is None or 'registration_id' in update_fields:
+            if Payment.registration_id.is_cached(self):
+                self.event_start = self.registration_id.event_start
+            else:
+                self.event_start = Registration.objects.values_list('event_start', flat=True).get(
+                    pk=self.registration_id_id
+                )
+            if update_fields is not None:
+                kwargs['update_fields'] = {*update_fields, 'event_start'}
+        super().save(*args, **kwargs)
+
+class PaymentCallback(models.Model):
+    """
+    A status notification received from the payment gateway. The unique
+    `notification_id` makes redelivered notifications no-ops.
+    """
+    id = models.UUIDField(primary_key=True, default=new_id, editable=False)
+    notification_id = models.CharField(max_length=100, unique=True)
+    # Tanpa constraint di database: pembayaran dipartisi per event_start (manage_partitions) dan
+    # tabel berpartisi tidak bisa dirujuk lewat `id` saja; on_delete tetap dijalankan Django
+    payment_id = models.ForeignKey(Payment, on_delete=models.CASCADE, db_constraint=False)
+    status = models.CharField(max_length=50)
+    occurred_at = models.DateTimeField(null=True, blank=True)
+    received_at = models.DateTimeField(auto_now_add=True)
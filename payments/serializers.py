@@ -1,11 +1,13 @@
+from django.conf import settings
 from rest_framework.reverse import reverse
 from rest_framework import serializers
 
+from core.fieldsets import SparseFieldsetMixin, SparseListSerializer
 from payments.models import Payment
 from registrations.models import Registration
 from registrations.serializers import RegistrationSerializer
 
-class PaymentSerializer(serializers.HyperlinkedModelSerializer):
+class PaymentSerializer(SparseFieldsetMixin, serializers.HyperlinkedModelSerializer):
     _links = serializers.SerializerMethodField()
     registration = serializers.CharField(source='registration_id.id', read_only=True)
     registration_id = serializers.PrimaryKeyRelatedField(
@@ -16,6 +18,7 @@ class PaymentSerializer(serializers.HyperlinkedModelSerializer):
     class Meta:
         model = Payment
         fields = ('id', 'payment_method', 'payment_status', 'amount_paid', 'registration', 'registration_id', '_links')
+        list_serializer_class = SparseListSerializer
 
     def get__links(self, obj):
         request = self.context.get('request')
@@ -47,4 +50,36 @@ class PaymentSerializer(serializers.HyperlinkedModelSerializer):
                 "type": ["application/json"]
             }
 
-        ]
\ No newline at end of file
+        ]
+
+class UserPaymentSerializer(PaymentSerializer):
+    """
+    A user's own payment with the ticket and event it paid for.
+    """
+    ticket = serializers.CharField(source='registration_id.ticket_id.name', read_only=True)
+    ticket_id = serializers.PrimaryKeyRelatedField(source='registration_id.ticket_id', read_only=True)
+    event = serializers.CharField(source='registration_id.ticket_id.event_id.name', read_only=True)
+    event_id = serializers.PrimaryKeyRelatedField(source='registration_id.ticket_id.event_id', read_only=True)
+    event_start_time = serializers.DateTimeField(source='registration_id.ticket_id.event_id.start_time', read_only=True)
+
+    class Meta(PaymentSerializer.Meta):
+        fields = (
+            'id', 'payment_method', 'payment_status', 'amount_paid', 'registration', 'ticket', 'ticket_id',
+            'event', 'event_id', 'event_start_time', '_links',
+        )
+
+class PaymentNotificationSerializer(serializers.Serializer):
+    id = serializers.CharField(max_length=100)
+    payment_id = serializers.UUIDField()
+    status = serializers.ChoiceField(choices=Payment.STATUSES)
+    amount = serializers.IntegerField(min_value=0, required=False)
+    occurred_at = serializers.DateTimeField(required=False)
+
+class PaymentCallbackBatchSerializer(serializers.Serializer):
+    """
+    Gateway notifications delivered together; a single notification is wrapped
+    into a batch of one by the view.
+    """
+    notifications = PaymentNotificationSerializer(
+        many=True, allow_empty=False, max_length=settings.PAYMENT_CALLBACK_BATCH_LIMIT
+    )
@@ -0,0 +1,77 @@
+import json
+import random
+import urllib.error
+import urllib.request
+import uuid
+from datetime import timedelta
+
+from django.core.serializers.json import DjangoJSONEncoder
+from django.utils import timezone
+
+from payments.callbacks import SIGNATURE_HEADER, sign
+from payments.models import Payment
+
+# Urutan status yang dikirim gateway sampai status akhir tercapai
+LIFECYCLES = {
+    Payment.STATUS_COMPLETED: [Payment.STATUS_PENDING, Payment.STATUS_COMPLETED],
+    Payment.STATUS_FAILED: [Payment.STATUS_PENDING, Payment.STATUS_FAILED],
+    Payment.STATUS_REFUNDED: [Payment.STATUS_PENDING, Payment.STATUS_COMPLETED, Payment.STATUS_REFUNDED],
+}
+
+
+class StubGateway:
+    """
+    Local stand-in for a payment provider, for tests and benchmarks: produces the
+    notifications a real gateway would push for payments, with redeliveries and
+    out-of-order delivery if asked, and signs and posts them like it would.
+    """
+    def __init__(self, secret=None, duplicate_rate=0.0, shuffle=False, seed=0):
+        self.secret = secret
+        self.duplicate_rate = duplicate_rate
+        self.shuffle = shuffle
+        self.rng = random.Random(seed)
+
+    def notifications(self, payments, outcomes=None):
+        """
+        Notifications taking each `(payment_id, amount)` through the lifecycle of an
+        outcome drawn from `outcomes` ({status: weight}, default all completed).
+        """
+        outcomes = outcomes or {Payment.STATUS_COMPLETED: 1}
+        now = timezone.now()
+        notifications = []
+        for payment_id, amount in payments:
+            outcome = self.rng.choices(list(outcomes), weights=list(outcomes.values()))[0]
+            for step, status in enumerate(LIFECYCLES[outcome]):
+                notification = {
+                    'id': f'evt_{uuid.UUID(int=self.rng.getrandbits(128)).hex}',
+                    'payment_id': str(payment_id),
+                    'status': status,
+                    'amount': amount,
+                    'occurred_at': now + timedelta(seconds=step),
+                }
+                notifications.append(notification)
+                if self.rng.random() < self.duplicate_rate:
+                    notifications.append(dict(notification))
+        if self.shuffle:
+            self.rng.shuffle(notifications)
+        return notifications
+
+    def request(self, notifications, timestamp=None):
+        """
+        Body and headers of one callback request carrying `notifications`.
+        """
+        body = json.dumps({'notifications': notifications}, cls=DjangoJSONEncoder).encode()
+        headers = {'Content-Type': 'application/json', SIGNATURE_HEADER: sign(body, self.secret, timestamp)}
+        return body, headers
+
+    def deliver(self, url, notifications, timeout=30):
+        """
+        Posts the notifications to a running server. Returns (status, decoded JSON).
+        """
+        body, headers = self.request(notifications)
+        http_request = urllib.request.Request(url, data=body, headers=headers, method='POST')
+        try:
+            with urllib.request.urlopen(http_request, timeout=timeout) as response:
+                return response.status, json.loads(response.read())
+        except urllib.error.HTTPError as exc:
+            return exc.code, json.loads(exc.read() or b'null')
@@ -1,3 +1,101 @@
-from django.test import TestCase
+import uuid
 
-# Create your tests here.
+from django.test import TestCase, override_settings
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from core.models import User
+from events.models import Event
+from payments.callbacks import ingest_notifications, sign, verify_signature
+from payments.models import Payment
+from payments.stub_gateway import StubGateway
+from registrations.models import Registration
+from tickets.models import Ticket
+
+
+class PaymentCallbackTest(TestCase):
+    def setUp(self):
+        now = timezone.now()
+        organizer = User.objects.create(username='organizer')
+        event = Event.objects.create(
+            name='Event', location='Jakarta', start_time=now, end_time=now, category='music', organizer_id=organizer,
+        )
+        ticket = Ticket.objects.create(name='Ticket', price=50000, sales_start=now, sales_end=now, quota=10, event_id=event)
+        self.payments = [
+            Payment.objects.create(
+                registration_id=Registration.objects.create(ticket_id=ticket, user_id=organizer),
+                payment_method='QRIS', payment_status='Pending', amount_paid=50000,
+            )
+            for _ in range(2)
+        ]
+
+    def test_signature_binds_body_and_time(self):
+        header = sign(b'{}', 'secret', timestamp=1000)
+        self.assertTrue(verify_signature(header, b'{}', 'secret', tolerance=300, now=1100))
+        self.assertFalse(verify_signature(header, b'{"a": 1}', 'secret', tolerance=300, now=1100))
+        self.assertFalse(verify_signature(header, b'{}', 'secret', tolerance=300, now=2000))
+        self.assertFalse(verify_signature('garbage', b'{}', 'secret'))
+
+    @override_settings(ALLOWED_HOSTS=['*'], PAYMENT_GATEWAY_SECRET='')
+    def test_callbacks_are_refused_without_a_configured_secret(self):
+        body = b'{"notifications": []}'
+        self.assertFalse(verify_signature(sign(body, 'guess'), body, ''))
+        response = APIClient().post(
+            '/api/payments/callbacks/', body, content_type='application/json',
+            HTTP_X_GATEWAY_SIGNATURE=sign(body, 'guess'),
+        )
+        self.assertEqual(response.status_code, 503)
+
+    def test_out_of_order_and_redelivered_notifications_only_move_forward(self):
+        gateway = StubGateway(duplicate_rate=1.0, shuffle=True)
+        refunded, failed = self.payments
+        notifications = (
+            gateway.notifications([(refunded.pk, 50000)], {Payment.STATUS_REFUNDED: 1}) +
+            gateway.notifications([(failed.pk, 50000)], {Payment.STATUS_FAILED: 1})
+        )
+        for notification in notifications:
+            notification['payment_id'] = uuid.UUID(notification['payment_id'])
+        notifications.reverse()
+
+        result = ingest_notifications(notifications)
+        self.assertEqual(len(result['duplicate']), len(notifications) // 2)
+        self.assertEqual(
+            [Payment.objects.get(pk=payment.pk).payment_status for payment in self.payments],
+            [Payment.STATUS_REFUNDED, Payment.STATUS_FAILED],
+        )
+        again = ingest_notifications(notifications)
+        self.assertEqual((again['applied'], len(again['duplicate'])), (0, len(notifications)))
+
+
+@override_settings(ALLOWED_HOSTS=['*'])
+class UserPaymentListTest(TestCase):
+    def test_pages_only_the_users_payments_once_each(self):
+        now = timezone.now()
+        user, other = User.objects.create(username='user'), User.objects.create(username='other')
+        event = Event.objects.create(
+            name='Event', location='Jakarta', start_time=now, end_time=now, category='music', organizer_id=other,
+        )
+        ticket = Ticket.objects.create(name='Ticket', price=50000, sales_start=now, sales_end=now, quota=10, event_id=event)
+        own = [
+            Payment.objects.create(
+                id=uuid.uuid4(), registration_id=Registration.objects.create(ticket_id=ticket, user_id=user),
+                payment_method='QRIS', payment_status='Pending', amount_paid=50000,
+            )
+            for _ in range(5)
+        ]
+        Payment.objects.create(
+            registration_id=Registration.objects.create(ticket_id=ticket, user_id=other),
+            payment_method='QRIS', payment_status='Pending', amount_paid=50000,
+        )
+
+        client = APIClient()
+        client.force_authenticate(user)
+        with self.assertNumQueries(1):
+            response = client.get('/api/payments/me/', {'limit': 2})
+        self.assertEqual((response.data['payments'][0]['ticket'], response.data['payments'][0]['event']), ('Ticket', 'Event'))
+
+        seen = [payment['id'] for payment in response.data['payments']]
+        while response.data['next']:
+            response = client.get(response.data['next'])
+            seen += [payment['id'] for payment in response.data['payments']]
+        self.assertEqual(seen, sorted(str(payment.pk) for payment in own))
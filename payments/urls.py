@@ -3,5 +3,7 @@ from . import views
 
 urlpatterns = [
     path('payments/', views.PaymentListCreateView.as_view(), name='payment-list'),
+    path('payments/me/', views.UserPaymentListView.as_view(), name='payment-me'),
+    path('payments/callbacks/', views.PaymentCallbackView.as_view(), name='payment-callbacks'),
     path('payments/<uuid:pk>/', views.PaymentDetailView.as_view(), name='payment-detail'),
 ]
\ No newline at end of file
@@ -1,18 +1,23 @@
+from django.conf import settings
 from django.http import Http404
 from django.shortcuts import render
 from rest_framework import status
-from rest_framework.permissions import IsAuthenticated
+from rest_framework.permissions import AllowAny, IsAuthenticated
 from rest_framework.views import APIView
-from rest_framework_simplejwt.authentication import JWTAuthentication
 from rest_framework.response import Response
 
+from archives.archiver import get_archived
+from core.authentication import CachedJWTAuthentication
+from core.fieldsets import get_fieldset
+from core.pagination import KeysetPagination
 from core.permissions import IsAdminOrSuperUser
+from payments import callbacks
 from payments.models import Payment
-from payments.serializers import PaymentSerializer
+from payments.serializers import PaymentCallbackBatchSerializer, PaymentSerializer, UserPaymentSerializer
 
 # Create your views here.
 class PaymentListCreateView(APIView):
-    authentication_classes = [JWTAuthentication]
+    authentication_classes = [CachedJWTAuthentication]
 
     def get_permissions(self):
         if self.request.method == 'POST':
@@ -21,7 +26,7 @@ class PaymentListCreateView(APIView):
 
     def get(self, request):
         payments = Payment.objects.all().order_by('id')[:10]
-        serializer = PaymentSerializer(payments, many=True)
+        serializer = PaymentSerializer(payments, many=True, **get_fieldset(request))
         return Response({'payments': serializer.data})
 
     def post(self, request):
@@ -31,16 +36,38 @@ class PaymentListCreateView(APIView):
             return Response(serializer.data, status=status.HTTP_201_CREATED)
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
+class UserPaymentListView(APIView):
+    """
+    The payments of the signed-in user with their ticket and event, joined in the
+    same query. Pages follow the id (see KeysetPagination), not the payment time.
+    """
+    authentication_classes = [CachedJWTAuthentication]
+
+    def get_permissions(self):
+        return [IsAuthenticated()]
+
+    def get(self, request):
+        payments = Payment.objects.filter(
+            registration_id__user_id=request.user.pk
+        ).select_related('registration_id__ticket_id__event_id')
+        paginator = KeysetPagination()
+        page = paginator.paginate_queryset(payments, request, view=self)
+        serializer = UserPaymentSerializer(page, many=True, **get_fieldset(request))
+        return Response({'payments': serializer.data, **paginator.get_page_links()})
+
 class PaymentDetailView(APIView):
-    def get_object(self, pk):
+    def get_object(self, pk, archived=False):
         try:
             payment = Payment.objects.get(pk=pk)
-            self.check_object_permissions(self.request, payment)
-            return payment
         except Payment.DoesNotExist:
-            raise Http404
+            # Data yang sudah diarsipkan tetap bisa dibaca (read-only)
+            payment = get_archived(Payment, pk) if archived else None
+            if payment is None:
+                raise Http404
+        self.check_object_permissions(self.request, payment)
+        return payment
 
-    authentication_classes = [JWTAuthentication]
+    authentication_classes = [CachedJWTAuthentication]
 
     def get_permissions(self):
         if self.request.method == 'GET':
@@ -48,8 +75,8 @@ class PaymentDetailView(APIView):
         return [IsAuthenticated()]
 
     def get(self, request, pk):
-        payment = self.get_object(pk)
-        serializer = PaymentSerializer(payment)
+        payment = self.get_object(pk, archived=True)
+        serializer = PaymentSerializer(payment, **get_fieldset(request))
         return Response(serializer.data)
 
     def put(self, request, pk):
@@ -64,3 +91,30 @@ class PaymentDetailView(APIView):
         payment = self.get_object(pk)
         payment.delete()
         return Response(status=status.HTTP_204_NO_CONTENT)
+
+class PaymentCallbackView(APIView):
+    """
+    Status notifications pushed by the payment gateway, one object or
+    `{"notifications": [...]}`. Authenticated by the X-Gateway-Signature header
+    instead of a user token; answers 503 while PAYMENT_GATEWAY_SECRET is unset.
+    """
+    authentication_classes = []
+    permission_classes = [AllowAny]
+    # Gateway mengirim ribuan callback per menit dari beberapa IP saja; batas anon tidak berlaku
+    throttle_classes = []
+
+    def post(self, request):
+        if not settings.PAYMENT_GATEWAY_SECRET:
+            return Response(
+                {'detail': 'Payment callbacks are not configured.'}, status=status.HTTP_503_SERVICE_UNAVAILABLE
+            )
+        # Tanda tangan dihitung dari body mentah, sebelum diparse
+        if not callbacks.verify_signature(request.headers.get(callbacks.SIGNATURE_HEADER), request.body):
+            return Response({'detail': 'Invalid or expired signature.'}, status=status.HTTP_401_UNAUTHORIZED)
+        data = request.data
+        if not (hasattr(data, 'get') and 'notifications' in data):
+            data = {'notifications': [data]}
+        serializer = PaymentCallbackBatchSerializer(data=data)
+        if not serializer.is_valid():
+            return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+        return Response(callbacks.ingest_notifications(serializer.validated_data['notifications']))
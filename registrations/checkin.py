@@ -0,0 +1,131 @@
+import base64
+import binascii
+import hashlib
+import hmac
+import uuid
+
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+from django.utils.crypto import salted_hmac
+
+from registrations.models import CheckIn, Registration
+
+TOKEN_VERSION = 1
+
+# HMAC-SHA256 dipotong 16 byte: cukup untuk pemalsuan, tetap muat di QR kecil
+MAC_SIZE = 16
+
+_PAYLOAD_SIZE = 1 + 16 + 16
+
+
+def _b64encode(data):
+    return base64.urlsafe_b64encode(data).rstrip(b'=').decode()
+
+
+def _b64decode(text):
+    return base64.urlsafe_b64decode(text + '=' * (-len(text) % 4))
+
+
+def event_key(event_id):
+    """
+    The key gates of one event verify tokens with. It is derived from
+    CHECKIN_SIGNING_KEY, so a leaked gate key only forges tokens for that event.
+    """
+    return salted_hmac('registrations.checkin', str(event_id), secret=settings.CHECKIN_SIGNING_KEY).digest()
+
+
+def encoded_event_key(event_id):
+    return _b64encode(event_key(event_id))
+
+
+def issue_token(registration, event_id):
+    """
+    Signed check-in token of a registration: base64url(version, registration id,
+    ticket id, HMAC-SHA256(event key, those 33 bytes)[:16]).
+    """
+    payload = bytes([TOKEN_VERSION]) + registration.pk.bytes + registration.ticket_id_id.bytes
+    mac = hmac.new(event_key(event_id), payload, hashlib.sha256).digest()[:MAC_SIZE]
+    return _b64encode(payload + mac)
+
+
+def verify_token(token, key):
+    """
+    Checks a token against an event key without touching the database, as a gate
+    does offline. Returns `(registration_id, ticket_id)` or None.
+    """
+    try:
+        data = _b64decode(token)
+    except (binascii.Error, ValueError, TypeError):
+        return None
+    if len(data) != _PAYLOAD_SIZE + MAC_SIZE or data[0] != TOKEN_VERSION:
+        return None
+    payload, mac = data[:_PAYLOAD_SIZE], data[_PAYLOAD_SIZE:]
+    if not hmac.compare_digest(mac, hmac.new(key, payload, hashlib.sha256).digest()[:MAC_SIZE]):
+        return None
+    return uuid.UUID(bytes=payload[1:17]), uuid.UUID(bytes=payload[17:])
+
+
+def ingest_scans(event_id, scans):
+    """
+    Records a gate's batch of scans (`token`, optional `scanned_at` and `gate`)
+    for one event. Tokens are verified in memory; the database sees one query for
+    registrations that still exist, one for earlier check-ins and one INSERT.
+
+    Returns the number of admitted registrations and the indexes into `scans` of
+    the invalid, revoked (registration deleted) and duplicate ones. Of repeated
+    scans of one registration only the earliest can be admitted.
+    """
+    key = event_key(event_id)
+    now = timezone.now()
+    result = {'accepted': 0, 'invalid': [], 'revoked': [], 'duplicate': []}
+    earliest = {}
+    for index, scan in enumerate(scans):
+        claims = verify_token(scan['token'], key)
+        if claims is None:
+            result['invalid'].append(index)
+            continue
+        registration_id = claims[0]
+        previous = earliest.get(registration_id)
+        if previous is None:
+            earliest[registration_id] = index
+        elif scans[index].get('scanned_at', now) < scans[previous].get('scanned_at', now):
+            result['duplicate'].append(previous)
+            earliest[registration_id] = index
+        else:
+            result['duplicate'].append(index)
+    if not earliest:
+        return result
+
+    existing = set(
+        Registration.objects.filter(pk__in=earliest, ticket_id__event_id=event_id).values_list('pk', flat=True)
+    )
+    checked_in = set(
+        CheckIn.objects.filter(registration_id__in=existing).values_list('registration_id', flat=True)
+    )
+    check_ins = []
+    for registration_id, index in earliest.items():
+        if registration_id not in existing:
+            result['revoked'].append(index)
+        elif registration_id in checked_in:
+            result['duplicate'].append(index)
+        else:
+            check_ins.append(CheckIn(
+                registration_id_id=registration_id,
+                event_id_id=event_id,
+                gate=scans[index].get('gate', ''),
+                scanned_at=scans[index].get('scanned_at', now),
+            ))
+
+    with transaction.atomic():
+        CheckIn.objects.bulk_create(check_ins, batch_size=1000, ignore_conflicts=True)
+        # Gate lain bisa menyinkronkan registrasi yang sama bersamaan; hanya baris milik batch ini yang tersimpan
+        inserted = set(
+            CheckIn.objects.filter(pk__in=[check_in.pk for check_in in check_ins]).values_list('registration_id', flat=True)
+        )
+    for check_in in check_ins:
+        if check_in.registration_id_id not in inserted:
+            result['duplicate'].append(earliest[check_in.registration_id_id])
+    result['accepted'] = len(inserted)
+    result['duplicate'].sort()
+    return result
@@ -0,0 +1,23 @@
+from django.core.management.base import BaseCommand
+
+from registrations.models import WaitlistEntry
+from registrations.waitlist import promote_waitlist
+
+
+class Command(BaseCommand):
+    help = 'Promotes waiting users into free seats for every ticket with a non-empty waitlist.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=None)
+
+    def handle(self, *args, **options):
+        ticket_ids = (
+            WaitlistEntry.objects
+            .filter(status=WaitlistEntry.STATUS_WAITING)
+            .values_list('ticket_id', flat=True)
+            .distinct()
+        )
+        total = 0
+        for ticket_id in ticket_ids:
+            total += promote_waitlist(ticket_id, batch_size=options['batch_size'])
+        self.stdout.write(self.style.SUCCESS(f'Promoted {total} waitlisted users.'))
@@ -0,0 +1,17 @@
+# Generated by Django 4.2 on 2026-10-19 14:24
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('registrations', '0002_waitlist'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='registration',
+            index=models.Index(fields=['user_id', 'id'], name='registration_user_idx'),
+        ),
+    ]
@@ -0,0 +1,32 @@
+from django.db import migrations, models
+from django.db.models import OuterRef, Subquery
+
+
+def backfill_event_start(apps, schema_editor):
+    Event = apps.get_model('events', 'Event')
+    Registration = apps.get_model('registrations', 'Registration')
+    Registration.objects.update(
+        event_start=Subquery(Event.objects.filter(ticket__id=OuterRef('ticket_id')).values('start_time')[:1])
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('events', '0001_initial'),
+        ('registrations', '0003_registration_registration_user_idx'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='registration',
+            name='event_start',
+            field=models.DateTimeField(editable=False, null=True),
+        ),
+        migrations.RunPython(backfill_event_start, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name='registration',
+            name='event_start',
+            field=models.DateTimeField(editable=False),
+        ),
+    ]
@@ -0,0 +1,27 @@
+# Generated by Django 4.2 on 2026-10-19 14:50
+
+import core.ids
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('events', '0003_event_time_indexes'),
+        ('registrations', '0005_uuid7_default'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CheckIn',
+            fields=[
+                ('id', models.UUIDField(default=core.ids.new_id, editable=False, primary_key=True, serialize=False, unique=True)),
+                ('gate', models.CharField(blank=True, max_length=100)),
+                ('scanned_at', models.DateTimeField()),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('event_id', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='events.event')),
+                ('registration_id', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, to='registrations.registration')),
+            ],
+        ),
+    ]
@@ -0,0 +1,24 @@
+# Generated by Django 4.2 on 2026-10-19 15:26
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('registrations', '0006_checkin'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='checkin',
+            name='registration_id',
+            field=models.OneToOneField(db_constraint=False, on_delete=django.db.models.deletion.CASCADE, to='registrations.registration'),
+        ),
+        migrations.AlterField(
+            model_name='waitlistentry',
+            name='registration_id',
+            field=models.ForeignKey(blank=True, db_constraint=False, null=True, on_delete=django.db.models.deletion.SET_NULL, to='registrations.registration'),
+        ),
+    ]
@@ -1,12 +1,84 @@
-import uuid
-
 from django.db import models
 
+from core.ids import new_id
 from core.models import User
+from events.models import Event
 from tickets.models import Ticket
 
+def event_start_of_ticket(ticket_id):
+    return Ticket.objects.filter(pk=ticket_id).values_list('event_id__start_time', flat=True).get()
+
 # Create your models here.
 class Registration(models.Model):
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False, unique=True)
+    id = models.UUIDField(primary_key=True, default=new_id, editable=False, unique=True)
+    ticket_id = models.ForeignKey(Ticket, on_delete=models.CASCADE)
+    user_id = models.ForeignKey(User, on_delete=models.CASCADE)
+    # Salinan Event.start_time, dipakai sebagai kunci partisi (lihat manage_partitions)
+    event_start = models.DateTimeField(editable=False)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['user_id', 'id'], name='registration_user_idx'),
+        ]
+
+    def save(self, *args, **kwargs):
+        update_fields = kwargs.get('update_fields')
+        if update_fields is None or 'ticket_id' in update_fields:
+            self.event_start = event_start_of_ticket(self.ticket_id_id)
+            if update_fields is not None:
+                kwargs['update_fields'] = {*update_fields, 'event_start'}
+        super().save(*args, **kwargs)
+
+class WaitlistQueue(models.Model):
+    """
+    Per-ticket FIFO cursor. `tail` is the last position handed out and `head` the last
+    position served, so enqueueing and looking up a place in line never scan the entries.
+    """
+    ticket_id = models.OneToOneField(Ticket, on_delete=models.CASCADE, primary_key=True)
+    head = models.PositiveBigIntegerField(default=0)
+    tail = models.PositiveBigIntegerField(default=0)
+
+class WaitlistEntry(models.Model):
+    STATUS_WAITING = 'waiting'
+    STATUS_PROMOTED = 'promoted'
+    STATUS_CHOICES = [
+        (STATUS_WAITING, 'Waiting'),
+        (STATUS_PROMOTED, 'Promoted'),
+    ]
+
+    id = models.UUIDField(primary_key=True, default=new_id, editable=False, unique=True)
     ticket_id = models.ForeignKey(Ticket, on_delete=models.CASCADE)
-    user_id = models.ForeignKey(User, on_delete=models.CASCADE)
\ No newline at end of file
+    user_id = models.ForeignKey(User, on_delete=models.CASCADE)
+    position = models.PositiveBigIntegerField()
+    status = models.CharField(max_length=25, choices=STATUS_CHOICES, default=STATUS_WAITING)
+    # Tanpa constraint di database: registrasi dipartisi per event_start (manage_partitions) dan
+    # tabel berpartisi tidak bisa dirujuk lewat `id` saja; on_delete tetap dijalankan Django
+    registration_id = models.ForeignKey(
+        Registration, on_delete=models.SET_NULL, null=True, blank=True, db_constraint=False
+    )
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['ticket_id', 'status', 'position'], name='waitlist_ticket_queue_idx'),
+        ]
+        constraints = [
+            models.UniqueConstraint(
+                fields=['ticket_id', 'user_id'],
+                condition=models.Q(status='waiting'),
+                name='waitlist_unique_waiting_user',
+            ),
+        ]
+
+class CheckIn(models.Model):
+    """
+    A registration admitted at the venue. One row per registration: the unique
+    `registration_id` is the per-event set duplicate scans are checked against.
+    """
+    id = models.UUIDField(primary_key=True, default=new_id, editable=False, unique=True)
+    # Tanpa constraint di database, sama seperti WaitlistEntry.registration_id
+    registration_id = models.OneToOneField(Registration, on_delete=models.CASCADE, db_constraint=False)
+    event_id = models.ForeignKey(Event, on_delete=models.CASCADE)
+    gate = models.CharField(max_length=100, blank=True)
+    scanned_at = models.DateTimeField()
+    created_at = models.DateTimeField(auto_now_add=True)
@@ -1,13 +1,17 @@
+from django.conf import settings
 from rest_framework import serializers
 from rest_framework.reverse import reverse
 
+from core.fieldsets import SparseFieldsetMixin, SparseListSerializer
 from core.models import User
-from registrations.models import Registration
+from registrations.models import Registration, WaitlistEntry
+from registrations.waitlist import queue_position
 from tickets.models import Ticket
 
-class RegistrationSerializer(serializers.HyperlinkedModelSerializer):
+class RegistrationSerializer(SparseFieldsetMixin, serializers.HyperlinkedModelSerializer):
     user_id = serializers.PrimaryKeyRelatedField(queryset=User.objects.all())
-    ticket_id = serializers.PrimaryKeyRelatedField(queryset=Ticket.objects.all())
+    # Event yang sedang dihapus tidak menerima registrasi baru
+    ticket_id = serializers.PrimaryKeyRelatedField(queryset=Ticket.objects.filter(event_id__deleted_at__isnull=True))
     ticket = serializers.CharField(source='ticket_id.name', read_only=True)
     user = serializers.CharField(source='user_id.username', read_only=True)
     _links = serializers.SerializerMethodField()
@@ -15,6 +19,7 @@ class RegistrationSerializer(serializers.HyperlinkedModelSerializer):
     class Meta:
         model = Registration
         fields = ('id', 'ticket', 'user', 'user_id', 'ticket_id', '_links')
+        list_serializer_class = SparseListSerializer
 
     def get__links(self, obj):
         request = self.context.get('request')
@@ -43,4 +48,62 @@ class RegistrationSerializer(serializers.HyperlinkedModelSerializer):
                 "action": "DELETE",
                 "types": ["application/json"],
             }
-        ]
\ No newline at end of file
+        ]
+
+class UserRegistrationSerializer(RegistrationSerializer):
+    """
+    A user's own registration with the ticket and event details it belongs to.
+    """
+    ticket_price = serializers.IntegerField(source='ticket_id.price', read_only=True)
+    event_id = serializers.PrimaryKeyRelatedField(source='ticket_id.event_id', read_only=True)
+    event = serializers.CharField(source='ticket_id.event_id.name', read_only=True)
+    event_location = serializers.CharField(source='ticket_id.event_id.location', read_only=True)
+    event_start_time = serializers.DateTimeField(source='ticket_id.event_id.start_time', read_only=True)
+
+    class Meta(RegistrationSerializer.Meta):
+        fields = (
+            'id', 'ticket', 'ticket_id', 'ticket_price', 'event', 'event_id', 'event_location',
+            'event_start_time', '_links',
+        )
+
+class WaitlistEntrySerializer(serializers.HyperlinkedModelSerializer):
+    ticket_id = serializers.PrimaryKeyRelatedField(read_only=True)
+    user_id = serializers.PrimaryKeyRelatedField(read_only=True)
+    registration_id = serializers.PrimaryKeyRelatedField(read_only=True)
+    position = serializers.SerializerMethodField()
+    _links = serializers.SerializerMethodField()
+
+    class Meta:
+        model = WaitlistEntry
+        fields = ('id', 'ticket_id', 'user_id', 'status', 'position', 'registration_id', 'created_at', '_links')
+
+    def get_position(self, obj):
+        return queue_position(obj)
+
+    def get__links(self, obj):
+        request = self.context.get('request')
+        return [
+            {
+                "rel": "self",
+                "href": reverse('waitlist-detail', kwargs={'pk': obj.pk}, request=request),
+                "action": "GET",
+                "types": ["application/json"],
+            },
+            {
+                "rel": "self",
+                "href": reverse('waitlist-detail', kwargs={'pk': obj.pk}, request=request),
+                "action": "DELETE",
+                "types": ["application/json"],
+            }
+        ]
+
+class CheckInScanSerializer(serializers.Serializer):
+    token = serializers.CharField(max_length=200)
+    scanned_at = serializers.DateTimeField(required=False)
+    gate = serializers.CharField(max_length=100, required=False, allow_blank=True)
+
+class CheckInBatchSerializer(serializers.Serializer):
+    """
+    Scans a gate collected (possibly offline) for one event, synced in one request.
+    """
+    scans = CheckInScanSerializer(many=True, allow_empty=False, max_length=settings.CHECKIN_SCAN_LIMIT)
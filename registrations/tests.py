@@ -1,3 +1,134 @@
-from django.test import TestCase
+import uuid
+from datetime import timedelta
 
-# Create your tests here.
+from django.contrib.auth.models import Group
+from django.db import transaction
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from core.models import User
+from events.models import Event
+from registrations import checkin, waitlist
+from registrations.models import CheckIn, Registration, WaitlistEntry
+from tickets.models import Ticket
+
+
+class CheckInTokenTest(SimpleTestCase):
+    def test_token_verifies_offline_with_its_event_key_only(self):
+        registration = Registration(id=uuid.uuid4(), ticket_id_id=uuid.uuid4())
+        event_id, other_event_id = uuid.uuid4(), uuid.uuid4()
+        token = checkin.issue_token(registration, event_id)
+
+        self.assertEqual(
+            checkin.verify_token(token, checkin.event_key(event_id)), (registration.pk, registration.ticket_id_id)
+        )
+        self.assertIsNone(checkin.verify_token(token, checkin.event_key(other_event_id)))
+        tampered = token[:30] + ('A' if token[30] != 'A' else 'B') + token[31:]
+        self.assertIsNone(checkin.verify_token(tampered, checkin.event_key(event_id)))
+        self.assertIsNone(checkin.verify_token('not a token', checkin.event_key(event_id)))
+
+
+@override_settings(ALLOWED_HOSTS=['*'])
+class CheckInTest(TestCase):
+    def setUp(self):
+        now = timezone.now()
+        self.organizer = User.objects.create(username='organizer')
+        self.event = Event.objects.create(
+            name='Event', location='Jakarta', start_time=now, end_time=now + timedelta(hours=2),
+            category='music', organizer_id=self.organizer,
+        )
+        ticket = Ticket.objects.create(name='Ticket', price=50000, sales_start=now, sales_end=now, quota=10, event_id=self.event)
+        self.registrations = [Registration.objects.create(ticket_id=ticket, user_id=self.organizer) for _ in range(3)]
+        self.tokens = [checkin.issue_token(registration, self.event.pk) for registration in self.registrations]
+
+    def test_ingest_scans_admits_each_registration_once(self):
+        now = timezone.now()
+        first, second, revoked = self.tokens
+        self.registrations[2].delete()
+        scans = [
+            {'token': first, 'scanned_at': now, 'gate': 'A'},
+            {'token': first, 'scanned_at': now - timedelta(minutes=1), 'gate': 'B'},
+            {'token': 'not a token'},
+            {'token': revoked},
+            {'token': second},
+        ]
+        result = checkin.ingest_scans(self.event.pk, scans)
+        self.assertEqual(result, {'accepted': 2, 'invalid': [2], 'revoked': [3], 'duplicate': [0]})
+        # Dari dua scan di batch yang sama, yang paling awal yang dicatat
+        self.assertEqual(CheckIn.objects.get(registration_id=self.registrations[0]).gate, 'B')
+
+        again = checkin.ingest_scans(self.event.pk, [{'token': second}])
+        self.assertEqual((again['accepted'], again['duplicate']), (0, [0]))
+        self.assertEqual(CheckIn.objects.count(), 2)
+
+    def test_only_the_events_organizer_gets_its_gate_key(self):
+        other = User.objects.create(username='other')
+        other.groups.add(Group.objects.create(name='organizer'))
+        self.organizer.groups.add(Group.objects.get(name='organizer'))
+        client = APIClient()
+        for user, expected in ((other, 403), (self.organizer, 200)):
+            client.force_authenticate(user)
+            self.assertEqual(client.get(f'/api/events/{self.event.pk}/check-in/key/').status_code, expected)
+
+
+class WaitlistTest(TestCase):
+    def setUp(self):
+        now = timezone.now()
+        organizer = User.objects.create(username='organizer')
+        event = Event.objects.create(
+            name='Event', location='Jakarta', start_time=now, end_time=now + timedelta(hours=2),
+            category='music', organizer_id=organizer,
+        )
+        self.ticket = Ticket.objects.create(name='Ticket', price=50000, sales_start=now, sales_end=now, quota=2, event_id=event)
+        self.holder = Registration.objects.create(ticket_id=self.ticket, user_id=organizer)
+        self.users = [User.objects.create(username=f'user{i}') for i in range(3)]
+        self.entries = [waitlist.enqueue(self.ticket, user) for user in self.users]
+
+    def test_enqueue_keeps_one_waiting_entry_per_user(self):
+        self.assertEqual(waitlist.enqueue(self.ticket, self.users[0]), self.entries[0])
+        self.assertEqual([waitlist.queue_position(entry) for entry in self.entries], [1, 2, 3])
+
+    def test_promotion_fills_free_seats_in_queue_order(self):
+        self.assertEqual(waitlist.promote_waitlist(self.ticket.pk, batch_size=1), 1)
+        self.assertEqual(waitlist.promote_waitlist(self.ticket.pk), 0)
+        self.assertEqual(Registration.objects.filter(ticket_id=self.ticket).count(), self.ticket.quota)
+        with transaction.atomic():
+            self.assertTrue(waitlist.is_sold_out(self.ticket))
+
+        self.holder.delete()
+        self.assertEqual(waitlist.promote_waitlist(self.ticket.pk), 1)
+        statuses = WaitlistEntry.objects.filter(ticket_id=self.ticket).order_by('position').values_list('status', flat=True)
+        self.assertEqual(
+            list(statuses), [WaitlistEntry.STATUS_PROMOTED, WaitlistEntry.STATUS_PROMOTED, WaitlistEntry.STATUS_WAITING],
+        )
+        promoted = Registration.objects.filter(ticket_id=self.ticket).values_list('user_id', flat=True)
+        self.assertEqual(set(promoted), {self.users[0].pk, self.users[1].pk})
+        self.assertEqual(waitlist.queue_position(WaitlistEntry.objects.get(pk=self.entries[2].pk)), 1)
+
+
+@override_settings(ALLOWED_HOSTS=['*'])
+class UserRegistrationListTest(TestCase):
+    def test_pages_only_the_users_registrations_once_each(self):
+        now = timezone.now()
+        user, other = User.objects.create(username='user'), User.objects.create(username='other')
+        event = Event.objects.create(
+            name='Event', location='Jakarta', start_time=now, end_time=now + timedelta(hours=2),
+            category='music', organizer_id=other,
+        )
+        ticket = Ticket.objects.create(name='Ticket', price=50000, sales_start=now, sales_end=now, quota=10, event_id=event)
+        # Id uuid4 acak seperti baris lama: urutan halaman mengikuti id, bukan waktu pembelian
+        own = [Registration.objects.create(id=uuid.uuid4(), ticket_id=ticket, user_id=user) for _ in range(5)]
+        Registration.objects.create(ticket_id=ticket, user_id=other)
+
+        client = APIClient()
+        client.force_authenticate(user)
+        with self.assertNumQueries(1):
+            response = client.get('/api/registrations/me/', {'limit': 2})
+        self.assertEqual((response.data['registrations'][0]['event'], response.data['registrations'][0]['ticket_price']), ('Event', 50000))
+
+        seen = [registration['id'] for registration in response.data['registrations']]
+        while response.data['next']:
+            response = client.get(response.data['next'])
+            seen += [registration['id'] for registration in response.data['registrations']]
+        self.assertEqual(seen, sorted(str(registration.pk) for registration in own))
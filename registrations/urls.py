@@ -3,5 +3,11 @@ from . import views
 
 urlpatterns = [
     path('registrations/', views.RegistrationListCreateView.as_view(), name='registration-list'),
+    path('registrations/me/', views.UserRegistrationListView.as_view(), name='registration-me'),
+    path('registrations/batch/', views.RegistrationBatchView.as_view(), name='registration-batch'),
     path('registrations/<uuid:pk>/', views.RegistrationDetailView.as_view(), name='registration-detail'),
+    path('registrations/waitlist/<uuid:pk>/', views.WaitlistEntryDetailView.as_view(), name='waitlist-detail'),
+    path('registrations/<uuid:pk>/check-in-token/', views.RegistrationCheckInTokenView.as_view(), name='registration-check-in-token'),
+    path('events/<uuid:pk>/check-in/key/', views.EventCheckInKeyView.as_view(), name='event-check-in-key'),
+    path('events/<uuid:pk>/check-in/', views.EventCheckInView.as_view(), name='event-check-in'),
 ]
\ No newline at end of file
@@ -1,46 +1,107 @@
+from django.db import transaction
 from django.http import Http404
 from django.shortcuts import render
 from rest_framework import status
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.views import APIView
-from rest_framework_simplejwt.authentication import JWTAuthentication
 
-from core.permissions import IsAdminOrSuperUser
-from registrations.models import Registration
-from registrations.serializers import RegistrationSerializer
+from archives.archiver import get_archived
+from core.authentication import CachedJWTAuthentication
+from core.batch import batch_response
+from core.fieldsets import get_fieldset
+from core.pagination import KeysetPagination
+from core.permissions import (
+    IsAdminOrOrganizerOrSuperUser, IsAdminOrSuperUser, IsEventOrganizerOrAdminOrSuperUser, IsRegistrantOrAdminOrSuperUser,
+)
+from core.throttling import ScopedTokenBucketThrottle
+from events.models import Event
+from registrations import checkin, waitlist
+from registrations.models import Registration, WaitlistEntry
+from registrations.serializers import (
+    CheckInBatchSerializer, RegistrationSerializer, UserRegistrationSerializer, WaitlistEntrySerializer,
+)
+from tickets import sales
+from tickets.models import Ticket
 
 # Create your views here.
 class RegistrationListCreateView(APIView):
-    authentication_classes = [JWTAuthentication]
+    authentication_classes = [CachedJWTAuthentication]
 
     def get_permissions(self):
         if self.request.method == 'POST':
             return [IsAuthenticated(), IsAdminOrSuperUser()]
         return [IsAuthenticated()]
 
+    def get_throttles(self):
+        if self.request.method == 'POST':
+            return super().get_throttles() + [ScopedTokenBucketThrottle('registrations')]
+        return super().get_throttles()
+
     def get(self, request):
         registrations = Registration.objects.all().order_by('id')[:10]
-        serializer = RegistrationSerializer(registrations, many=True)
+        serializer = RegistrationSerializer(registrations, many=True, **get_fieldset(request))
         return Response({'registrations': serializer.data})
 
     def post(self, request):
+        # Dicek sebelum serializer agar request di luar jadwal penjualan tidak menyentuh DB.
+        # Token antrian terikat pada pembeli (user_id di body), bukan admin yang memanggil
+        sales.check_purchase(
+            request.data.get('ticket_id'),
+            request.data.get('user_id'),
+            request.headers.get('X-Admission-Token'),
+        )
         serializer = RegistrationSerializer(data=request.data)
         if serializer.is_valid():
-            serializer.save()
+            ticket = serializer.validated_data['ticket_id']
+            with transaction.atomic():
+                try:
+                    sold_out = waitlist.is_sold_out(ticket)
+                except Ticket.DoesNotExist:
+                    # Event-nya ditandai terhapus setelah serializer memvalidasi tiket
+                    message = serializer.fields['ticket_id'].error_messages['does_not_exist']
+                    return Response(
+                        {'ticket_id': [message.format(pk_value=ticket.pk)]}, status=status.HTTP_400_BAD_REQUEST
+                    )
+                if sold_out:
+                    # Tiket habis: masukkan ke waitlist, klien cukup polling status entry-nya
+                    entry = waitlist.enqueue(ticket, serializer.validated_data['user_id'])
+                    return Response(WaitlistEntrySerializer(entry).data, status=status.HTTP_202_ACCEPTED)
+                serializer.save()
             return Response(serializer.data, status=status.HTTP_201_CREATED)
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
+class UserRegistrationListView(APIView):
+    """
+    The registrations of the signed-in user with their ticket and event, joined in
+    the same query. Pages follow the id (see KeysetPagination), not the purchase time.
+    """
+    authentication_classes = [CachedJWTAuthentication]
+
+    def get_permissions(self):
+        return [IsAuthenticated()]
+
+    def get(self, request):
+        # Memakai index (user_id, id): satu halaman tetap murah berapa pun isi tabelnya
+        registrations = Registration.objects.filter(user_id=request.user.pk).select_related('ticket_id__event_id')
+        paginator = KeysetPagination()
+        page = paginator.paginate_queryset(registrations, request, view=self)
+        serializer = UserRegistrationSerializer(page, many=True, **get_fieldset(request))
+        return Response({'registrations': serializer.data, **paginator.get_page_links()})
+
 class RegistrationDetailView(APIView):
-    def get_object(self, pk):
+    def get_object(self, pk, archived=False):
         try:
             registration = Registration.objects.get(pk=pk)
-            self.check_object_permissions(self.request, registration)
-            return registration
         except Registration.DoesNotExist:
-            raise Http404
+            # Data yang sudah diarsipkan tetap bisa dibaca (read-only)
+            registration = get_archived(Registration, pk) if archived else None
+            if registration is None:
+                raise Http404
+        self.check_object_permissions(self.request, registration)
+        return registration
 
-    authentication_classes = [JWTAuthentication]
+    authentication_classes = [CachedJWTAuthentication]
 
     def get_permissions(self):
         if self.request.method in ['PUT', 'DELETE']:
@@ -48,8 +109,8 @@ class RegistrationDetailView(APIView):
         return [IsAuthenticated()]
 
     def get(self, request, pk):
-        registration = self.get_object(pk)
-        serializer = RegistrationSerializer(registration)
+        registration = self.get_object(pk, archived=True)
+        serializer = RegistrationSerializer(registration, **get_fieldset(request))
         return Response(serializer.data)
 
     def put(self, request, pk):
@@ -61,6 +122,112 @@ class RegistrationDetailView(APIView):
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
     def delete(self, request, pk):
-        ticket = self.get_object(pk)
-        ticket.delete()
-        return Response(status=status.HTTP_204_NO_CONTENT)
\ No newline at end of file
+        registration = self.get_object(pk)
+        registration.delete()
+        waitlist.schedule_promotion(registration.ticket_id_id)
+        return Response(status=status.HTTP_204_NO_CONTENT)
+
+class RegistrationBatchView(APIView):
+    """
+    Many registrations by id in one call: `GET ?ids=a,b,c` or `POST {"ids": [...]}`, up to
+    BATCH_GET_LIMIT ids. Results follow the order of the ids; unknown ids are
+    listed under `missing`.
+    """
+    authentication_classes = [CachedJWTAuthentication]
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request):
+        return batch_response(
+            self, request, Registration.objects.filter(ticket_id__event_id__deleted_at__isnull=True),
+            RegistrationSerializer, 'registrations',
+        )
+
+    def post(self, request):
+        return batch_response(
+            self, request, Registration.objects.filter(ticket_id__event_id__deleted_at__isnull=True),
+            RegistrationSerializer, 'registrations',
+        )
+
+class WaitlistEntryDetailView(APIView):
+    def get_object(self, pk):
+        try:
+            entry = WaitlistEntry.objects.select_related('ticket_id__waitlistqueue').get(pk=pk)
+            self.check_object_permissions(self.request, entry)
+            return entry
+        except WaitlistEntry.DoesNotExist:
+            raise Http404
+
+    authentication_classes = [CachedJWTAuthentication]
+    permission_classes = [IsAuthenticated, IsRegistrantOrAdminOrSuperUser]
+
+    def get(self, request, pk):
+        entry = self.get_object(pk)
+        serializer = WaitlistEntrySerializer(entry)
+        return Response(serializer.data)
+
+    def delete(self, request, pk):
+        entry = self.get_object(pk)
+        if entry.status != WaitlistEntry.STATUS_WAITING:
+            return Response({'detail': 'Entry has already been promoted.'}, status=status.HTTP_409_CONFLICT)
+        entry.delete()
+        return Response(status=status.HTTP_204_NO_CONTENT)
+class RegistrationCheckInTokenView(APIView):
+    """
+    The signed token the registrant shows at the gate (e.g. as a QR code).
+    """
+    authentication_classes = [CachedJWTAuthentication]
+    permission_classes = [IsAuthenticated, IsRegistrantOrAdminOrSuperUser]
+
+    def get(self, request, pk):
+        try:
+            registration = Registration.objects.select_related('ticket_id').get(pk=pk)
+        except Registration.DoesNotExist:
+            raise Http404
+        self.check_object_permissions(request, registration)
+        event_id = registration.ticket_id.event_id_id
+        return Response({
+            'registration_id': registration.pk,
+            'event_id': event_id,
+            'token': checkin.issue_token(registration, event_id),
+        })
+
+def get_event_for_organizer(view, pk):
+    # Kunci gate sekaligus kunci penanda token: hanya organizer event itu (atau admin) yang boleh
+    try:
+        event = Event.objects.only('pk', 'organizer_id').get(pk=pk)
+    except Event.DoesNotExist:
+        raise Http404
+    view.check_object_permissions(view.request, event)
+    return event
+
+class EventCheckInKeyView(APIView):
+    """
+    The key gates download before doors open to verify tokens offline. Only the
+    organizer of the event, admins and superusers may fetch it.
+    """
+    authentication_classes = [CachedJWTAuthentication]
+    permission_classes = [IsAuthenticated, IsAdminOrOrganizerOrSuperUser, IsEventOrganizerOrAdminOrSuperUser]
+
+    def get(self, request, pk):
+        get_event_for_organizer(self, pk)
+        return Response({
+            'event_id': pk,
+            'algorithm': 'HMAC-SHA256-128',
+            'version': checkin.TOKEN_VERSION,
+            'key': checkin.encoded_event_key(pk),
+        })
+
+class EventCheckInView(APIView):
+    """
+    Batch sync of gate scans. The response lists, by index into `scans`, which
+    tokens were invalid, revoked or duplicates; all others were admitted.
+    """
+    authentication_classes = [CachedJWTAuthentication]
+    permission_classes = [IsAuthenticated, IsAdminOrOrganizerOrSuperUser, IsEventOrganizerOrAdminOrSuperUser]
+
+    def post(self, request, pk):
+        get_event_for_organizer(self, pk)
+        serializer = CheckInBatchSerializer(data=request.data)
+        if not serializer.is_valid():
+            return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+        return Response(checkin.ingest_scans(pk, serializer.validated_data['scans']))
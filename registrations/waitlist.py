@@ -0,0 +1,112 @@
+from django.conf import settings
+from django.db import transaction
+
+from core.tasks import run_in_background
+from events.stats import forget_event_stats
+from registrations.models import Registration, WaitlistEntry, WaitlistQueue
+from tickets.models import Ticket
+
+
+def _lock_ticket(ticket_id):
+    """
+    Locks the ticket and its event and returns the ticket's quota and the event start.
+    Tickets of events being deleted raise Ticket.DoesNotExist.
+    """
+    # Baris event ikut dikunci: Event.save menyalin start_time ke event_start di transaksinya
+    # sendiri, jadi selama kunci ini dipegang event_start registrasinya tidak berubah
+    ticket = (
+        Ticket.objects.select_for_update(of=('self', 'event_id'))
+        .select_related('event_id')
+        .only('quota', 'event_id__start_time')
+        .filter(event_id__deleted_at__isnull=True)
+        .get(pk=ticket_id)
+    )
+    return ticket.quota, ticket.event_id.start_time
+
+
+def _seats_taken(ticket_id, event_start):
+    # event_start dari _lock_ticket: Postgres hanya membaca partisi bulan event ini
+    return Registration.objects.filter(ticket_id=ticket_id, event_start=event_start).count()
+
+
+def is_sold_out(ticket):
+    """
+    Returns True when every seat of `ticket` is taken. Must be called inside a
+    transaction: the ticket and event rows are locked so concurrent purchases and
+    reschedules are serialized.
+    """
+    quota, event_start = _lock_ticket(ticket.pk)
+    return _seats_taken(ticket.pk, event_start) >= quota
+
+
+def enqueue(ticket, user):
+    """
+    Appends `user` to the waitlist of `ticket`, or returns their existing waiting entry.
+    """
+    with transaction.atomic():
+        queue, _ = WaitlistQueue.objects.select_for_update().get_or_create(ticket_id=ticket)
+        entry = WaitlistEntry.objects.filter(
+            ticket_id=ticket, user_id=user, status=WaitlistEntry.STATUS_WAITING
+        ).first()
+        if entry is None:
+            queue.tail += 1
+            queue.save(update_fields=['tail'])
+            entry = WaitlistEntry.objects.create(ticket_id=ticket, user_id=user, position=queue.tail)
+        ticket.waitlistqueue = queue
+        return entry
+
+
+def queue_position(entry):
+    """
+    1-based place in line of a waiting entry. Entries that left the queue early are
+    still counted, so this is an upper bound rather than an exact rank.
+    """
+    if entry.status != WaitlistEntry.STATUS_WAITING:
+        return None
+    return entry.position - entry.ticket_id.waitlistqueue.head
+
+
+def promote_waitlist(ticket_id, batch_size=None):
+    """
+    Turns waiting entries of a ticket into registrations, oldest first, while seats
+    are free. Each batch runs in its own short transaction. Returns the number promoted.
+    """
+    batch_size = batch_size or settings.WAITLIST_PROMOTION_BATCH_SIZE
+    promoted = 0
+    while True:
+        with transaction.atomic():
+            try:
+                quota, event_start = _lock_ticket(ticket_id)
+            except Ticket.DoesNotExist:
+                break
+            free = quota - _seats_taken(ticket_id, event_start)
+            if free <= 0:
+                break
+            entries = list(
+                WaitlistEntry.objects
+                .filter(ticket_id=ticket_id, status=WaitlistEntry.STATUS_WAITING)
+                .order_by('position')[:min(free, batch_size)]
+            )
+            if not entries:
+                break
+            registrations = Registration.objects.bulk_create([
+                Registration(ticket_id_id=ticket_id, user_id_id=entry.user_id_id, event_start=event_start)
+                for entry in entries
+            ])
+            for entry, registration in zip(entries, registrations):
+                entry.status = WaitlistEntry.STATUS_PROMOTED
+                entry.registration_id = registration
+            WaitlistEntry.objects.bulk_update(entries, ['status', 'registration_id'])
+            WaitlistQueue.objects.filter(ticket_id=ticket_id).update(head=entries[-1].position)
+        promoted += len(entries)
+    if promoted:
+        # bulk_create tidak mengirim post_save
+        forget_event_stats(Ticket.objects.filter(pk=ticket_id).values_list('event_id', flat=True))
+    return promoted
+
+
+def schedule_promotion(ticket_id):
+    """
+    Promotes the waitlist of a ticket in the background after the current request commits.
+    """
+    run_in_background(promote_waitlist, ticket_id)
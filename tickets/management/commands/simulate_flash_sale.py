@@ -0,0 +1,89 @@
+import heapq
+import random
+import uuid
+from collections import Counter
+
+from django.core.management.base import BaseCommand
+from django.test import override_settings
+
+from tickets import sales
+
+
+class Command(BaseCommand):
+    help = (
+        'Simulates a flash-sale spike on a virtual clock and compares DB load per second '
+        'with and without the sales gate / waiting room. Runs entirely in memory.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--clients', type=int, default=5000)
+        parser.add_argument('--rate', type=float, default=100, help='Admissions per second.')
+        parser.add_argument('--spread', type=float, default=3, help='Std. deviation of arrivals around the opening, in seconds.')
+        parser.add_argument('--db-capacity', type=int, default=200, help='Writes per second the DB absorbs before requests fail.')
+        parser.add_argument('--retry', type=float, default=1, help='Client retry interval without the gate, in seconds.')
+        parser.add_argument('--seed', type=int, default=788)
+
+    def handle(self, *args, **options):
+        rng = random.Random(options['seed'])
+        opens_at = 1_000_000.0
+        window = (opens_at, opens_at + 86400)
+        arrivals = [opens_at + rng.gauss(0, options['spread']) for _ in range(options['clients'])]
+
+        ungated = self.simulate_ungated(arrivals, opens_at, options['db_capacity'], options['retry'])
+        caches = {'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+            'LOCATION': 'flash-sale-simulation',
+            'OPTIONS': {'MAX_ENTRIES': options['clients'] * 4},
+        }}
+        with override_settings(CACHES=caches, TICKET_ADMISSION_RATE=options['rate']):
+            gate_calls, gated = self.simulate_gated(arrivals, window)
+
+        first = int(min(arrivals) - opens_at)
+        last = int(max(max(ungated), max(gated)) - opens_at)
+        self.stdout.write(f'{"t (s)":>6} {"no gate: DB req":>16} {"gate: cache req":>16} {"gate: DB writes":>16}')
+        for second in range(first, last + 1):
+            tick = int(opens_at) + second
+            self.stdout.write(f'{second:>6} {ungated[tick]:>16} {gate_calls[tick]:>16} {gated[tick]:>16}')
+        self.stdout.write(
+            f'Peak DB requests/s without gate: {max(ungated.values())}, '
+            f'with gate: {max(gated.values())} (rate {options["rate"]:g}/s)'
+        )
+
+    def simulate_ungated(self, arrivals, opens_at, capacity, retry):
+        """
+        Every attempt goes to the registration endpoint and costs a DB round trip. Clients
+        retry on failure, so early arrivals and overload turn into a retry storm.
+        """
+        db_requests = Counter()
+        served = Counter()
+        attempts = [(at, client) for client, at in enumerate(arrivals)]
+        heapq.heapify(attempts)
+        while attempts:
+            at, client = heapq.heappop(attempts)
+            tick = int(at)
+            db_requests[tick] += 1
+            if at >= opens_at and served[tick] < capacity:
+                served[tick] += 1
+                continue
+            heapq.heappush(attempts, (at + retry, client))
+        return db_requests
+
+    def simulate_gated(self, arrivals, window):
+        """
+        Clients ask the waiting room for an admission token (cache only) and honour
+        Retry-After; only admitted clients issue the registration write.
+        """
+        ticket_id = uuid.uuid4()
+        gate_calls = Counter()
+        writes = Counter()
+        attempts = [(at, client) for client, at in enumerate(arrivals)]
+        heapq.heapify(attempts)
+        while attempts:
+            at, client = heapq.heappop(attempts)
+            gate_calls[int(at)] += 1
+            _, wait, token = sales.request_admission(ticket_id, client, window, now=at)
+            if token is None:
+                heapq.heappush(attempts, (at + wait, client))
+                continue
+            writes[int(at)] += 1
+        return gate_calls, writes
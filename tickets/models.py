@@ -1,11 +1,11 @@
 from django.db import models
-import uuid
 
+from core.ids import new_id
 from events.models import Event
 
 # Create your models here.
 class Ticket(models.Model):
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False, unique=True)
+    id = models.UUIDField(primary_key=True, default=new_id, editable=False, unique=True)
     name = models.CharField(max_length=100)
     price = models.PositiveIntegerField(default=0)
     sales_start = models.DateTimeField(blank=True)
@@ -0,0 +1,148 @@
+import math
+import time
+import uuid
+
+from django.conf import settings
+from django.core import signing
+from django.core.cache import cache
+from rest_framework import status
+from rest_framework.exceptions import APIException
+
+from tickets.models import Ticket
+
+ADMISSION_SALT = 'tickets.admission'
+
+SALES_BEFORE = 'before'
+SALES_OPEN = 'open'
+SALES_CLOSED = 'closed'
+
+
+class SalesNotStarted(APIException):
+    status_code = status.HTTP_425_TOO_EARLY
+    default_detail = 'Ticket sales have not started yet.'
+    default_code = 'sales_not_started'
+
+    def __init__(self, wait):
+        super().__init__()
+        self.wait = wait
+
+
+class SalesClosed(APIException):
+    status_code = status.HTTP_403_FORBIDDEN
+    default_detail = 'Ticket sales are closed.'
+    default_code = 'sales_closed'
+
+
+class AdmissionRequired(APIException):
+    status_code = status.HTTP_403_FORBIDDEN
+    default_detail = 'A valid admission token is required to buy this ticket.'
+    default_code = 'admission_required'
+
+
+def _window_key(ticket_id):
+    return f'ticket-sales-window:{ticket_id}'
+
+
+def get_sales_window(ticket_id):
+    """
+    Returns `(sales_start, sales_end)` of a ticket as timestamps, or None if it does
+    not exist. The window is served from the cache so the gate rarely touches the DB.
+    """
+    window = cache.get(_window_key(ticket_id))
+    if window is None:
+        row = Ticket.objects.filter(pk=ticket_id).values_list('sales_start', 'sales_end').first()
+        window = (row[0].timestamp(), row[1].timestamp()) if row else ()
+        cache.set(_window_key(ticket_id), window, settings.TICKET_SALES_WINDOW_CACHE_TTL)
+    return window or None
+
+
+def forget_sales_window(ticket_id):
+    cache.delete(_window_key(ticket_id))
+
+
+def sales_state(window, now):
+    start, end = window
+    if now < start:
+        return SALES_BEFORE
+    if now >= end:
+        return SALES_CLOSED
+    return SALES_OPEN
+
+
+def admission_enabled():
+    return settings.TICKET_ADMISSION_RATE > 0
+
+
+def request_admission(ticket_id, user_id, window, now=None):
+    """
+    Virtual waiting room. Every user gets a stable FIFO number per ticket, and number
+    `n` is admitted `(n - 1) / TICKET_ADMISSION_RATE` seconds after sales open, so
+    admissions reach the write path at a flat rate however large the spike.
+
+    Returns `(position, wait, token)`; `token` is None while the user still has to wait
+    `wait` more seconds.
+    """
+    now = time.time() if now is None else now
+    state = sales_state(window, now)
+    if state == SALES_CLOSED:
+        raise SalesClosed()
+
+    user_key = f'ticket-queue:{ticket_id}:{user_id}'
+    position = cache.get(user_key)
+    if position is None:
+        counter_key = f'ticket-queue:{ticket_id}'
+        timeout = max(int(window[1] - now), 1)
+        cache.add(counter_key, 0, timeout)
+        position = cache.incr(counter_key)
+        if not cache.add(user_key, position, timeout):
+            position = cache.get(user_key, position)
+
+    admit_at = window[0]
+    if admission_enabled():
+        admit_at += (position - 1) / settings.TICKET_ADMISSION_RATE
+    if now < admit_at:
+        return position, max(round(admit_at - now, 3), 0.001), None
+
+    token = signing.dumps([str(ticket_id), str(user_id)], salt=ADMISSION_SALT)
+    return position, 0, token
+
+
+def check_purchase(ticket_id, user_id, token, now=None):
+    """
+    Cheap pre-check for the registration write path, answered from the cache only.
+    Raises when sales are not open or, with the waiting room on, when the caller
+    holds no valid, unused admission token for the ticket and `user_id`, the user
+    the seat is bought for. Unknown or malformed ticket ids are left to the serializer.
+    """
+    try:
+        ticket_id = uuid.UUID(str(ticket_id))
+    except ValueError:
+        return
+    window = get_sales_window(ticket_id)
+    if window is None:
+        return
+
+    now = time.time() if now is None else now
+    state = sales_state(window, now)
+    if state == SALES_BEFORE:
+        raise SalesNotStarted(wait=math.ceil(window[0] - now))
+    if state == SALES_CLOSED:
+        raise SalesClosed()
+
+    if not admission_enabled():
+        return
+    try:
+        admitted_ticket, admitted_user = signing.loads(
+            token or '', salt=ADMISSION_SALT, max_age=settings.TICKET_ADMISSION_TOKEN_TTL
+        )
+    except signing.BadSignature:
+        raise AdmissionRequired()
+    try:
+        user_id = uuid.UUID(str(user_id))
+    except ValueError:
+        raise AdmissionRequired()
+    if admitted_ticket != str(ticket_id) or admitted_user != str(user_id):
+        raise AdmissionRequired()
+    # Token sekali pakai
+    if not cache.add(f'ticket-admission-used:{token}', True, settings.TICKET_ADMISSION_TOKEN_TTL):
+        raise AdmissionRequired()
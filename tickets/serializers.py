@@ -1,17 +1,19 @@
 from rest_framework import serializers
 from rest_framework.reverse import reverse
 
+from core.fieldsets import SparseFieldsetMixin, SparseListSerializer
 from events.models import Event
 from tickets.models import Ticket
 
-class TicketSerializer(serializers.HyperlinkedModelSerializer):
+class TicketSerializer(SparseFieldsetMixin, serializers.HyperlinkedModelSerializer):
     event = serializers.CharField(source='event_id.name', read_only=True)
-    event_id = serializers.PrimaryKeyRelatedField(queryset=Event.objects.all(), write_only=True)
+    event_id = serializers.PrimaryKeyRelatedField(queryset=Event.objects.filter(deleted_at__isnull=True), write_only=True)
     _links = serializers.SerializerMethodField()
 
     class Meta:
         model = Ticket
         fields = ['id', 'name', 'price', 'sales_start', 'sales_end', 'quota', 'event', 'event_id', '_links']
+        list_serializer_class = SparseListSerializer
 
     def get__links(self, obj):
         request = self.context.get('request')
@@ -1,3 +1,31 @@
-from django.test import TestCase
+from datetime import timedelta
 
-# Create your tests here.
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from core.models import User
+from events.models import Event
+from tickets import sales
+from tickets.models import Ticket
+
+
+@override_settings(TICKET_ADMISSION_RATE=10)
+class AdmissionTokenTest(TestCase):
+    def test_token_admits_only_the_user_it_was_issued_to(self):
+        now = timezone.now()
+        buyer, other = User.objects.create(username='buyer'), User.objects.create(username='other')
+        event = Event.objects.create(
+            name='Event', location='Jakarta', start_time=now, end_time=now, category='music', organizer_id=buyer,
+        )
+        ticket = Ticket.objects.create(
+            name='Ticket', price=50000, sales_start=now - timedelta(minutes=1), sales_end=now + timedelta(hours=1),
+            quota=10, event_id=event,
+        )
+        position, wait, token = sales.request_admission(ticket.pk, buyer.pk, sales.get_sales_window(ticket.pk))
+        self.assertIsNotNone(token)
+
+        with self.assertRaises(sales.AdmissionRequired):
+            sales.check_purchase(ticket.pk, other.pk, token)
+        sales.check_purchase(ticket.pk, str(buyer.pk).upper(), token)
+        with self.assertRaises(sales.AdmissionRequired):
+            sales.check_purchase(ticket.pk, buyer.pk, token)
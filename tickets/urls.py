@@ -3,5 +3,7 @@ from . import views
 
 urlpatterns = [
     path('tickets/', views.TicketListCreateView.as_view(), name='ticket-list'),
+    path('tickets/batch/', views.TicketBatchView.as_view(), name='ticket-batch'),
     path('tickets/<uuid:pk>/', views.TicketDetailView.as_view(), name='ticket-detail'),
+    path('tickets/<uuid:pk>/admission/', views.TicketAdmissionView.as_view(), name='ticket-admission'),
 ]
\ No newline at end of file
@@ -1,18 +1,26 @@
+import math
+
+from django.conf import settings
 from django.http import Http404
 from django.shortcuts import render
 from rest_framework import status
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.views import APIView
-from rest_framework_simplejwt.authentication import JWTAuthentication
 from rest_framework.response import Response
 
+from archives.archiver import get_archived
+from core.authentication import CachedJWTAuthentication
+from core.batch import batch_response
+from core.fieldsets import get_fieldset
 from core.permissions import IsAdminOrSuperUser
+from registrations.waitlist import schedule_promotion
+from tickets import sales
 from tickets.models import Ticket
 from tickets.serializers import TicketSerializer
 
 # Create your views here.
 class TicketListCreateView(APIView):
-    authentication_classes = [JWTAuthentication]
+    authentication_classes = [CachedJWTAuthentication]
 
     def get_permissions(self):
         if self.request.method == 'POST':
@@ -21,26 +29,30 @@ class TicketListCreateView(APIView):
 
     def get(self, request):
         tickets = Ticket.objects.all().order_by('name')[:10]
-        serializer = TicketSerializer(tickets, many=True)
+        serializer = TicketSerializer(tickets, many=True, **get_fieldset(request))
         return Response({'tickets': serializer.data})
 
     def post(self, request):
         serializer = TicketSerializer(data=request.data)
         if serializer.is_valid():
-            serializer.save()
+            ticket = serializer.save()
+            sales.forget_sales_window(ticket.pk)
             return Response(serializer.data, status=status.HTTP_201_CREATED)
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
 class TicketDetailView(APIView):
-    def get_object(self, pk):
+    def get_object(self, pk, archived=False):
         try:
             ticket = Ticket.objects.get(pk=pk)
-            self.check_object_permissions(self.request, ticket)
-            return ticket
         except Ticket.DoesNotExist:
-            raise Http404
+            # Data yang sudah diarsipkan tetap bisa dibaca (read-only)
+            ticket = get_archived(Ticket, pk) if archived else None
+            if ticket is None:
+                raise Http404
+        self.check_object_permissions(self.request, ticket)
+        return ticket
 
-    authentication_classes = [JWTAuthentication]
+    authentication_classes = [CachedJWTAuthentication]
 
     def get_permissions(self):
         if self.request.method in ['PUT', 'DELETE']:
@@ -48,8 +60,8 @@ class TicketDetailView(APIView):
         return [IsAuthenticated()]
 
     def get(self, request, pk):
-        ticket = self.get_object(pk)
-        serializer = TicketSerializer(ticket)
+        ticket = self.get_object(pk, archived=True)
+        serializer = TicketSerializer(ticket, **get_fieldset(request))
         return Response(serializer.data)
 
     def put(self, request, pk):
@@ -57,10 +69,50 @@ class TicketDetailView(APIView):
         serializer = TicketSerializer(ticket, data=request.data)
         if serializer.is_valid():
             serializer.save()
+            sales.forget_sales_window(ticket.pk)
+            # Quota bisa saja dinaikkan, beri kursi baru ke antrian waitlist
+            schedule_promotion(ticket.pk)
             return Response(serializer.data)
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
     def delete(self, request, pk):
         ticket = self.get_object(pk)
         ticket.delete()
+        sales.forget_sales_window(pk)
         return Response(status=status.HTTP_204_NO_CONTENT)
+
+class TicketBatchView(APIView):
+    """
+    Many tickets by id in one call: `GET ?ids=a,b,c` or `POST {"ids": [...]}`, up to
+    BATCH_GET_LIMIT ids. Results follow the order of the ids; unknown ids are
+    listed under `missing`.
+    """
+    authentication_classes = [CachedJWTAuthentication]
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request):
+        return batch_response(self, request, Ticket.objects.filter(event_id__deleted_at__isnull=True), TicketSerializer, 'tickets')
+
+    def post(self, request):
+        return batch_response(self, request, Ticket.objects.filter(event_id__deleted_at__isnull=True), TicketSerializer, 'tickets')
+
+class TicketAdmissionView(APIView):
+    authentication_classes = [CachedJWTAuthentication]
+    permission_classes = [IsAuthenticated]
+
+    def post(self, request, pk):
+        window = sales.get_sales_window(pk)
+        if window is None:
+            raise Http404
+        position, wait, token = sales.request_admission(pk, request.user.pk, window)
+        if token is None:
+            return Response(
+                {'position': position, 'retry_after': wait},
+                status=status.HTTP_202_ACCEPTED,
+                headers={'Retry-After': str(math.ceil(wait))},
+            )
+        return Response({
+            'position': position,
+            'admission_token': token,
+            'expires_in': settings.TICKET_ADMISSION_TOKEN_TTL,
+        })